@@ -1,35 +1,141 @@
 import gradio as gr
 import sys
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from trimly import Trimly, __version__
+from trimly import Trimly, SchedulerFullError, CancelToken, __version__
 
+_trimly = None
+_trimly_lock = threading.Lock()
 
-def trim_audio(audio_file, threshold, min_silence):
+
+def get_trimly():
+   # One long-lived instance shared by every request; FFmpeg is probed only on first use
+   global _trimly
+   with _trimly_lock:
+      if _trimly is None:
+         _trimly = Trimly()
+      return _trimly
+
+
+PREVIEW_WIDTH = 720
+PREVIEW_HEIGHT = 120
+PREVIEW_FLOOR_DB = -90.0
+
+
+def _preview_y(level):
+   # 0 dBFS at the top, PREVIEW_FLOOR_DB and below on the baseline
+   level = min(max(level, PREVIEW_FLOOR_DB), 0.0)
+   return PREVIEW_HEIGHT * level / PREVIEW_FLOOR_DB
+
+
+def render_preview(envelope, segment_map):
+   columns = envelope.columns(PREVIEW_WIDTH)
+   if not columns or envelope.duration <= 0:
+      return ""
+
+   bar = PREVIEW_WIDTH / len(columns)
+   scale = PREVIEW_WIDTH / envelope.duration
+   bars = "".join(f"M{i * bar:.1f} {PREVIEW_HEIGHT}V{_preview_y(level):.1f}" for i, level in enumerate(columns))
+   cuts = "".join(
+      f"<rect x='{start * scale:.1f}' width='{max((end - start) * scale, 0.5):.1f}' height='{PREVIEW_HEIGHT}'/>"
+      for start, end in segment_map.removed
+   )
+   threshold = segment_map.parameters["threshold"]
+   line = _preview_y(threshold)
+
+   return f"""
+   <svg viewBox='0 0 {PREVIEW_WIDTH} {PREVIEW_HEIGHT}' width='100%' preserveAspectRatio='none' style='background:#f1f5f9;border-radius:6px'>
+      <path d='{bars}' stroke='#0d9488' stroke-width='{max(bar - 0.3, 0.5):.1f}'/>
+      <g fill='#ef4444' fill-opacity='0.3'>{cuts}</g>
+      <line x1='0' x2='{PREVIEW_WIDTH}' y1='{line:.1f}' y2='{line:.1f}' stroke='#334155' stroke-dasharray='4 3'/>
+   </svg>
+   <p style='margin:.4em 0 0;font-size:.9em'>
+      Predicted output <b>{segment_map.output_duration:.1f}s</b> of {segment_map.duration:.1f}s
+      (−{segment_map.removed_duration:.1f}s, {segment_map.cut_count} cuts) at {threshold:g} dB
+   </p>
+   """
+
+
+def load_preview(audio_file, threshold, min_silence, auto_threshold):
+   # Measured once per upload and kept in session state; slider moves only re-threshold it
+   if audio_file is None:
+      return None, ""
+   try:
+      envelope = get_trimly().level_envelope(audio_file)
+   except Exception as e:
+      print(f"Preview unavailable: {e}")
+      return None, ""
+   return envelope, update_preview(envelope, threshold, min_silence, auto_threshold)
+
+
+def update_preview(envelope, threshold, min_silence, auto_threshold):
+   if envelope is None:
+      return ""
+   try:
+      segment_map = get_trimly().preview(envelope, "auto" if auto_threshold else threshold, min_silence)
+   except Exception as e:
+      return f"<p style='font-size:.9em'>{e}</p>"
+   return render_preview(envelope, segment_map)
+
+
+def trim_audio(audio_file, threshold, min_silence, auto_threshold=False, progress=gr.Progress()):
    if audio_file is None:
       print("No audio file provided")
       return None
 
    try:
+      # Measure the recording's noise floor instead of trusting the slider
+      if auto_threshold:
+         threshold = "auto"
       print(f"Processing: {audio_file}")
-      print(f"Threshold: {threshold} dB, Min silence: {min_silence}s")
+      print(f"Threshold: {threshold}{'' if auto_threshold else ' dB'}, Min silence: {min_silence}s")
 
-      trimly = Trimly()
-      message, output_path = trimly.trim_audio(
+      trimly = get_trimly()
+      latest = {}
+      cancel_token = CancelToken()
+      # Uploads from the UI are interactive, so they are scheduled ahead of any queued batch work
+      job = trimly.submit(
          file_path=audio_file,
          threshold=threshold,
-         min_silence=min_silence
+         min_silence=min_silence,
+         priority="interactive",
+         on_progress=lambda update: latest.update(update=update),
+         cancel_token=cancel_token
       )
 
+      # Updates arrive on the scheduler's worker thread; relay them to Gradio from the request thread
+      progress(0, desc="Queued")
+      try:
+         while True:
+            try:
+               message, output_path = job.result(timeout=0.25)
+               break
+            except FutureTimeoutError:
+               update = latest.get("update")
+               if update is not None:
+                  eta = f", ~{update.eta:.0f}s left" if update.eta is not None else ""
+                  progress(update.fraction, desc=f"Trimming ({update.speed or 0:.0f}x{eta})")
+      except BaseException:
+         # The browser went away or the event was cancelled: stop FFmpeg rather than finishing unseen work
+         cancel_token.cancel()
+         trimly.scheduler.cancel(job)
+         raise
+
       if output_path:
-         print(f"Success: {output_path}")
+         print(f"Success: {message}")
          return output_path
       else:
          print(f"Failed: {message}")
          return None
 
+   except SchedulerFullError as e:
+      print(f"Rejected: {e}")
+      raise gr.Error(str(e))
+
    except Exception as e:
       print(f"Error: {e}")
       return None
@@ -37,7 +143,7 @@ def trim_audio(audio_file, threshold, min_silence):
 
 def clear_inputs():
    print("Clearing inputs")
-   return None, -45, 0.05, None
+   return None, -45, 0.05, False, None, None, ""
 
 
 def interface():
@@ -61,7 +167,10 @@ def interface():
         with gr.Column():
             audio_input = gr.Audio(label="Upload MP3 or WAV", type="filepath")
             threshold = gr.Slider(-60, 0, value=-45, step=1, label="Silence Threshold (dB)")
+            auto_threshold = gr.Checkbox(value=False, label="Auto threshold (estimate from the recording's noise floor)")
             min_silence = gr.Slider(0.01, 1.0, value=0.05, step=0.01, label="Min Silence Duration (sec)")
+            preview = gr.HTML()
+            envelope = gr.State(None)
             
             with gr.Row():
                clear_btn = gr.Button("Clear", variant="secondary")
@@ -75,7 +184,9 @@ def interface():
             This tool uses FFmpeg's `silenceremove` filter to trim silent sections from your voiceover.
 
             - **Silence Threshold**: Controls what is considered "silence". Lower = more aggressive.
+            - **Auto Threshold**: Measures the recording's background noise and sets the threshold just above it.
             - **Min Silence Duration**: Minimum pause length (in seconds) before trimming kicks in.
+            - **Preview**: Shows the predicted cuts (red) and output length as you move the sliders; Submit renders the audio.
             - **Output**: Enhanced audio is saved in the `tmp/` folder and auto-deleted on app restart.
 
             ⚡ _Built for voiceovers, audiobooks, and content creators who hate dead air._
@@ -86,16 +197,34 @@ def interface():
       </div>
       """)
 
+      # Live preview: measure the upload once, then redraw from the cached envelope as the controls move.
+      # always_last drops intermediate slider positions while a redraw is in flight
+      preview_inputs = [threshold, min_silence, auto_threshold]
+      audio_input.change(
+         fn=load_preview,
+         inputs=[audio_input, *preview_inputs],
+         outputs=[envelope, preview],
+         show_progress="minimal"
+      )
+      for control in preview_inputs:
+         control.change(
+            fn=update_preview,
+            inputs=[envelope, *preview_inputs],
+            outputs=preview,
+            trigger_mode="always_last",
+            show_progress="hidden"
+         )
+
       # Connect functions to buttons
       trim_btn.click(
          fn=trim_audio,
-         inputs=[audio_input, threshold, min_silence],
+         inputs=[audio_input, threshold, min_silence, auto_threshold],
          outputs=audio_output
       )
 
       clear_btn.click(
          fn=clear_inputs,
-         outputs=[audio_input, threshold, min_silence, audio_output]
+         outputs=[audio_input, threshold, min_silence, auto_threshold, audio_output, envelope, preview]
       )
 
    return demo
@@ -103,7 +232,8 @@ def interface():
 
 def main():
    app = interface()
-   app.queue()
+   # Concurrency is bounded by the trimly scheduler, which queues or rejects requests itself
+   app.queue(default_concurrency_limit=None)
    app.launch(inbrowser=True, share=False)
 
 if __name__ == "__main__":
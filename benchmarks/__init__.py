@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Benchmark the working tree rather than whichever trimly happens to be installed
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
@@ -0,0 +1,92 @@
+"""
+Compare two benchmark result files and flag regressions.
+
+Usage:
+    python -m benchmarks.compare baseline.json candidate.json [--tolerance 0.10]
+
+Exits with status 1 when any case's throughput drops, or its p50/p99 latency or
+peak FFmpeg memory grows, by more than the tolerance.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# (field, higher_is_better)
+COMPARED_METRICS = (
+    ("throughput_x_realtime", True),
+    ("latency_p50_seconds", False),
+    ("latency_p99_seconds", False),
+    ("peak_child_rss_bytes", False)
+)
+
+
+def _index(results: Dict[str, Any]) -> Dict[Tuple[str, float, int], Dict[str, Any]]:
+    return {
+        (case["format"], case["duration_seconds"], case["concurrency"]): case
+        for case in results["cases"]
+    }
+
+
+def compare(baseline: Dict[str, Any], candidate: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """
+    Pair up cases by (format, duration, concurrency) and compute relative changes.
+
+    Returns:
+        List[Dict[str, Any]]: One row per shared case and metric with `baseline`,
+        `candidate`, `change` (candidate / baseline - 1) and `regression` flags.
+    """
+    rows = []
+    baseline_cases = _index(baseline)
+    for key, case in sorted(_index(candidate).items()):
+        reference = baseline_cases.get(key)
+        if reference is None:
+            continue
+        for field, higher_is_better in COMPARED_METRICS:
+            before, after = reference.get(field), case.get(field)
+            if not before or after is None:
+                continue
+            change = after / before - 1
+            regression = change < -tolerance if higher_is_better else change > tolerance
+            rows.append({
+                "format": key[0],
+                "duration_seconds": key[1],
+                "concurrency": key[2],
+                "metric": field,
+                "baseline": before,
+                "candidate": after,
+                "change": change,
+                "regression": regression
+            })
+    return rows
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two Trimly benchmark result files.")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed relative change before flagging (default 0.10)")
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.baseline.read_text())
+    candidate = json.loads(args.candidate.read_text())
+    if baseline.get("cpu_count") != candidate.get("cpu_count") or baseline.get("platform") != candidate.get("platform"):
+        print("Warning: results come from different machines; differences may not reflect the code change.")
+    print(f"{baseline.get('trimly_version')} -> {candidate.get('trimly_version')}  (tolerance {args.tolerance:.0%})")
+
+    rows = compare(baseline, candidate, args.tolerance)
+    for row in rows:
+        print(
+            f"{row['format']:>5} {row['duration_seconds']:>8g}s x{row['concurrency']:<2} "
+            f"{row['metric']:<24} {row['baseline']:>12.4g} -> {row['candidate']:>12.4g}  "
+            f"{row['change']:+7.1%}{'  REGRESSION' if row['regression'] else ''}"
+        )
+
+    regressions = sum(row["regression"] for row in rows)
+    print(f"{regressions} regression(s) across {len(rows)} comparisons")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
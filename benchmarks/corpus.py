@@ -0,0 +1,165 @@
+import os
+import random
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+from trimly.constants import OUTPUT_AUDIO_ENCODERS
+from trimly.utils.ffmpeg_availability import probe_ffmpeg_capabilities
+
+CORPUS_SAMPLE_RATE = 44100
+CORPUS_BLOCK_SECONDS = 60.0
+SPEECH_SECONDS_RANGE = (0.4, 4.0)
+PAUSE_SECONDS_RANGE = (0.08, 2.0)
+# Room tone in pauses sits near -70 dBFS, well below the default -45 dB threshold
+PAUSE_NOISE_AMPLITUDE = 0.0003
+
+
+@dataclass(frozen=True)
+class CorpusFile:
+    """
+    One generated benchmark input.
+
+    Attributes:
+        path (Path): Location of the encoded file.
+        format (str): Container extension including the dot.
+        duration (float): Length in seconds.
+        seed (int): Seed the speech/pause layout was drawn from.
+    """
+    path: Path
+    format: str
+    duration: float
+    seed: int
+
+
+def plan_block(seed: int, block_seconds: float = CORPUS_BLOCK_SECONDS) -> List[Tuple[str, float]]:
+    """
+    Draw an alternating speech/pause layout that fills `block_seconds`.
+
+    Args:
+        seed (int): Seed for the layout; equal seeds give identical layouts.
+        block_seconds (float): Total length of the layout.
+
+    Returns:
+        List[Tuple[str, float]]: ("speech" | "pause", seconds) segments, starting with speech.
+    """
+    rng = random.Random(seed)
+    segments = []
+    remaining = block_seconds
+    kind = "speech"
+    while remaining >= 0.001:
+        low, high = SPEECH_SECONDS_RANGE if kind == "speech" else PAUSE_SECONDS_RANGE
+        duration = min(round(rng.uniform(low, high), 3), round(remaining, 3))
+        segments.append((kind, duration))
+        remaining -= duration
+        kind = "pause" if kind == "speech" else "speech"
+    return segments
+
+
+def build_block_graph(segments: List[Tuple[str, float]], seed: int) -> str:
+    """
+    Render a speech/pause layout as an FFmpeg filter graph built only from lavfi sources.
+
+    Speech is a tremolo-modulated tone (syllable-rate amplitude changes) mixed
+    with pink noise; pauses are faint white noise standing in for room tone.
+    Every noise source is seeded, so the rendered samples are reproducible.
+    """
+    rng = random.Random(seed)
+    chains = []
+    labels = []
+    for index, (kind, duration) in enumerate(segments):
+        noise_seed = rng.randrange(1, 2 ** 31)
+        if kind == "speech":
+            frequency = rng.choice((110, 140, 180, 220))
+            chains.append(
+                f"sine=frequency={frequency}:sample_rate={CORPUS_SAMPLE_RATE}:duration={duration},"
+                f"tremolo=f=4:d=0.8[tone{index}]"
+            )
+            chains.append(
+                f"anoisesrc=color=pink:seed={noise_seed}:amplitude=0.1:"
+                f"sample_rate={CORPUS_SAMPLE_RATE}:duration={duration}[noise{index}]"
+            )
+            chains.append(f"[tone{index}][noise{index}]amix=inputs=2:duration=first[seg{index}]")
+        else:
+            chains.append(
+                f"anoisesrc=color=white:seed={noise_seed}:amplitude={PAUSE_NOISE_AMPLITUDE}:"
+                f"sample_rate={CORPUS_SAMPLE_RATE}:duration={duration}[seg{index}]"
+            )
+        labels.append(f"[seg{index}]")
+    chains.append(f"{''.join(labels)}concat=n={len(labels)}:v=0:a=1[out]")
+    return ";".join(chains)
+
+
+def _run(cmd: List[str], destination: Path) -> None:
+    partial = destination.with_name(f".{destination.stem}.partial{destination.suffix}")
+    try:
+        subprocess.run([*cmd, str(partial)], check=True, capture_output=True, text=True)
+        os.replace(partial, destination)
+    except subprocess.CalledProcessError as e:
+        partial.unlink(missing_ok=True)
+        raise RuntimeError(f"Failed to generate {destination.name}: {e.stderr.strip()}") from e
+
+
+def generate_file(directory: Path, audio_format: str, duration: float, seed: int = 0) -> CorpusFile:
+    """
+    Generate (or reuse) one corpus file of the given format and length.
+
+    A one-minute master block is synthesized once per seed and looped to the
+    requested duration, so multi-hour inputs cost one encode rather than a
+    filter graph with thousands of segments.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    master = directory / f"block-seed{seed}.wav"
+    if not master.exists():
+        _run(
+            [
+                "ffmpeg", "-hide_banner", "-y",
+                "-filter_complex", build_block_graph(plan_block(seed), seed),
+                "-map", "[out]", "-ac", "1", "-c:a", "pcm_s16le",
+                "-fflags", "+bitexact", "-flags:a", "+bitexact"
+            ],
+            master
+        )
+
+    path = directory / f"speech-{duration:g}s-seed{seed}{audio_format}"
+    if not path.exists():
+        _run(
+            [
+                "ffmpeg", "-hide_banner", "-y",
+                "-stream_loop", "-1", "-i", str(master),
+                "-t", str(duration),
+                "-c:a", OUTPUT_AUDIO_ENCODERS[audio_format],
+                "-map_metadata", "-1", "-fflags", "+bitexact", "-flags:a", "+bitexact"
+            ],
+            path
+        )
+    return CorpusFile(path, audio_format, duration, seed)
+
+
+def build_corpus(
+    directory: Path,
+    formats: Iterable[str],
+    durations: Iterable[float],
+    seed: int = 0
+) -> List[CorpusFile]:
+    """
+    Generate every (format, duration) combination, skipping formats this FFmpeg cannot encode.
+
+    Returns:
+        List[CorpusFile]: The generated files, ordered by duration then format.
+    """
+    capabilities = probe_ffmpeg_capabilities()
+    usable = []
+    for audio_format in sorted(formats):
+        encoder = OUTPUT_AUDIO_ENCODERS.get(audio_format)
+        if encoder is None or not capabilities.has_encoder(encoder):
+            print(f"Skipping {audio_format}: no {encoder or 'known'} encoder in this FFmpeg build")
+            continue
+        usable.append(audio_format)
+
+    return [
+        generate_file(directory, audio_format, duration, seed)
+        for duration in sorted(durations)
+        for audio_format in usable
+    ]
@@ -0,0 +1,193 @@
+"""
+Benchmark Trimly's trim path on a synthetic speech-plus-silence corpus.
+
+Usage:
+    python -m benchmarks.run                                  # 10 s, 60 s and 10 min inputs, 1/2/4 workers
+    python -m benchmarks.run --durations 3600,10800 --formats .mp3,.wav
+    python -m benchmarks.compare baseline.json candidate.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+from . import corpus as corpus_module
+from trimly import Trimly, __version__
+from trimly.configs import get_config
+from trimly.constants import SUPPORTED_AUDIO_FORMATS
+from trimly.utils.ffmpeg_availability import get_ffmpeg_version
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCHMARK_DIRECTORY = Path(__file__).resolve().parent
+RESULTS_SCHEMA_VERSION = 1
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _child_cpu_seconds() -> float:
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _max_rss_bytes(who: int) -> int:
+    if resource is None:
+        return 0
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return resource.getrusage(who).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+
+def run_case(path: str, duration: float, concurrency: int, jobs: int, work_directory: str) -> Dict[str, Any]:
+    """
+    Time `jobs` trims of one input with `concurrency` workers.
+
+    Runs in a fresh process per case so the peak-RSS figures from getrusage
+    describe this case alone. Result and PCM caches are disabled so every job
+    pays the full decode, filter and encode cost.
+    """
+    config = replace(
+        get_config(),
+        temp_directory=work_directory,
+        result_cache_enabled=False,
+        pcm_cache_enabled=False,
+        # Benchmark inputs are sized by duration, so the upload limits must not reject the longest ones
+        max_input_file_size_mb=0,
+        max_input_duration_seconds=0,
+        scheduler_max_workers=concurrency,
+        scheduler_max_queue=jobs
+    )
+    trimly = Trimly(config)
+    reports = []
+    trimly.metrics.add_listener(reports.append)
+
+    # Warm-up: page the input and the FFmpeg binary into cache before timing
+    _, warmup_output = trimly.trim_audio(path)
+    if warmup_output:
+        os.unlink(warmup_output)
+    reports.clear()
+
+    # Per-report child CPU figures overlap when jobs run concurrently, so take
+    # one delta around the timed section; this process runs nothing else
+    cpu_before = _child_cpu_seconds()
+    started = time.perf_counter()
+    futures = [trimly.submit(path, priority="batch", block=True) for _ in range(jobs)]
+    results = [future.result() for future in futures]
+    wall_seconds = time.perf_counter() - started
+    child_cpu_seconds = _child_cpu_seconds() - cpu_before
+
+    failures = [message for message, output in results if not output]
+    for _, output in results:
+        if output:
+            os.unlink(output)
+
+    latencies = [report.wall_seconds for report in reports]
+    return {
+        "jobs": jobs,
+        "failures": len(failures),
+        "failure_messages": sorted(set(failures))[:5],
+        "wall_seconds": wall_seconds,
+        "throughput_x_realtime": duration * (jobs - len(failures)) / wall_seconds,
+        "latency_p50_seconds": _percentile(latencies, 0.50) if latencies else None,
+        "latency_p90_seconds": _percentile(latencies, 0.90) if latencies else None,
+        "latency_p99_seconds": _percentile(latencies, 0.99) if latencies else None,
+        "latency_max_seconds": max(latencies) if latencies else None,
+        "latency_mean_seconds": statistics.fmean(latencies) if latencies else None,
+        "ffmpeg_seconds_mean": statistics.fmean(report.stages.get("ffmpeg", 0.0) for report in reports) if reports else None,
+        "child_cpu_seconds": child_cpu_seconds,
+        "peak_child_rss_bytes": _max_rss_bytes(resource.RUSAGE_CHILDREN) if resource else 0,
+        "peak_python_rss_bytes": _max_rss_bytes(resource.RUSAGE_SELF) if resource else 0
+    }
+
+
+def _parse_list(value: str, cast) -> List:
+    return [cast(item) for item in value.split(",") if item.strip()]
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Trimly on a synthetic speech-plus-silence corpus.")
+    parser.add_argument("--formats", default=",".join(sorted(SUPPORTED_AUDIO_FORMATS)), help="Comma-separated input formats")
+    parser.add_argument("--durations", default="10,60,600", help="Comma-separated input lengths in seconds")
+    parser.add_argument("--concurrency", default="1,2,4", help="Comma-separated worker counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Jobs per worker in each case")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the speech/pause layout")
+    parser.add_argument("--work-dir", type=Path, default=BENCHMARK_DIRECTORY / ".work", help="Corpus and scratch directory")
+    parser.add_argument("--output", type=Path, default=None, help="Results file (default: benchmarks/results/<version>-<timestamp>.json)")
+    args = parser.parse_args(argv)
+
+    formats = [f if f.startswith(".") else f".{f}" for f in _parse_list(args.formats, str.lower)]
+    durations = _parse_list(args.durations, float)
+    concurrencies = _parse_list(args.concurrency, int)
+
+    print(f"Generating corpus in {args.work_dir / 'corpus'} ...")
+    files = corpus_module.build_corpus(args.work_dir / "corpus", formats, durations, seed=args.seed)
+
+    created = datetime.now(timezone.utc)
+    results = {
+        "schema": RESULTS_SCHEMA_VERSION,
+        "created": created.isoformat(),
+        "trimly_version": __version__,
+        "ffmpeg_version": get_ffmpeg_version(),
+        "filter_template": get_config().ffmpeg_silence_filter_template,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": args.seed,
+        "cases": []
+    }
+
+    spawn = multiprocessing.get_context("spawn")
+    for corpus_file in files:
+        for concurrency in concurrencies:
+            jobs = concurrency * args.repeat
+            with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as executor:
+                measurement = executor.submit(
+                    run_case,
+                    str(corpus_file.path),
+                    corpus_file.duration,
+                    concurrency,
+                    jobs,
+                    str(args.work_dir / "tmp")
+                ).result()
+
+            case = {
+                "format": corpus_file.format,
+                "duration_seconds": corpus_file.duration,
+                "input_bytes": corpus_file.path.stat().st_size,
+                "concurrency": concurrency,
+                **measurement
+            }
+            results["cases"].append(case)
+            print(
+                f"{corpus_file.format:>5} {corpus_file.duration:>8g}s  x{concurrency:<2}  "
+                f"{case['throughput_x_realtime']:>8.1f}x realtime  "
+                f"p50 {case['latency_p50_seconds'] or 0:.3f}s  p99 {case['latency_p99_seconds'] or 0:.3f}s  "
+                f"rss {case['peak_child_rss_bytes'] / 2 ** 20:.0f} MiB"
+                + (f"  FAILURES {case['failures']}" if case["failures"] else "")
+            )
+
+    output = args.output or BENCHMARK_DIRECTORY / "results" / f"{__version__}-{created:%Y%m%dT%H%M%SZ}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
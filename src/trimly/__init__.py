@@ -1,16 +1,26 @@
 from .constants import __version__
 from .trimly import Trimly
+from .analysis import SegmentMap, SweepTable
+from .processing import CancelToken, Progress, ResourceLimits, ProcessingChain
 from .configs import TrimlyConfig, get_config, set_config, reset_config
-from .utils.exceptions import TrimlyError, UnsupportedFormatError, FFmpegNotFoundError
+from .utils.exceptions import TrimlyError, UnsupportedFormatError, FFmpegNotFoundError, SchedulerFullError, JobCancelledError
 
 __all__ = [
     "__version__",
     "Trimly",
+    "SegmentMap",
+    "SweepTable",
     "TrimlyConfig",
     "get_config",
     "set_config",
     "reset_config",
     "TrimlyError",
     "UnsupportedFormatError",
-    "FFmpegNotFoundError"
+    "FFmpegNotFoundError",
+    "SchedulerFullError",
+    "JobCancelledError",
+    "CancelToken",
+    "Progress",
+    "ResourceLimits",
+    "ProcessingChain"
 ]
\ No newline at end of file
@@ -0,0 +1,29 @@
+from .segments import Interval, SegmentMap, build_segment_map, removed_intervals
+from .silencedetect import detect_segments
+from .numpy_engine import DETECTION_MODES, DecodedAudio, decode_pcm, detect_segments_numpy, envelope, has_numpy, silent_runs
+from .sweep import SweepResult, SweepTable, sweep_parameters
+from .preview import LevelEnvelope
+from .noise_floor import NoiseFloorEstimate, derive_threshold, measure_levels, peak_levels
+
+__all__ = [
+    "Interval",
+    "SegmentMap",
+    "build_segment_map",
+    "removed_intervals",
+    "detect_segments",
+    "DETECTION_MODES",
+    "DecodedAudio",
+    "decode_pcm",
+    "detect_segments_numpy",
+    "envelope",
+    "has_numpy",
+    "silent_runs",
+    "SweepResult",
+    "SweepTable",
+    "sweep_parameters",
+    "NoiseFloorEstimate",
+    "derive_threshold",
+    "measure_levels",
+    "peak_levels",
+    "LevelEnvelope"
+]
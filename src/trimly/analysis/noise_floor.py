@@ -0,0 +1,174 @@
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Union
+
+from .numpy_engine import WINDOWS_PER_BLOCK, DecodedAudio, np, require_numpy
+from ..utils.exceptions import TrimlyError
+from ..utils.process_runner import run_process_lines
+
+# Per-window peak levels across all channels, matching silenceremove's peak detection
+NOISE_FLOOR_FILTER_TEMPLATE = (
+    "asetnsamples=n={window_samples}:p=0,"
+    "astats=metadata=1:reset=1:measure_perchannel=none:measure_overall=Peak_level,"
+    "ametadata=mode=print:key=lavfi.astats.Overall.Peak_level"
+)
+
+_PEAK_LEVEL = re.compile(r"lavfi\.astats\.Overall\.Peak_level=(-?inf|-?[\d.]+)")
+
+
+@dataclass(frozen=True)
+class NoiseFloorEstimate:
+    """
+    Level statistics of an input and the silence threshold derived from them.
+
+    Attributes:
+        noise_floor_db (float): Peak level at the noise-floor percentile.
+        speech_level_db (float): Peak level at the mirrored upper percentile.
+        threshold_db (float): Derived silence threshold.
+        windows (int): Number of analysis windows measured.
+    """
+    noise_floor_db: float
+    speech_level_db: float
+    threshold_db: float
+    windows: int
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def derive_threshold(
+    levels: Sequence[float],
+    percentile: float,
+    margin_db: float,
+    min_dynamic_range_db: float,
+    min_threshold: float,
+    max_threshold: float
+) -> NoiseFloorEstimate:
+    """
+    Derive a silence threshold from per-window peak levels.
+
+    The noise floor is the level at `percentile`, and the speech level is the
+    level at the mirrored upper percentile. The threshold sits `margin_db` above
+    the floor, but never past the midpoint between floor and speech, so a noisy
+    field recording still keeps its quiet syllables. When the two are closer
+    than `min_dynamic_range_db` there is no distinct silence to remove. In that
+    case the threshold drops below the floor, so almost nothing is cut.
+
+    Args:
+        levels (Sequence[float]): Peak level of each analysis window in dBFS.
+        percentile (float): Noise-floor percentile, 0-50.
+        margin_db (float): Headroom above the noise floor.
+        min_dynamic_range_db (float): Smallest floor-to-speech gap treated as speech over silence.
+        min_threshold (float): Lowest allowed threshold.
+        max_threshold (float): Highest allowed threshold.
+
+    Returns:
+        NoiseFloorEstimate: The statistics and the derived threshold.
+
+    Raises:
+        TrimlyError: If `levels` is empty.
+    """
+    if len(levels) == 0:
+        raise TrimlyError("Failed to estimate the noise floor: no audio was decoded")
+
+    # Digital silence measures -inf; treat it as the quietest threshold the config allows
+    ordered = sorted(max(float(level), min_threshold) for level in levels)
+    noise_floor = _percentile(ordered, percentile / 100)
+    speech_level = _percentile(ordered, 1 - percentile / 100)
+
+    dynamic_range = speech_level - noise_floor
+    if dynamic_range < min_dynamic_range_db:
+        threshold = noise_floor - margin_db
+    else:
+        threshold = noise_floor + min(margin_db, dynamic_range / 2)
+
+    return NoiseFloorEstimate(
+        noise_floor_db=float(noise_floor),
+        speech_level_db=float(speech_level),
+        threshold_db=round(float(min(max(threshold, min_threshold), max_threshold)), 1),
+        windows=len(levels)
+    )
+
+
+def measure_levels(
+    input_path: Union[str, Path],
+    window_seconds: float,
+    sample_rate: int,
+    resample: bool = False,
+    timeout: Optional[float] = None,
+    global_args: Sequence[str] = (),
+    on_spawn: Optional[Callable[[int], None]] = None
+) -> List[float]:
+    """
+    Measure the peak level of every `window_seconds` window in one decode pass.
+
+    The decoded audio is discarded into the null muxer, so the pass costs a
+    decode and nothing else. FFmpeg logs one level per window, which is parsed
+    as it streams rather than buffered, so hours of audio need no more memory
+    than the levels themselves. By default it is measured at its native rate and
+    layout, as `silenceremove` sees it. Downsampling low-passes broadband hiss
+    and lowers its peaks, which would put the threshold below the real noise
+    floor.
+
+    Args:
+        input_path (Union[str, Path]): Audio file to measure.
+        window_seconds (float): Length of each analysis window.
+        sample_rate (int): The input's sample rate, or the rate to resample to when `resample` is set.
+        resample (bool): Resample to `sample_rate` first; only safe when the noise is low-frequency.
+        timeout (Optional[float]): Seconds before the pass is aborted.
+        global_args (Sequence[str]): Arguments placed before the input, such as thread limits.
+        on_spawn (Optional[Callable[[int], None]]): Called with FFmpeg's PID once it starts.
+
+    Returns:
+        List[float]: Peak level in dBFS per window (-inf for digital silence).
+
+    Raises:
+        TrimlyError: If FFmpeg fails.
+        subprocess.TimeoutExpired: If the pass exceeds `timeout`.
+    """
+    cmd = [
+        "ffmpeg", "-hide_banner", "-nostats", *global_args,
+        "-i", str(input_path),
+        *(["-ar", str(sample_rate)] if resample else []),
+        "-af", NOISE_FLOOR_FILTER_TEMPLATE.format(window_samples=max(1, int(round(window_seconds * sample_rate)))),
+        "-f", "null", "-"
+    ]
+    levels: List[float] = []
+
+    def collect(line: str) -> None:
+        level = _PEAK_LEVEL.search(line)
+        if level is not None:
+            levels.append(float(level.group(1)))
+
+    returncode, stderr = run_process_lines(cmd, collect, timeout=timeout, on_spawn=on_spawn)
+    if returncode != 0:
+        error = stderr.strip().splitlines()[-1:] or ["Unknown FFmpeg error"]
+        raise TrimlyError(f"Failed to estimate the noise floor: {error[0]}")
+    return levels
+
+
+def peak_levels(audio: DecodedAudio, window_seconds: float) -> List[float]:
+    """
+    Compute the peak level of every `window_seconds` window of decoded audio, like `measure_levels`.
+
+    Works through the samples block by block, so a memory-mapped multi-hour
+    input is never copied into memory whole.
+
+    Raises:
+        TrimlyError: If NumPy is not installed.
+    """
+    require_numpy()
+    window = max(1, int(round(window_seconds * audio.sample_rate)))
+    block = window * WINDOWS_PER_BLOCK
+    levels = []
+    for start in range(0, audio.samples.shape[0], block):
+        chunk = np.abs(audio.samples[start:start + block]).max(axis=1)
+        padding = (-chunk.size) % window
+        if padding:
+            chunk = np.concatenate([chunk, np.zeros(padding, dtype=chunk.dtype)])
+        peaks = chunk.reshape(-1, window).max(axis=1)
+        with np.errstate(divide="ignore"):
+            levels.extend((20.0 * np.log10(peaks)).tolist())
+    return levels
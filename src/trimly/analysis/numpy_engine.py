@@ -0,0 +1,263 @@
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .segments import Interval, SegmentMap, build_segment_map
+from .silencedetect import parse_audio_stream
+from ..utils.exceptions import TrimlyError
+from ..utils.process_runner import run_process
+
+DETECTION_MODES = ("peak", "rms")
+
+# Floor applied before converting to dB so digital silence maps to a finite level
+_LEVEL_FLOOR = 1e-10
+
+# Windows reduced per step when computing levels, bounding working memory for multi-hour inputs
+WINDOWS_PER_BLOCK = 1 << 14
+
+
+def has_numpy() -> bool:
+    return np is not None
+
+
+def require_numpy() -> None:
+    """
+    Raises:
+        TrimlyError: If NumPy is not installed.
+    """
+    if np is None:
+        raise TrimlyError("The numpy analysis engine requires NumPy. Install it with `pip install trimly[analysis]`.")
+
+
+@dataclass
+class DecodedAudio:
+    """
+    Audio decoded to float32 PCM, held as a (frames, channels) array.
+
+    Decoding once and passing a DecodedAudio to the analysis functions lets the
+    same samples be evaluated under many parameter sets without touching FFmpeg.
+    """
+    source: str
+    samples: "np.ndarray"
+    sample_rate: int
+    codec: Optional[str] = None
+
+    @property
+    def channels(self) -> int:
+        return self.samples.shape[1]
+
+    @property
+    def duration(self) -> float:
+        return self.samples.shape[0] / self.sample_rate
+
+
+def run_pcm_decode(
+    input_path: Union[str, Path],
+    target: str,
+    sample_rate: Optional[int] = None,
+    channels: Optional[int] = None,
+    timeout: Optional[float] = None,
+    global_args: Sequence[str] = (),
+    on_spawn: Optional[Callable[[int], None]] = None,
+    audio_filter: Optional[str] = None
+) -> Tuple[bytes, Optional[str], int, int]:
+    """
+    Decode an input to raw float32 PCM at `target` (a file path or "pipe:1").
+
+    `global_args` are placed before the input, and `on_spawn` is called with FFmpeg's PID once it starts.
+    `audio_filter` runs before the conversion to `sample_rate` and `channels`, e.g. to pick a cheaper resampler.
+
+    Returns:
+        Tuple[bytes, Optional[str], int, int]: Captured stdout (empty unless
+        `target` is "pipe:1"), source codec, sample rate and channel count.
+
+    Raises:
+        TrimlyError: If FFmpeg fails or the output layout cannot be determined.
+        subprocess.TimeoutExpired: If decoding exceeds `timeout`.
+    """
+    cmd = ["ffmpeg", "-hide_banner", "-nostats", *global_args, "-y", "-i", str(input_path)]
+    if audio_filter:
+        cmd += ["-af", audio_filter]
+    cmd += ["-f", "f32le"]
+    if sample_rate:
+        cmd += ["-ar", str(sample_rate)]
+    if channels:
+        cmd += ["-ac", str(channels)]
+    cmd.append(target)
+
+    result = run_process(cmd, timeout=timeout, on_spawn=on_spawn, text=False)
+    stderr = result.stderr.decode(errors="replace")
+    if result.returncode != 0:
+        error = stderr.strip().splitlines()[-1:] or ["Unknown FFmpeg error"]
+        raise TrimlyError(f"Failed to decode audio: {error[0]}")
+
+    codec, native_rate, native_channels = parse_audio_stream(stderr)
+    sample_rate = sample_rate or native_rate
+    channels = channels or native_channels
+    if not sample_rate or not channels:
+        raise TrimlyError("Failed to decode audio: could not determine sample rate or channel layout")
+    return result.stdout, codec, sample_rate, channels
+
+
+def decode_pcm(
+    input_path: Union[str, Path],
+    sample_rate: Optional[int] = None,
+    channels: Optional[int] = None,
+    timeout: Optional[float] = None,
+    global_args: Sequence[str] = (),
+    on_spawn: Optional[Callable[[int], None]] = None,
+    audio_filter: Optional[str] = None,
+    work_directory: Optional[Union[str, Path]] = None
+) -> DecodedAudio:
+    """
+    Decode an input to float32 PCM in a scratch file and memory-map it.
+
+    The samples are paged in from disk on demand instead of being held in
+    memory, so a multi-hour input costs disk space rather than RAM. The scratch
+    file is unlinked straight away and disappears with the last reference to
+    the samples (on platforms that lock mapped files it is left for the OS to clean).
+
+    Args:
+        input_path (Union[str, Path]): Audio file to decode.
+        sample_rate (Optional[int]): Resample to this rate; native rate if omitted.
+        channels (Optional[int]): Down/up-mix to this channel count; native layout if omitted.
+        timeout (Optional[float]): Seconds before decoding is aborted.
+        global_args (Sequence[str]): Arguments placed before the input, such as thread limits.
+        on_spawn (Optional[Callable[[int], None]]): Called with FFmpeg's PID once it starts.
+        audio_filter (Optional[str]): Filter graph run before the conversion to `sample_rate` and `channels`.
+        work_directory (Optional[Union[str, Path]]): Directory for the scratch file; the system temp directory if omitted.
+
+    Returns:
+        DecodedAudio: The decoded samples, backed by a read-only memory map.
+
+    Raises:
+        TrimlyError: If NumPy is missing or FFmpeg fails to decode the input.
+        subprocess.TimeoutExpired: If decoding exceeds `timeout`.
+    """
+    require_numpy()
+
+    descriptor, scratch = tempfile.mkstemp(prefix=".decode-", suffix=".f32", dir=work_directory)
+    os.close(descriptor)
+    try:
+        _, codec, sample_rate, channels = run_pcm_decode(
+            input_path, scratch, sample_rate, channels, timeout, global_args=global_args, on_spawn=on_spawn, audio_filter=audio_filter
+        )
+        if os.path.getsize(scratch) < 4 * channels:
+            samples = np.zeros((0, channels), dtype="<f4")
+        else:
+            samples = np.memmap(scratch, dtype="<f4", mode="r")
+            samples = samples[:samples.size - samples.size % channels].reshape(-1, channels)
+    finally:
+        try:
+            os.unlink(scratch)
+        except OSError:
+            # Still mapped on platforms that lock mapped files
+            pass
+    return DecodedAudio(str(input_path), samples, sample_rate, codec)
+
+
+def envelope(audio: DecodedAudio, window_seconds: float, mode: str = "peak") -> "np.ndarray":
+    """
+    Compute a windowed level envelope in dBFS over consecutive, non-overlapping windows.
+
+    Each window's level is that of its loudest channel: the largest magnitude
+    (peak) or the highest per-channel mean power (rms). A window is therefore
+    silent only when every channel is quiet, as `silenceremove` treats
+    multi-channel input. Samples are processed block by block, so a
+    memory-mapped multi-hour input is never copied into memory whole.
+
+    Args:
+        audio (DecodedAudio): Decoded samples.
+        window_seconds (float): Length of each analysis window.
+        mode (str): "peak" for the per-window maximum magnitude, "rms" for root mean square.
+
+    Returns:
+        np.ndarray: One level in dB per window.
+    """
+    require_numpy()
+    if mode not in DETECTION_MODES:
+        raise TrimlyError(f"Unknown detection mode: {mode}. Supported modes: {', '.join(DETECTION_MODES)}")
+
+    window = max(1, int(round(window_seconds * audio.sample_rate)))
+    block = window * WINDOWS_PER_BLOCK
+    channels = audio.samples.shape[1]
+    levels = [np.zeros(0)]
+    for start in range(0, audio.samples.shape[0], block):
+        chunk = audio.samples[start:start + block]
+        padding = (-chunk.shape[0]) % window
+        if padding:
+            chunk = np.concatenate([chunk, np.zeros((padding, channels), dtype=chunk.dtype)])
+        windows = chunk.reshape(-1, window, channels)
+        if mode == "peak":
+            levels.append(np.abs(windows).max(axis=(1, 2)))
+        else:
+            levels.append(np.square(windows, dtype=np.float64).mean(axis=1).max(axis=1))
+    per_window = np.concatenate(levels)
+
+    if mode == "peak":
+        return 20.0 * np.log10(np.maximum(per_window, _LEVEL_FLOOR))
+    return 10.0 * np.log10(np.maximum(per_window, _LEVEL_FLOOR))
+
+
+def silent_runs(levels: "np.ndarray", threshold: float, window_seconds: float, duration: float) -> List[Interval]:
+    """
+    Find runs of consecutive windows below `threshold` using vectorised run-length encoding.
+
+    Returns:
+        List[Interval]: Ordered (start, end) silent runs in seconds, clipped to `duration`.
+    """
+    mask = np.concatenate([[False], levels < threshold, [False]]).astype(np.int8)
+    edges = np.flatnonzero(np.diff(mask))
+    starts, ends = edges[0::2] * window_seconds, edges[1::2] * window_seconds
+    return [(float(start), float(min(end, duration))) for start, end in zip(starts, ends)]
+
+
+def detect_segments_numpy(
+    audio: DecodedAudio,
+    threshold: float,
+    min_silence: float,
+    start_silence: float,
+    mode: str = "peak",
+    window_seconds: float = 0.02
+) -> SegmentMap:
+    """
+    Detect silence in decoded audio and build its SegmentMap.
+
+    Uses the same threshold, min_silence and start_silence semantics as the
+    FFmpeg `silenceremove` template, evaluated in-process on the envelope.
+
+    Args:
+        audio (DecodedAudio): Decoded samples.
+        threshold (float): Silence threshold in dB.
+        min_silence (float): Silence kept from each silent run.
+        start_silence (float): Silence kept at the start of the input.
+        mode (str): Envelope detection mode, "peak" or "rms".
+        window_seconds (float): Envelope window length.
+
+    Returns:
+        SegmentMap: Kept and removed intervals for the given parameters.
+    """
+    levels = envelope(audio, window_seconds, mode)
+    return build_segment_map(
+        audio.source,
+        audio.duration,
+        silent_runs(levels, threshold, window_seconds, audio.duration),
+        min_silence,
+        start_silence,
+        sample_rate=audio.sample_rate,
+        channels=audio.channels,
+        codec=audio.codec,
+        parameters={
+            "threshold": threshold,
+            "min_silence": min_silence,
+            "start_silence": start_silence,
+            "detection": mode,
+        }
+    )
@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from .numpy_engine import has_numpy, np, silent_runs
+from .segments import Interval, SegmentMap, build_segment_map
+
+
+def _silent_runs(levels: Sequence[float], threshold: float, window_seconds: float, duration: float) -> List[Interval]:
+    if has_numpy():
+        return silent_runs(np.asarray(levels), threshold, window_seconds, duration)
+
+    runs = []
+    start = None
+    for index, level in enumerate(levels):
+        if level < threshold:
+            if start is None:
+                start = index
+        elif start is not None:
+            runs.append((start * window_seconds, min(index * window_seconds, duration)))
+            start = None
+    if start is not None:
+        runs.append((start * window_seconds, duration))
+    return runs
+
+
+@dataclass(frozen=True)
+class LevelEnvelope:
+    """
+    Per-window peak levels of an input, measured once and re-thresholded cheaply.
+
+    An envelope holds one level per analysis window (50 per second at the
+    default 20 ms), so predicting the cuts for new parameters is a scan over
+    the levels rather than another FFmpeg pass. The prediction matches
+    `silenceremove` to within one window.
+
+    Attributes:
+        source (str): Path of the measured input.
+        duration (float): Input duration in seconds.
+        window_seconds (float): Length of each analysis window.
+        levels (Sequence[float]): Peak level in dBFS per window (-inf for digital silence).
+        sample_rate (Optional[int]): Input sample rate, if known.
+        channels (Optional[int]): Input channel count, if known.
+        codec (Optional[str]): Input codec name, if known.
+    """
+    source: str
+    duration: float
+    window_seconds: float
+    levels: Sequence[float]
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+    codec: Optional[str] = None
+
+    def __post_init__(self):
+        # Held as an array when NumPy is installed so every re-threshold is vectorised
+        if has_numpy():
+            object.__setattr__(self, "levels", np.asarray(self.levels, dtype=np.float32))
+
+    def segment_map(self, threshold: float, min_silence: float, start_silence: float) -> SegmentMap:
+        """
+        Predict the kept and removed intervals for a set of silence parameters.
+        """
+        return build_segment_map(
+            self.source,
+            self.duration,
+            _silent_runs(self.levels, threshold, self.window_seconds, self.duration),
+            min_silence,
+            start_silence,
+            sample_rate=self.sample_rate,
+            channels=self.channels,
+            codec=self.codec,
+            parameters={"threshold": threshold, "min_silence": min_silence, "start_silence": start_silence}
+        )
+
+    def columns(self, width: int) -> List[float]:
+        """
+        Reduce the envelope to at most `width` peak levels for drawing.
+        """
+        count = len(self.levels)
+        if count == 0:
+            return []
+        step = -(-count // max(1, width))
+        if has_numpy():
+            padding = (-count) % step
+            levels = np.concatenate([self.levels, np.full(padding, -np.inf, dtype=np.float32)])
+            return levels.reshape(-1, step).max(axis=1).tolist()
+        return [max(self.levels[start:start + step]) for start in range(0, count, step)]
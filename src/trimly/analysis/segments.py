@@ -0,0 +1,155 @@
+import json
+from dataclasses import dataclass, field, asdict
+from typing import Iterable, List, Optional, Tuple
+
+Interval = Tuple[float, float]
+
+
+@dataclass
+class SegmentMap:
+    """
+    Compact description of which parts of an input are kept and which are removed.
+
+    A segment map is produced once by an analysis pass and can then be rendered
+    (sample-accurate or stream-copy) or exported as JSON, an EDL or Audacity
+    labels without analysing the audio again.
+
+    Attributes:
+        source: Path of the analysed input.
+        duration: Input duration in seconds.
+        kept: Ordered, non-overlapping (start, end) intervals that survive trimming.
+        removed: Ordered, non-overlapping (start, end) intervals that are cut.
+        sample_rate: Input sample rate, if known.
+        channels: Input channel count, if known.
+        codec: Input codec name, if known.
+        parameters: Silence parameters the map was derived from.
+    """
+    source: str
+    duration: float
+    kept: List[Interval]
+    removed: List[Interval]
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+    codec: Optional[str] = None
+    parameters: dict = field(default_factory=dict)
+
+    @property
+    def output_duration(self) -> float:
+        return sum(end - start for start, end in self.kept)
+
+    @property
+    def removed_duration(self) -> float:
+        return sum(end - start for start, end in self.removed)
+
+    @property
+    def removed_fraction(self) -> float:
+        return self.removed_duration / self.duration if self.duration > 0 else 0.0
+
+    @property
+    def cut_count(self) -> int:
+        return len(self.removed)
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(asdict(self), indent=indent)
+
+    @classmethod
+    def from_json(cls, text: str) -> "SegmentMap":
+        data = json.loads(text)
+        data["kept"] = [tuple(interval) for interval in data["kept"]]
+        data["removed"] = [tuple(interval) for interval in data["removed"]]
+        return cls(**data)
+
+    def to_audacity_labels(self, label: str = "silence") -> str:
+        """Export removed regions as an Audacity label track (tab-separated start, end, label)."""
+        return "".join(f"{start:.6f}\t{end:.6f}\t{label}\n" for start, end in self.removed)
+
+    def to_edl(self, title: str = "Trimly", frame_rate: int = 25, reel: str = "AX") -> str:
+        """
+        Export kept regions as a CMX 3600 edit decision list.
+
+        Each kept interval becomes an audio cut event; record timecodes are laid
+        end to end so the EDL reproduces the trimmed timeline.
+        """
+        lines = [f"TITLE: {title}", "FCM: NON-DROP FRAME", ""]
+        record = 0.0
+        for index, (start, end) in enumerate(self.kept, start=1):
+            length = end - start
+            lines.append(
+                f"{index:03d}  {reel:<8} AA    C        "
+                f"{_timecode(start, frame_rate)} {_timecode(end, frame_rate)} "
+                f"{_timecode(record, frame_rate)} {_timecode(record + length, frame_rate)}"
+            )
+            record += length
+        return "\n".join(lines) + "\n"
+
+
+def _timecode(seconds: float, frame_rate: int) -> str:
+    frames = int(round(seconds * frame_rate))
+    hours, frames = divmod(frames, 3600 * frame_rate)
+    minutes, frames = divmod(frames, 60 * frame_rate)
+    secs, frames = divmod(frames, frame_rate)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}:{frames:02d}"
+
+
+def removed_intervals(
+    silences: Iterable[Interval],
+    min_silence: float,
+    start_silence: float
+) -> List[Interval]:
+    """
+    Translate detected silent runs into the intervals `silenceremove` would cut.
+
+    This mirrors the Trimly filter template: leading silence is shortened to
+    `start_silence`, and every other silent run (including trailing silence) is
+    shortened to `min_silence`.
+
+    Args:
+        silences (Iterable[Interval]): Ordered (start, end) silent runs.
+        min_silence (float): Silence kept from each run after the start.
+        start_silence (float): Silence kept from a run that begins at time zero.
+
+    Returns:
+        List[Interval]: Ordered intervals that are removed.
+    """
+    removed = []
+    for start, end in silences:
+        keep = start_silence if start <= 0.0 else min_silence
+        if end - start > keep:
+            removed.append((start + keep, end))
+    return removed
+
+
+def build_segment_map(
+    source: str,
+    duration: float,
+    silences: Iterable[Interval],
+    min_silence: float,
+    start_silence: float,
+    **metadata
+) -> SegmentMap:
+    """
+    Build a SegmentMap from detected silent runs.
+
+    Args:
+        source (str): Path of the analysed input.
+        duration (float): Input duration in seconds.
+        silences (Iterable[Interval]): Ordered (start, end) silent runs.
+        min_silence (float): Silence kept from each run after the start.
+        start_silence (float): Silence kept from a run that begins at time zero.
+        **metadata: Optional `sample_rate`, `channels`, `codec` and `parameters`.
+
+    Returns:
+        SegmentMap: The kept and removed intervals covering [0, duration].
+    """
+    removed = removed_intervals(silences, min_silence, start_silence)
+
+    kept = []
+    position = 0.0
+    for start, end in removed:
+        if start > position:
+            kept.append((position, start))
+        position = end
+    if duration > position:
+        kept.append((position, duration))
+
+    return SegmentMap(source=source, duration=duration, kept=kept, removed=removed, **metadata)
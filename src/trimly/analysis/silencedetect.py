@@ -0,0 +1,141 @@
+import re
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from .segments import Interval, SegmentMap, build_segment_map
+from ..utils.exceptions import TrimlyError
+from ..utils.process_runner import run_process
+
+SILENCEDETECT_FILTER_TEMPLATE = "silencedetect=noise={threshold}dB:d={duration}"
+
+_SILENCE_START = re.compile(r"silence_start:\s*(-?[\d.]+)")
+_SILENCE_END = re.compile(r"silence_end:\s*(-?[\d.]+)")
+_DURATION = re.compile(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
+_PROGRESS_TIME = re.compile(r"time=(\d+):(\d+):(\d+(?:\.\d+)?)")
+_AUDIO_STREAM = re.compile(r"Stream #\d+:\d+.*?: Audio: (\w+).*?, (\d+) Hz, ([^,]+)")
+
+_CHANNEL_LAYOUTS = {"mono": 1, "stereo": 2, "2.1": 3, "quad": 4, "4.0": 4, "5.0": 5, "5.1": 6, "6.1": 7, "7.1": 8}
+
+
+def _hms_to_seconds(hours: str, minutes: str, seconds: str) -> float:
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def parse_duration(stderr: str) -> Optional[float]:
+    """
+    Extract the input duration from FFmpeg's log output.
+
+    Uses the container's "Duration:" line and falls back to the last progress
+    "time=" stamp for inputs whose container does not declare a duration.
+    """
+    match = _DURATION.search(stderr)
+    if match:
+        return _hms_to_seconds(*match.groups())
+    times = _PROGRESS_TIME.findall(stderr)
+    if times:
+        return _hms_to_seconds(*times[-1])
+    return None
+
+
+def parse_audio_stream(stderr: str) -> Tuple[Optional[str], Optional[int], Optional[int]]:
+    """
+    Extract (codec, sample_rate, channels) of the first audio stream from FFmpeg's log output.
+    """
+    match = _AUDIO_STREAM.search(stderr)
+    if not match:
+        return None, None, None
+    codec, sample_rate, layout = match.groups()
+    layout = layout.strip().split("(")[0].strip()
+    channels = _CHANNEL_LAYOUTS.get(layout)
+    if channels is None:
+        count = re.match(r"(\d+) channels", layout)
+        channels = int(count.group(1)) if count else None
+    return codec, int(sample_rate), channels
+
+
+def parse_silences(stderr: str, duration: float) -> List[Interval]:
+    """
+    Pair up silencedetect's silence_start/silence_end log lines into intervals.
+
+    A trailing silence that runs to the end of the input has no silence_end line
+    and is closed at `duration`.
+    """
+    silences = []
+    start = None
+    for line in stderr.splitlines():
+        match = _SILENCE_START.search(line)
+        if match:
+            start = max(0.0, float(match.group(1)))
+            continue
+        match = _SILENCE_END.search(line)
+        if match and start is not None:
+            silences.append((start, min(float(match.group(1)), duration)))
+            start = None
+    if start is not None and duration > start:
+        silences.append((start, duration))
+    return silences
+
+
+def detect_segments(
+    input_path: Union[str, Path],
+    threshold: float,
+    min_silence: float,
+    start_silence: float,
+    timeout: Optional[float] = None,
+    global_args: Sequence[str] = (),
+    on_spawn: Optional[Callable[[int], None]] = None
+) -> SegmentMap:
+    """
+    Analyse an input with FFmpeg's `silencedetect` filter and build its SegmentMap.
+
+    The input is decoded once and discarded into the null muxer; nothing is
+    encoded or written to disk.
+
+    Args:
+        input_path (Union[str, Path]): Audio file to analyse.
+        threshold (float): Silence threshold in dB.
+        min_silence (float): Silence kept from each silent run.
+        start_silence (float): Silence kept at the start of the input.
+        timeout (Optional[float]): Seconds before the analysis is aborted.
+        global_args (Sequence[str]): Arguments placed before the input, such as thread limits.
+        on_spawn (Optional[Callable[[int], None]]): Called with FFmpeg's PID once it starts.
+
+    Returns:
+        SegmentMap: Kept and removed intervals for the given parameters.
+
+    Raises:
+        TrimlyError: If FFmpeg fails or the input duration cannot be determined.
+        subprocess.TimeoutExpired: If the analysis exceeds `timeout`.
+    """
+    # Runs shorter than the smaller keep duration are never cut, so they need not be reported
+    detect_filter = SILENCEDETECT_FILTER_TEMPLATE.format(
+        threshold=threshold,
+        duration=min(min_silence, start_silence)
+    )
+    cmd = [
+        "ffmpeg", "-hide_banner", *global_args,
+        "-i", str(input_path),
+        "-af", detect_filter,
+        "-f", "null", "-"
+    ]
+    result = run_process(cmd, timeout=timeout, on_spawn=on_spawn)
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1:] or ["Unknown FFmpeg error"]
+        raise TrimlyError(f"Failed to analyze audio: {error[0]}")
+
+    duration = parse_duration(result.stderr)
+    if duration is None:
+        raise TrimlyError("Failed to analyze audio: could not determine input duration")
+
+    codec, sample_rate, channels = parse_audio_stream(result.stderr)
+    return build_segment_map(
+        str(input_path),
+        duration,
+        parse_silences(result.stderr, duration),
+        min_silence,
+        start_silence,
+        sample_rate=sample_rate,
+        channels=channels,
+        codec=codec,
+        parameters={"threshold": threshold, "min_silence": min_silence, "start_silence": start_silence}
+    )
@@ -0,0 +1,93 @@
+import csv
+import io
+from dataclasses import dataclass, asdict, fields
+from typing import Iterable, List
+
+from .numpy_engine import DecodedAudio, envelope, np, require_numpy, silent_runs
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """Predicted outcome of trimming with one (threshold, min_silence) pair."""
+    threshold: float
+    min_silence: float
+    output_duration: float
+    removed_fraction: float
+    cut_count: int
+
+
+@dataclass
+class SweepTable:
+    """
+    Results of a parameter sweep over one input, one row per grid point.
+
+    Attributes:
+        source: Path of the analysed input.
+        duration: Input duration in seconds.
+        rows: One SweepResult per (threshold, min_silence) pair, thresholds outermost.
+    """
+    source: str
+    duration: float
+    rows: List[SweepResult]
+
+    def to_dicts(self) -> List[dict]:
+        return [asdict(row) for row in self.rows]
+
+    def to_csv(self) -> str:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=[f.name for f in fields(SweepResult)])
+        writer.writeheader()
+        writer.writerows(self.to_dicts())
+        return buffer.getvalue()
+
+
+def sweep_parameters(
+    audio: DecodedAudio,
+    thresholds: Iterable[float],
+    min_silences: Iterable[float],
+    start_silence: float,
+    mode: str = "peak",
+    window_seconds: float = 0.02
+) -> SweepTable:
+    """
+    Predict trimming results for a whole grid of thresholds and minimum silence durations.
+
+    The envelope is computed once; each threshold costs one vectorised mask and
+    run-length pass, and each minimum silence duration one vectorised reduction
+    over the detected runs. No audio is decoded or encoded per grid point.
+
+    Args:
+        audio (DecodedAudio): Decoded samples of the input.
+        thresholds (Iterable[float]): Silence thresholds in dB.
+        min_silences (Iterable[float]): Minimum silence durations in seconds.
+        start_silence (float): Silence kept at the start of the input.
+        mode (str): Envelope detection mode, "peak" or "rms".
+        window_seconds (float): Envelope window length.
+
+    Returns:
+        SweepTable: One row per (threshold, min_silence) pair.
+    """
+    require_numpy()
+    levels = envelope(audio, window_seconds, mode)
+    duration = audio.duration
+    min_silences = list(min_silences)
+
+    rows = []
+    for threshold in thresholds:
+        runs = np.asarray(silent_runs(levels, threshold, window_seconds, duration), dtype=float).reshape(-1, 2)
+        starts, lengths = runs[:, 0], runs[:, 1] - runs[:, 0]
+        leading = starts <= 0.0
+
+        for min_silence in min_silences:
+            keep = np.where(leading, start_silence, min_silence)
+            removed = np.clip(lengths - keep, 0.0, None)
+            removed_total = float(removed.sum())
+            rows.append(SweepResult(
+                threshold=threshold,
+                min_silence=min_silence,
+                output_duration=duration - removed_total,
+                removed_fraction=removed_total / duration if duration > 0 else 0.0,
+                cut_count=int(np.count_nonzero(removed))
+            ))
+
+    return SweepTable(source=audio.source, duration=duration, rows=rows)
@@ -0,0 +1,10 @@
+from .result_cache import ResultCache, get_result_cache, link_or_copy
+from .pcm_cache import PCMCache, get_pcm_cache
+
+__all__ = [
+    "ResultCache",
+    "get_result_cache",
+    "link_or_copy",
+    "PCMCache",
+    "get_pcm_cache"
+]
@@ -0,0 +1,224 @@
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence, Tuple, Union
+
+from ..analysis.numpy_engine import DecodedAudio, require_numpy, run_pcm_decode
+from ..utils.hashing import hash_file
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+class PCMCache:
+    """
+    Disk cache of decoded float32 PCM, read back through memory maps.
+
+    The first decode of an input is written as raw little-endian float32 next
+    to a small JSON sidecar holding its layout. Later loads of the same content
+    (and the same requested sample rate/channel count) map the file read-only,
+    so no decode or copy happens. Entries are evicted by age since last use and
+    by total size, least recently used first; a decode larger than the whole
+    cache is mapped from its unlinked scratch file and never stored. All
+    methods are thread-safe.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int, max_age_seconds: float):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.evict()
+
+    def load(
+        self,
+        input_path: Union[str, Path],
+        sample_rate: Optional[int] = None,
+        channels: Optional[int] = None,
+        timeout: Optional[float] = None,
+        content_hash: Optional[str] = None,
+        global_args: Sequence[str] = (),
+        on_spawn: Optional[Callable[[int], None]] = None
+    ) -> DecodedAudio:
+        """
+        Return the decoded samples of `input_path`, decoding only on a cache miss.
+
+        Args:
+            input_path (Union[str, Path]): Audio file to decode.
+            sample_rate (Optional[int]): Resample to this rate; native rate if omitted.
+            channels (Optional[int]): Mix to this channel count; native layout if omitted.
+            timeout (Optional[float]): Seconds before a decode is aborted.
+            content_hash (Optional[str]): Precomputed SHA-256 of the input, if already known.
+            global_args (Sequence[str]): FFmpeg arguments placed before the input on a miss, such as thread limits.
+            on_spawn (Optional[Callable[[int], None]]): Called with the decoder's PID once it starts.
+
+        Returns:
+            DecodedAudio: Samples backed by a read-only memory map, or held in
+            memory when the decode is larger than `max_bytes`.
+        """
+        require_numpy()
+        content_hash = content_hash or hash_file(input_path)
+
+        entry = self.find(content_hash, sample_rate, channels)
+        if entry is not None:
+            try:
+                return self._map(input_path, *entry)
+            except FileNotFoundError:
+                # Evicted by another thread or process since the lookup
+                pass
+
+        # Decode straight to disk so a long input never has to fit in memory
+        partial = self.partial_path(content_hash, sample_rate, channels)
+        try:
+            _, codec, rate, layout = run_pcm_decode(
+                input_path, str(partial), sample_rate, channels, timeout, global_args=global_args, on_spawn=on_spawn
+            )
+            metadata = {"sample_rate": rate, "channels": layout, "codec": codec}
+            if partial.stat().st_size > self.max_bytes:
+                # Publishing would only evict it again, so map the scratch file, which is unlinked below
+                return self._map(input_path, partial, metadata)
+            data_path = self.publish(content_hash, partial, metadata, sample_rate, channels)
+        finally:
+            partial.unlink(missing_ok=True)
+
+        return self._map(input_path, data_path, metadata)
+
+    def find(
+        self,
+        content_hash: str,
+        sample_rate: Optional[int] = None,
+        channels: Optional[int] = None
+    ) -> Optional[Tuple[Path, dict]]:
+        """
+        Look up the decoded PCM of an input by content hash and mark it as recently used.
+
+        Returns:
+            Optional[Tuple[Path, dict]]: The raw float32 file and its layout
+            (`sample_rate`, `channels`, `codec`), or None on a miss.
+        """
+        data_path = self._data_path(content_hash, sample_rate, channels)
+        try:
+            metadata = json.loads(data_path.with_suffix(".json").read_text())
+            os.utime(data_path)
+        except (OSError, ValueError):
+            # Missing, evicted or half-written by another process
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return data_path, metadata
+
+    def partial_path(self, content_hash: str, sample_rate: Optional[int] = None, channels: Optional[int] = None) -> Path:
+        """Return a writer-unique scratch path for decoding an entry before it is published."""
+        data_path = self._data_path(content_hash, sample_rate, channels)
+        return data_path.with_name(f"{data_path.name}.{uuid.uuid4().hex}.part")
+
+    def publish(
+        self,
+        content_hash: str,
+        partial: Path,
+        metadata: dict,
+        sample_rate: Optional[int] = None,
+        channels: Optional[int] = None
+    ) -> Path:
+        """
+        Atomically move a fully decoded scratch file into the cache, then enforce the limits.
+
+        Args:
+            content_hash (str): SHA-256 of the source input.
+            partial (Path): Scratch file from `partial_path` holding raw float32 PCM.
+            metadata (dict): Layout of the PCM: `sample_rate`, `channels` and `codec`.
+            sample_rate (Optional[int]): Sample rate that was requested, if any.
+            channels (Optional[int]): Channel count that was requested, if any.
+
+        Returns:
+            Path: The published raw float32 file.
+        """
+        data_path = self._data_path(content_hash, sample_rate, channels)
+        data_path.with_suffix(".json").write_text(json.dumps(metadata))
+        os.replace(partial, data_path)
+        self.evict(keep=data_path)
+        return data_path
+
+    def evict(self, keep: Optional[Path] = None) -> None:
+        """
+        Delete entries unused for longer than `max_age_seconds`, then the oldest until within `max_bytes`.
+
+        Args:
+            keep (Optional[Path]): An entry that must survive this sweep, such as one just published.
+        """
+        with self._lock:
+            now = time.time()
+            entries = []
+            for data_path in self.directory.glob("*.f32"):
+                try:
+                    stat = data_path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, data_path))
+            entries.sort()
+
+            total = sum(size for _, size, _ in entries)
+            for mtime, size, data_path in entries:
+                if now - mtime <= self.max_age_seconds and total <= self.max_bytes:
+                    break
+                if data_path == keep:
+                    continue
+                if self._remove(data_path):
+                    total -= size
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current occupancy."""
+        with self._lock:
+            sizes = [path.stat().st_size for path in self.directory.glob("*.f32")]
+            return {"hits": self.hits, "misses": self.misses, "entries": len(sizes), "bytes": sum(sizes)}
+
+    def _data_path(self, content_hash: str, sample_rate: Optional[int], channels: Optional[int]) -> Path:
+        return self.directory / f"{content_hash}-{sample_rate or 'native'}-{channels or 'native'}.f32"
+
+    @staticmethod
+    def _remove(data_path: Path) -> bool:
+        try:
+            data_path.unlink()
+        except OSError:
+            # Still mapped on platforms that lock mapped files; try again on the next sweep
+            return False
+        data_path.with_suffix(".json").unlink(missing_ok=True)
+        return True
+
+    @staticmethod
+    def _map(input_path: Union[str, Path], data_path: Path, metadata: dict) -> DecodedAudio:
+        channels = metadata["channels"]
+        if data_path.stat().st_size < 4 * channels:
+            samples = np.zeros((0, channels), dtype="<f4")
+        else:
+            samples = np.memmap(data_path, dtype="<f4", mode="r")
+            samples = samples[:samples.size - samples.size % channels].reshape(-1, channels)
+        return DecodedAudio(str(input_path), samples, metadata["sample_rate"], metadata["codec"])
+
+
+_caches: Dict[Path, PCMCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_pcm_cache(directory: Union[str, Path], max_bytes: int, max_age_seconds: float) -> PCMCache:
+    """
+    Return the process-wide PCMCache for `directory`, creating it on first use.
+    """
+    directory = Path(directory)
+    with _caches_lock:
+        cache = _caches.get(directory)
+        if cache is None:
+            cache = _caches[directory] = PCMCache(directory, max_bytes, max_age_seconds)
+        return cache
@@ -0,0 +1,161 @@
+import hashlib
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+
+def link_or_copy(source: Path, destination: Path) -> None:
+    """
+    Place `source` at `destination` as a hard link, falling back to a copy.
+
+    Any existing file at `destination` is unlinked first rather than overwritten
+    in place, so a previously linked cache entry is never truncated through a
+    shared inode.
+
+    Args:
+        source (Path): Existing file to expose.
+        destination (Path): Path at which the file should appear.
+    """
+    destination.unlink(missing_ok=True)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+class ResultCache:
+    """
+    Content-addressed, size-bounded LRU cache of trimmed outputs.
+
+    Entries are stored as files named by their cache key inside `directory`.
+    Recency is persisted through file modification times, so the LRU order
+    survives process restarts. Eviction keeps the cache within both
+    `max_bytes` and `max_entries`. All methods are thread-safe.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int, max_entries: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[Path, int]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    @staticmethod
+    def make_key(input_hash: str, *parameters: str) -> str:
+        """
+        Derive a cache key from the input content hash and every rendered parameter
+        that influences the output (filter graph, encoder settings, FFmpeg version).
+        """
+        digest = hashlib.sha256(input_hash.encode())
+        for parameter in parameters:
+            digest.update(b"\0" + parameter.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Path]:
+        """
+        Look up a cached output and mark it as most recently used.
+
+        Returns:
+            Optional[Path]: Path of the cached file, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry[0].exists():
+                if entry is not None:
+                    self._forget(key)
+                self.misses += 1
+                return None
+
+            path = entry[0]
+            self._entries.move_to_end(key)
+            self.hits += 1
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    def put(self, key: str, source: Union[str, Path]) -> Path:
+        """
+        Store a finished output under `key` and evict least recently used entries
+        until the cache is back within its limits.
+
+        Returns:
+            Path: Path of the cache entry.
+        """
+        source = Path(source)
+        path = self.directory / f"{key}{source.suffix}"
+        link_or_copy(source, path)
+
+        with self._lock:
+            if key in self._entries:
+                self._forget(key)
+            size = path.stat().st_size
+            self._entries[key] = (path, size)
+            self._total_bytes += size
+            self._evict()
+        return path
+
+    def clear(self) -> None:
+        """Remove every cache entry and reset the hit/miss counters."""
+        with self._lock:
+            for key in list(self._entries):
+                self._forget(key).unlink(missing_ok=True)
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current occupancy."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+            }
+
+    def _load(self) -> None:
+        files = [path for path in self.directory.iterdir() if path.is_file()]
+        for path in sorted(files, key=lambda p: p.stat().st_mtime):
+            size = path.stat().st_size
+            self._entries[path.stem] = (path, size)
+            self._total_bytes += size
+        with self._lock:
+            self._evict()
+
+    def _forget(self, key: str) -> Path:
+        path, size = self._entries.pop(key)
+        self._total_bytes -= size
+        return path
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes):
+            self._forget(next(iter(self._entries))).unlink(missing_ok=True)
+
+
+_caches: Dict[Path, ResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_result_cache(directory: Union[str, Path], max_bytes: int, max_entries: int) -> ResultCache:
+    """
+    Return the process-wide ResultCache for `directory`, creating it on first use.
+
+    Sharing one instance per directory keeps hit/miss counters and the LRU order
+    consistent across every Trimly instance using the same temp directory.
+    """
+    directory = Path(directory)
+    with _caches_lock:
+        cache = _caches.get(directory)
+        if cache is None:
+            cache = _caches[directory] = ResultCache(directory, max_bytes, max_entries)
+        return cache
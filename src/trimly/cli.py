@@ -0,0 +1,330 @@
+"""
+Command-line interface: trim a directory tree into a mirrored output tree.
+
+    trimly recordings/ -o trimmed/ --threshold -45 --format .flac --jobs 8
+
+A manifest in the output root records, for every input, its size, mtime,
+content hash, the trim parameters and the output it produced. On reruns an
+input whose size and mtime are unchanged, whose parameters match and whose
+output still exists is skipped without being read, so only new or changed
+files cost any work.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .configs import get_config
+from .constants import AUTO_THRESHOLD, __version__
+from .trimly import Trimly
+from .utils.exceptions import TrimlyError
+from .utils.hashing import hash_file
+
+MANIFEST_NAME = ".trimly-manifest.json"
+MANIFEST_VERSION = 1
+# Completed jobs between manifest checkpoints, so an interrupted run keeps most of its progress
+MANIFEST_CHECKPOINT_INTERVAL = 100
+
+
+def load_manifest(path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Read a manifest, returning an empty one if it is missing, unreadable or from another version.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Entries keyed by input path relative to the input root.
+    """
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data.get("entries", {})
+
+
+def save_manifest(path: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Atomically replace the manifest, so a crash mid-write never leaves it truncated.
+    """
+    partial = path.with_name(f".{path.name}.partial")
+    partial.write_text(json.dumps({"version": MANIFEST_VERSION, "entries": entries}, sort_keys=True))
+    os.replace(partial, path)
+
+
+def iter_inputs(root: Path, supported_formats, skip: Optional[Path] = None) -> Iterator[Tuple[str, os.stat_result]]:
+    """
+    Yield (relative_path, stat) for every supported audio file under `root`, in a stable order.
+
+    Args:
+        root (Path): Directory to walk; symlinked directories are not followed.
+        supported_formats: Extensions (with dot) to include.
+        skip (Optional[Path]): Directory to leave out, e.g. an output root nested inside the input root.
+    """
+    skip = skip.resolve() if skip is not None else None
+    for directory, subdirectories, files in os.walk(root):
+        if skip is not None:
+            subdirectories[:] = [d for d in subdirectories if (Path(directory) / d).resolve() != skip]
+        subdirectories.sort()
+        for name in sorted(files):
+            if name.startswith(".") or Path(name).suffix.lower() not in supported_formats:
+                continue
+            path = Path(directory) / name
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            yield path.relative_to(root).as_posix(), stat
+
+
+def plan_outputs(relatives: List[str], output_suffix: str) -> Dict[str, Optional[str]]:
+    """
+    Map every input to its output path relative to the output root.
+
+    An output normally takes the input's path with its extension replaced by
+    `output_suffix`. Inputs that would collide that way (`a.mp3` and `a.wav` both
+    becoming `a.wav`) keep their source extension in the stem instead
+    (`a.mp3.wav`, `a.wav.wav`). Names are compared case-insensitively, since the
+    output tree may live on a case-insensitive file system.
+
+    Args:
+        relatives (List[str]): Input paths relative to the input root.
+        output_suffix (str): Output extension, including the dot.
+
+    Returns:
+        Dict[str, Optional[str]]: Output path per input, or None for an input
+        whose output would still overwrite another's.
+    """
+    outputs = {relative: Path(relative).with_suffix(output_suffix).as_posix() for relative in relatives}
+    claims = Counter(output.casefold() for output in outputs.values())
+    for relative, output in outputs.items():
+        if claims[output.casefold()] > 1:
+            outputs[relative] = f"{relative}{output_suffix}"
+
+    claims = Counter(output.casefold() for output in outputs.values())
+    return {relative: output if claims[output.casefold()] == 1 else None for relative, output in outputs.items()}
+
+
+def _trim_if_changed(
+    trimly: Trimly,
+    input_path: Path,
+    known_hash: Optional[str],
+    dry_run: bool,
+    parameters: Dict[str, Any]
+) -> Tuple[str, Optional[Tuple[str, Optional[str]]]]:
+    # Runs on a scheduler worker, so hashing one file overlaps with trimming others.
+    # Returns the content hash and the trim result, or None when the content matches `known_hash`.
+    content_hash = hash_file(input_path)
+    if content_hash == known_hash:
+        return content_hash, None
+    if dry_run:
+        return content_hash, ("would trim", None)
+    return content_hash, trimly.trim_audio(input_path, **parameters)
+
+
+def _threshold(value: str):
+    return value if value == AUTO_THRESHOLD else float(value)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="trimly",
+        description="Trim silence from every recording under a directory, mirroring the tree to an output directory."
+    )
+    parser.add_argument("input", type=Path, help="Input directory (or a single file)")
+    parser.add_argument("-o", "--output", type=Path, required=True, help="Output root directory")
+    parser.add_argument("--threshold", type=_threshold, default=None, help="Silence threshold in dB, or 'auto' to measure each file's noise floor")
+    parser.add_argument("--min-silence", type=float, default=None, help="Minimum silence duration in seconds")
+    parser.add_argument("--start-silence", type=float, default=None, help="Leading silence to keep in seconds")
+    parser.add_argument("--format", default=None, help="Output format, e.g. .wav, .flac, .mp3")
+    parser.add_argument("--sample-rate", type=int, default=None, help="Output sample rate in Hz")
+    parser.add_argument("--channels", type=int, default=None, help="Output channel count")
+    parser.add_argument("--bitrate", default=None, help="Bitrate for lossy output formats, e.g. 128k")
+    parser.add_argument(
+        "--chain",
+        default=None,
+        help="Processing chain run in the same pass, e.g. 'highpass:80,silence,loudnorm,resample:48000,mix:1,fade_out:0.05'"
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=0, help="Concurrent FFmpeg jobs (default: one per CPU core)")
+    parser.add_argument("--manifest", type=Path, default=None, help=f"Manifest path (default: <output>/{MANIFEST_NAME})")
+    parser.add_argument("--force", action="store_true", help="Re-trim every file, ignoring the manifest")
+    parser.add_argument("--prune", action="store_true", help="Delete outputs whose input no longer exists")
+    parser.add_argument("--dry-run", action="store_true", help="List what would be trimmed without running FFmpeg")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only print failures and the summary")
+    parser.add_argument("--version", action="version", version=f"trimly {__version__}")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _build_parser().parse_args(argv)
+
+    # The manifest takes the place of the result cache here, and one-off inputs gain nothing from the PCM cache
+    config = replace(
+        get_config(),
+        result_cache_enabled=False,
+        pcm_cache_enabled=False,
+        scheduler_max_workers=args.jobs or get_config().scheduler_max_workers
+    )
+    try:
+        trimly = Trimly(config)
+        # Everything that changes the output bytes goes into the key, so editing any of it re-trims the tree
+        output_suffix, parameters_key = trimly.plan_output(
+            args.threshold, args.min_silence, args.start_silence, args.format, args.sample_rate, args.channels, args.bitrate, args.chain
+        )
+    except TrimlyError as e:
+        print(f"trimly: {e}", file=sys.stderr)
+        return 2
+
+    if args.input.is_file():
+        input_root = args.input.parent
+        inputs = [(args.input.name, args.input.stat())]
+    elif args.input.is_dir():
+        input_root = args.input
+        inputs = iter_inputs(input_root, config.supported_audio_formats, skip=args.output)
+    else:
+        print(f"trimly: no such file or directory: {args.input}", file=sys.stderr)
+        return 2
+
+    manifest_path = args.manifest or args.output / MANIFEST_NAME
+    args.output.mkdir(parents=True, exist_ok=True)
+    previous = {} if args.force else load_manifest(manifest_path)
+    entries: Dict[str, Dict[str, Any]] = {}
+
+    started = time.monotonic()
+    counts = {"trimmed": 0, "skipped": 0, "failed": 0}
+    pending = []
+    reaped = 0
+    parameters = {
+        "threshold": args.threshold,
+        "min_silence": args.min_silence,
+        "start_silence": args.start_silence,
+        "output_format": output_suffix,
+        "sample_rate": args.sample_rate,
+        "channels": args.channels,
+        "bitrate": args.bitrate,
+        "chain": args.chain
+    }
+
+    # Output names depend on which other inputs exist, so the whole tree is listed before anything is submitted
+    inputs = list(inputs)
+    outputs = plan_outputs([relative for relative, _ in inputs], output_suffix)
+
+    for relative, stat in inputs:
+        output_relative = outputs[relative]
+        if output_relative is None:
+            counts["failed"] += 1
+            print(f"failed      {relative}: output path collides with another input's output", file=sys.stderr)
+            continue
+
+        entry = previous.get(relative)
+        if entry is not None and (
+            entry["parameters"] != parameters_key
+            or entry["output"] != output_relative
+            or not (args.output / entry["output"]).exists()
+        ):
+            entry = None
+        if entry is not None and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            entries[relative] = entry
+            counts["skipped"] += 1
+            continue
+
+        # Touched but unchanged (e.g. restored from backup): only the content hash can tell, and the worker computes it
+        future = trimly.scheduler.submit(
+            _trim_if_changed,
+            trimly,
+            input_root / relative,
+            entry["hash"] if entry is not None else None,
+            args.dry_run,
+            {**parameters, "output_path": args.output / output_relative},
+            priority="batch",
+            block=True
+        )
+        pending.append((relative, output_relative, stat, entry, future))
+
+        # Reap finished jobs as we go so the manifest is checkpointed during long runs
+        while pending and pending[0][-1].done():
+            _reap(pending.pop(0), args, entries, counts, parameters_key)
+            reaped += 1
+            if reaped % MANIFEST_CHECKPOINT_INTERVAL == 0 and not args.dry_run:
+                save_manifest(manifest_path, {**previous, **entries})
+
+    for job in pending:
+        _reap(job, args, entries, counts, parameters_key)
+
+    if args.dry_run:
+        print(f"{counts['skipped']} up to date")
+        return 0
+
+    # Inputs that disappeared drop out of the manifest; their outputs are only removed on request
+    removed = [relative for relative in previous if relative not in entries and not (input_root / relative).exists()]
+    kept_failures = {
+        relative: entry for relative, entry in previous.items()
+        if relative not in entries and relative not in removed
+    }
+    if args.prune:
+        # Outputs of removed inputs, and outputs a re-trimmed input moved away from when its name became (un)ambiguous
+        stale = {previous[relative]["output"] for relative in removed}
+        stale.update(
+            previous[relative]["output"] for relative, entry in entries.items()
+            if relative in previous and previous[relative]["output"] != entry["output"]
+        )
+        # A stale path may since have been taken over by a live input, e.g. `a.wav` once `a.mp3` is gone
+        live_outputs = {output for output in outputs.values() if output is not None}
+        live_outputs.update(entry["output"] for entry in {**kept_failures, **entries}.values())
+        for output in stale - live_outputs:
+            (args.output / output).unlink(missing_ok=True)
+    save_manifest(manifest_path, {**kept_failures, **entries})
+
+    print(
+        f"{counts['trimmed']} trimmed, {counts['skipped']} up to date, {counts['failed']} failed"
+        + (f", {len(removed)} pruned" if args.prune and removed else "")
+        + f" in {time.monotonic() - started:.1f}s"
+    )
+    return 1 if counts["failed"] else 0
+
+
+def _reap(
+    job,
+    args: argparse.Namespace,
+    entries: Dict[str, Dict[str, Any]],
+    counts: Dict[str, int],
+    parameters_key: str
+) -> None:
+    relative, output_relative, stat, entry, future = job
+    try:
+        content_hash, result = future.result()
+    except Exception as e:
+        content_hash, result = None, (f"Unexpected error: {e}", None)
+
+    if result is None:
+        entries[relative] = {**entry, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        counts["skipped"] += 1
+        return
+    message, output = result
+    if args.dry_run:
+        print(f"{message}  {relative}")
+        return
+
+    if output is None:
+        counts["failed"] += 1
+        print(f"failed      {relative}: {message}", file=sys.stderr)
+        return
+
+    counts["trimmed"] += 1
+    entries[relative] = {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "hash": content_hash,
+        "parameters": parameters_key,
+        "output": output_relative
+    }
+    if not args.quiet:
+        print(f"trimmed     {relative}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,21 +1,67 @@
 import os
 from dataclasses import dataclass, field
-from typing import Set, Optional
+from typing import List, Set, Optional
 
+from ..utils.output_encoding import normalize_output_format
+from ..processing.resources import parse_cpu_list
+from ..processing.chain import ProcessingChain
 from ..constants import (
     DEFAULT_TEMP_DIRECTORY,
     PROCESSED_FILE_PREFIX,
+    TEMP_STORAGE_QUOTA_MB,
+    TEMP_FILE_TTL_SECONDS,
+    TEMP_SWEEP_INTERVAL_SECONDS,
     DEFAULT_OUTPUT_AUDIO_FORMAT,
+    DEFAULT_OUTPUT_SAMPLE_RATE,
+    DEFAULT_OUTPUT_CHANNELS,
+    DEFAULT_OUTPUT_BITRATE,
+    OUTPUT_AUDIO_ENCODERS,
     SUPPORTED_AUDIO_FORMATS,
     DEFAULT_SILENCE_THRESHOLD_DB,
     DEFAULT_MIN_SILENCE_DURATION_SECONDS,
     DEFAULT_START_SILENCE_KEEP_DURATION_SECONDS,
+    AUTO_THRESHOLD_ENABLED,
+    AUTO_THRESHOLD_PERCENTILE,
+    AUTO_THRESHOLD_MARGIN_DB,
     MIN_SILENCE_THRESHOLD_DB,
     MAX_SILENCE_THRESHOLD_DB,
     MIN_PROCESSING_SILENCE_DURATION_SECONDS,
     MAX_PROCESSING_SILENCE_DURATION_SECONDS,
     MAX_INPUT_FILE_SIZE_MB,
     PROCESSING_OPERATION_TIMEOUT_SECONDS,
+    PROGRESS_STALL_TIMEOUT_SECONDS,
+    MAX_INPUT_DURATION_SECONDS,
+    PROCESSING_TIMEOUT_PER_AUDIO_SECOND,
+    MEDIA_PROBE_ENABLED,
+    MEDIA_PROBE_CACHE_MAX_ENTRIES,
+    DEFAULT_BATCH_MAX_WORKERS,
+    DEFAULT_ASYNC_MAX_CONCURRENT_PROCESSES,
+    BATCH_PACK_MAX_INPUTS,
+    BATCH_PACK_MAX_SECONDS,
+    BATCH_PACK_MAX_CLIP_SECONDS,
+    DEFAULT_SCHEDULER_MAX_WORKERS,
+    DEFAULT_SCHEDULER_MAX_QUEUE,
+    FFMPEG_THREADS,
+    FFMPEG_FILTER_THREADS,
+    FFMPEG_CPU_AFFINITY,
+    FFMPEG_CORES_PER_JOB,
+    FFMPEG_NICE,
+    FFMPEG_MEMORY_LIMIT_MB,
+    SPLIT_MIN_CHUNK_SECONDS,
+    STREAM_CHUNK_SIZE_BYTES,
+    ANALYSIS_ENGINES,
+    DEFAULT_ANALYSIS_ENGINE,
+    DEFAULT_DETECTION_MODE,
+    ANALYSIS_WINDOW_SECONDS,
+    PREFLIGHT_MIN_REMOVED_SECONDS,
+    RESULT_CACHE_ENABLED,
+    RESULT_CACHE_MAX_SIZE_MB,
+    RESULT_CACHE_MAX_ENTRIES,
+    PCM_CACHE_ENABLED,
+    PCM_CACHE_MAX_SIZE_MB,
+    PCM_CACHE_MAX_AGE_SECONDS,
+    METRICS_ENABLED,
+    PROCESSING_CHAIN,
     FFMPEG_SILENCE_FILTER_TEMPLATE
 )
 
@@ -29,6 +75,28 @@ def _parse_env_float(var: str, default: float) -> float:
       raise ValueError(f"Invalid float value for {var}: {value}")
 
 
+def _parse_env_int(var: str, default: int) -> int:
+   value = os.getenv(var)
+   if value is None:
+      return default
+   try:
+      return int(value)
+   except ValueError:
+      raise ValueError(f"Invalid integer value for {var}: {value}")
+
+
+def _parse_env_bool(var: str, default: bool) -> bool:
+   value = os.getenv(var)
+   if value is None:
+      return default
+   normalized = value.strip().lower()
+   if normalized in ("1", "true", "yes", "on"):
+      return True
+   if normalized in ("0", "false", "no", "off"):
+      return False
+   raise ValueError(f"Invalid boolean value for {var}: {value}")
+
+
 def _parse_env_str(var: str, default: str) -> str:
    return os.getenv(var, default)
 
@@ -45,7 +113,13 @@ class TrimlyConfig:
    # Directory and File Settings
    temp_directory: str = DEFAULT_TEMP_DIRECTORY
    processed_file_prefix: str = PROCESSED_FILE_PREFIX
+   temp_storage_quota_mb: float = TEMP_STORAGE_QUOTA_MB
+   temp_file_ttl_seconds: float = TEMP_FILE_TTL_SECONDS
+   temp_sweep_interval_seconds: float = TEMP_SWEEP_INTERVAL_SECONDS
    output_audio_format: str = DEFAULT_OUTPUT_AUDIO_FORMAT
+   output_sample_rate: Optional[int] = DEFAULT_OUTPUT_SAMPLE_RATE
+   output_channels: Optional[int] = DEFAULT_OUTPUT_CHANNELS
+   output_bitrate: Optional[str] = DEFAULT_OUTPUT_BITRATE
    supported_audio_formats: Set[str] = field(default_factory=lambda: SUPPORTED_AUDIO_FORMATS)
 
    # Audio Processing Defaults
@@ -53,9 +127,67 @@ class TrimlyConfig:
    default_min_silence_duration_seconds: float = DEFAULT_MIN_SILENCE_DURATION_SECONDS
    default_start_silence_keep_duration_seconds: float = DEFAULT_START_SILENCE_KEEP_DURATION_SECONDS
 
+   # Automatic Threshold
+   auto_threshold_enabled: bool = AUTO_THRESHOLD_ENABLED
+   auto_threshold_percentile: float = AUTO_THRESHOLD_PERCENTILE
+   auto_threshold_margin_db: float = AUTO_THRESHOLD_MARGIN_DB
+
    # Operational Limits
    max_input_file_size_mb: float = MAX_INPUT_FILE_SIZE_MB
    processing_operation_timeout_seconds: int = PROCESSING_OPERATION_TIMEOUT_SECONDS
+   progress_stall_timeout_seconds: float = PROGRESS_STALL_TIMEOUT_SECONDS
+   max_input_duration_seconds: float = MAX_INPUT_DURATION_SECONDS
+   processing_timeout_per_audio_second: float = PROCESSING_TIMEOUT_PER_AUDIO_SECOND
+
+   # Media Probe
+   media_probe_enabled: bool = MEDIA_PROBE_ENABLED
+   media_probe_cache_max_entries: int = MEDIA_PROBE_CACHE_MAX_ENTRIES
+
+   # Batch Processing
+   batch_max_workers: int = DEFAULT_BATCH_MAX_WORKERS
+   async_max_concurrent_processes: int = DEFAULT_ASYNC_MAX_CONCURRENT_PROCESSES
+   batch_pack_max_inputs: int = BATCH_PACK_MAX_INPUTS
+   batch_pack_max_seconds: float = BATCH_PACK_MAX_SECONDS
+   batch_pack_max_clip_seconds: float = BATCH_PACK_MAX_CLIP_SECONDS
+
+   # Job Scheduler
+   scheduler_max_workers: int = DEFAULT_SCHEDULER_MAX_WORKERS
+   scheduler_max_queue: int = DEFAULT_SCHEDULER_MAX_QUEUE
+
+   # FFmpeg Resource Limits
+   ffmpeg_threads: int = FFMPEG_THREADS
+   ffmpeg_filter_threads: int = FFMPEG_FILTER_THREADS
+   ffmpeg_cpu_affinity: str = FFMPEG_CPU_AFFINITY
+   ffmpeg_cores_per_job: int = FFMPEG_CORES_PER_JOB
+   ffmpeg_nice: int = FFMPEG_NICE
+   ffmpeg_memory_limit_mb: float = FFMPEG_MEMORY_LIMIT_MB
+
+   # Split-and-Parallelize Processing
+   split_min_chunk_seconds: float = SPLIT_MIN_CHUNK_SECONDS
+
+   # Streaming
+   stream_chunk_size_bytes: int = STREAM_CHUNK_SIZE_BYTES
+
+   # Silence Analysis
+   analysis_engine: str = DEFAULT_ANALYSIS_ENGINE
+   analysis_detection_mode: str = DEFAULT_DETECTION_MODE
+   analysis_window_seconds: float = ANALYSIS_WINDOW_SECONDS
+
+   # Pre-flight Scan
+   preflight_min_removed_seconds: float = PREFLIGHT_MIN_REMOVED_SECONDS
+
+   # Result Cache
+   result_cache_enabled: bool = RESULT_CACHE_ENABLED
+   result_cache_max_size_mb: float = RESULT_CACHE_MAX_SIZE_MB
+   result_cache_max_entries: int = RESULT_CACHE_MAX_ENTRIES
+
+   # Decoded PCM Cache
+   pcm_cache_enabled: bool = PCM_CACHE_ENABLED
+   pcm_cache_max_size_mb: float = PCM_CACHE_MAX_SIZE_MB
+   pcm_cache_max_age_seconds: float = PCM_CACHE_MAX_AGE_SECONDS
+
+   # Instrumentation
+   metrics_enabled: bool = METRICS_ENABLED
 
    # Validation Ranges
    min_silence_threshold_db: float = MIN_SILENCE_THRESHOLD_DB
@@ -63,6 +195,9 @@ class TrimlyConfig:
    min_processing_silence_duration_seconds: float = MIN_PROCESSING_SILENCE_DURATION_SECONDS
    max_processing_silence_duration_seconds: float = MAX_PROCESSING_SILENCE_DURATION_SECONDS
 
+   # Processing Chain
+   processing_chain: str = PROCESSING_CHAIN
+
    # FFMPEG Silence Filter Template
    ffmpeg_silence_filter_template: str = FFMPEG_SILENCE_FILTER_TEMPLATE
 
@@ -80,17 +215,92 @@ class TrimlyConfig:
          # Load basic directory and file-related settings
          temp_directory=os.path.abspath(_parse_env_str("TRIMLY_TEMP_DIRECTORY", DEFAULT_TEMP_DIRECTORY)),
          processed_file_prefix=_parse_env_str("TRIMLY_FILE_PREFIX", PROCESSED_FILE_PREFIX),
+         temp_storage_quota_mb=_parse_env_float("TRIMLY_TEMP_QUOTA_MB", TEMP_STORAGE_QUOTA_MB),
+         temp_file_ttl_seconds=_parse_env_float("TRIMLY_TEMP_TTL", TEMP_FILE_TTL_SECONDS),
+         temp_sweep_interval_seconds=_parse_env_float("TRIMLY_TEMP_SWEEP_INTERVAL", TEMP_SWEEP_INTERVAL_SECONDS),
+
+         # Load output encoding settings
+         output_audio_format=_parse_env_str("TRIMLY_OUTPUT_FORMAT", DEFAULT_OUTPUT_AUDIO_FORMAT),
+         output_sample_rate=_parse_env_int("TRIMLY_OUTPUT_SAMPLE_RATE", DEFAULT_OUTPUT_SAMPLE_RATE),
+         output_channels=_parse_env_int("TRIMLY_OUTPUT_CHANNELS", DEFAULT_OUTPUT_CHANNELS),
+         output_bitrate=_parse_env_str("TRIMLY_OUTPUT_BITRATE", DEFAULT_OUTPUT_BITRATE),
 
          # Load default silence processing thresholds
          default_silence_threshold_db=_parse_env_float("TRIMLY_SILENCE_THRESHOLD_DB", DEFAULT_SILENCE_THRESHOLD_DB),
          default_min_silence_duration_seconds=_parse_env_float("TRIMLY_MIN_SILENCE_DURATION", DEFAULT_MIN_SILENCE_DURATION_SECONDS),
          default_start_silence_keep_duration_seconds=_parse_env_float("TRIMLY_KEEP_START_DURATION", DEFAULT_START_SILENCE_KEEP_DURATION_SECONDS),
 
+         # Load automatic threshold settings
+         auto_threshold_enabled=_parse_env_bool("TRIMLY_AUTO_THRESHOLD", AUTO_THRESHOLD_ENABLED),
+         auto_threshold_percentile=_parse_env_float("TRIMLY_AUTO_THRESHOLD_PERCENTILE", AUTO_THRESHOLD_PERCENTILE),
+         auto_threshold_margin_db=_parse_env_float("TRIMLY_AUTO_THRESHOLD_MARGIN_DB", AUTO_THRESHOLD_MARGIN_DB),
+
          # Load configurable validation limits
          min_silence_threshold_db=_parse_env_float("TRIMLY_MIN_SILENCE_DB", MIN_SILENCE_THRESHOLD_DB),
          max_silence_threshold_db=_parse_env_float("TRIMLY_MAX_SILENCE_DB", MAX_SILENCE_THRESHOLD_DB),
          min_processing_silence_duration_seconds=_parse_env_float("TRIMLY_MIN_SILENCE_DUR", MIN_PROCESSING_SILENCE_DURATION_SECONDS),
          max_processing_silence_duration_seconds=_parse_env_float("TRIMLY_MAX_SILENCE_DUR", MAX_PROCESSING_SILENCE_DURATION_SECONDS),
+
+         # Load hung-job detection
+         progress_stall_timeout_seconds=_parse_env_float("TRIMLY_STALL_TIMEOUT", PROGRESS_STALL_TIMEOUT_SECONDS),
+
+         # Load input limits
+         max_input_file_size_mb=_parse_env_float("TRIMLY_MAX_FILE_SIZE_MB", MAX_INPUT_FILE_SIZE_MB),
+         max_input_duration_seconds=_parse_env_float("TRIMLY_MAX_DURATION", MAX_INPUT_DURATION_SECONDS),
+         processing_timeout_per_audio_second=_parse_env_float("TRIMLY_TIMEOUT_PER_AUDIO_SECOND", PROCESSING_TIMEOUT_PER_AUDIO_SECOND),
+
+         # Load media probe settings
+         media_probe_enabled=_parse_env_bool("TRIMLY_MEDIA_PROBE", MEDIA_PROBE_ENABLED),
+         media_probe_cache_max_entries=_parse_env_int("TRIMLY_MEDIA_PROBE_CACHE_ENTRIES", MEDIA_PROBE_CACHE_MAX_ENTRIES),
+
+         # Load batch processing settings
+         batch_max_workers=_parse_env_int("TRIMLY_BATCH_MAX_WORKERS", DEFAULT_BATCH_MAX_WORKERS),
+         async_max_concurrent_processes=_parse_env_int("TRIMLY_ASYNC_MAX_PROCESSES", DEFAULT_ASYNC_MAX_CONCURRENT_PROCESSES),
+         batch_pack_max_inputs=_parse_env_int("TRIMLY_BATCH_PACK_MAX_INPUTS", BATCH_PACK_MAX_INPUTS),
+         batch_pack_max_seconds=_parse_env_float("TRIMLY_BATCH_PACK_MAX_SECONDS", BATCH_PACK_MAX_SECONDS),
+         batch_pack_max_clip_seconds=_parse_env_float("TRIMLY_BATCH_PACK_MAX_CLIP", BATCH_PACK_MAX_CLIP_SECONDS),
+
+         # Load job scheduler settings
+         scheduler_max_workers=_parse_env_int("TRIMLY_SCHEDULER_WORKERS", DEFAULT_SCHEDULER_MAX_WORKERS),
+         scheduler_max_queue=_parse_env_int("TRIMLY_SCHEDULER_QUEUE", DEFAULT_SCHEDULER_MAX_QUEUE),
+
+         # Load FFmpeg resource limits
+         ffmpeg_threads=_parse_env_int("TRIMLY_FFMPEG_THREADS", FFMPEG_THREADS),
+         ffmpeg_filter_threads=_parse_env_int("TRIMLY_FFMPEG_FILTER_THREADS", FFMPEG_FILTER_THREADS),
+         ffmpeg_cpu_affinity=_parse_env_str("TRIMLY_FFMPEG_CPUS", FFMPEG_CPU_AFFINITY),
+         ffmpeg_cores_per_job=_parse_env_int("TRIMLY_FFMPEG_CORES_PER_JOB", FFMPEG_CORES_PER_JOB),
+         ffmpeg_nice=_parse_env_int("TRIMLY_FFMPEG_NICE", FFMPEG_NICE),
+         ffmpeg_memory_limit_mb=_parse_env_float("TRIMLY_FFMPEG_MEMORY_LIMIT_MB", FFMPEG_MEMORY_LIMIT_MB),
+
+         # Load split-and-parallelize settings
+         split_min_chunk_seconds=_parse_env_float("TRIMLY_SPLIT_MIN_CHUNK", SPLIT_MIN_CHUNK_SECONDS),
+
+         # Load streaming settings
+         stream_chunk_size_bytes=_parse_env_int("TRIMLY_STREAM_CHUNK_SIZE", STREAM_CHUNK_SIZE_BYTES),
+
+         # Load silence analysis settings
+         analysis_engine=_parse_env_str("TRIMLY_ANALYSIS_ENGINE", DEFAULT_ANALYSIS_ENGINE),
+         analysis_detection_mode=_parse_env_str("TRIMLY_DETECTION_MODE", DEFAULT_DETECTION_MODE),
+         analysis_window_seconds=_parse_env_float("TRIMLY_ANALYSIS_WINDOW", ANALYSIS_WINDOW_SECONDS),
+
+         # Load pre-flight scan settings
+         preflight_min_removed_seconds=_parse_env_float("TRIMLY_PREFLIGHT_MIN_REMOVED", PREFLIGHT_MIN_REMOVED_SECONDS),
+
+         # Load result cache settings
+         result_cache_enabled=_parse_env_bool("TRIMLY_RESULT_CACHE", RESULT_CACHE_ENABLED),
+         result_cache_max_size_mb=_parse_env_float("TRIMLY_RESULT_CACHE_MAX_MB", RESULT_CACHE_MAX_SIZE_MB),
+         result_cache_max_entries=_parse_env_int("TRIMLY_RESULT_CACHE_MAX_ENTRIES", RESULT_CACHE_MAX_ENTRIES),
+
+         # Load decoded PCM cache settings
+         pcm_cache_enabled=_parse_env_bool("TRIMLY_PCM_CACHE", PCM_CACHE_ENABLED),
+         pcm_cache_max_size_mb=_parse_env_float("TRIMLY_PCM_CACHE_MAX_MB", PCM_CACHE_MAX_SIZE_MB),
+         pcm_cache_max_age_seconds=_parse_env_float("TRIMLY_PCM_CACHE_MAX_AGE", PCM_CACHE_MAX_AGE_SECONDS),
+
+         # Load instrumentation settings
+         metrics_enabled=_parse_env_bool("TRIMLY_METRICS", METRICS_ENABLED),
+
+         # Load the default processing chain
+         processing_chain=_parse_env_str("TRIMLY_PROCESSING_CHAIN", PROCESSING_CHAIN),
       )
 
 
@@ -99,6 +309,8 @@ class TrimlyConfig:
       Validate configuration settings and optionally runtime parameters to ensure they are within acceptable ranges
       and follow required formats.
 
+      Every instance is already validated on construction; per-call code should use `validate_parameters`.
+
       Args:
           threshold: Optional silence threshold in dB to validate
           min_silence: Optional minimum silence duration in seconds to validate
@@ -130,6 +342,151 @@ class TrimlyConfig:
             f"between {self.min_silence_threshold_db} dB and {self.max_silence_threshold_db} dB."
          )
 
+      # Ensure the automatic threshold measures a noise floor below the speech level
+      if not (0 < self.auto_threshold_percentile < 50):
+         errors.append(f"Auto threshold percentile ({self.auto_threshold_percentile}) must be between 0 and 50.")
+      if self.auto_threshold_margin_db < 0:
+         errors.append(f"Auto threshold margin ({self.auto_threshold_margin_db} dB) must not be negative.")
+
+      # Ensure temp storage limits are usable (0 disables the quota or TTL)
+      if self.temp_storage_quota_mb < 0 or self.temp_file_ttl_seconds < 0:
+         errors.append(
+            f"Temp storage quota ({self.temp_storage_quota_mb} MB) and TTL ({self.temp_file_ttl_seconds}s) "
+            f"must not be negative."
+         )
+      if self.temp_sweep_interval_seconds <= 0:
+         errors.append(f"Temp sweep interval ({self.temp_sweep_interval_seconds}s) must be positive.")
+
+      # Ensure the output encoding settings are usable
+      if self.output_audio_format not in OUTPUT_AUDIO_ENCODERS:
+         errors.append(
+            f"Output format ({self.output_audio_format}) must be one of: {', '.join(OUTPUT_AUDIO_ENCODERS)}."
+         )
+      if self.output_sample_rate is not None and self.output_sample_rate <= 0:
+         errors.append(f"Output sample rate ({self.output_sample_rate} Hz) must be positive.")
+      if self.output_channels is not None and self.output_channels <= 0:
+         errors.append(f"Output channel count ({self.output_channels}) must be positive.")
+
+      # Ensure the stall timeout is usable (0 disables it)
+      if self.progress_stall_timeout_seconds < 0:
+         errors.append(f"Progress stall timeout ({self.progress_stall_timeout_seconds}s) must not be negative.")
+
+      # Ensure input limits are usable (0 disables the size limit, the duration limit and timeout scaling)
+      if self.max_input_file_size_mb < 0:
+         errors.append(f"Max input file size ({self.max_input_file_size_mb} MB) must not be negative.")
+      if self.max_input_duration_seconds < 0 or self.processing_timeout_per_audio_second < 0:
+         errors.append(
+            f"Max input duration ({self.max_input_duration_seconds}s) and timeout per audio second "
+            f"({self.processing_timeout_per_audio_second}s) must not be negative."
+         )
+      if self.media_probe_cache_max_entries < 1:
+         errors.append(f"Media probe cache size ({self.media_probe_cache_max_entries}) must be at least 1.")
+
+      # Ensure the batch worker count is not negative (0 selects one worker per CPU core)
+      if self.batch_max_workers < 0:
+         errors.append(f"Batch max workers ({self.batch_max_workers}) must be 0 (auto) or a positive integer.")
+
+      # Ensure a packed batch holds at least one clip
+      if self.batch_pack_max_inputs < 1:
+         errors.append(f"Batch pack max inputs ({self.batch_pack_max_inputs}) must be at least 1.")
+      if self.batch_pack_max_seconds <= 0 or self.batch_pack_max_clip_seconds <= 0:
+         errors.append(
+            f"Batch pack max seconds ({self.batch_pack_max_seconds}s) and max clip length "
+            f"({self.batch_pack_max_clip_seconds}s) must be positive."
+         )
+
+      # Ensure the async process cap is not negative (0 selects one process per CPU core)
+      if self.async_max_concurrent_processes < 0:
+         errors.append(
+            f"Async max concurrent processes ({self.async_max_concurrent_processes}) must be 0 (auto) or a positive integer."
+         )
+
+      # Ensure the scheduler can run and queue at least one job (0 workers selects one per CPU core)
+      if self.scheduler_max_workers < 0:
+         errors.append(f"Scheduler max workers ({self.scheduler_max_workers}) must be 0 (auto) or a positive integer.")
+      if self.scheduler_max_queue < 1:
+         errors.append(f"Scheduler max queue ({self.scheduler_max_queue}) must be at least 1.")
+
+      # Ensure the FFmpeg resource limits are usable (0 / "" keeps the FFmpeg and OS defaults)
+      if self.ffmpeg_threads < 0 or self.ffmpeg_filter_threads < 0 or self.ffmpeg_cores_per_job < 0:
+         errors.append(
+            f"FFmpeg threads ({self.ffmpeg_threads}), filter threads ({self.ffmpeg_filter_threads}) and "
+            f"cores per job ({self.ffmpeg_cores_per_job}) must not be negative."
+         )
+      try:
+         parse_cpu_list(self.ffmpeg_cpu_affinity)
+      except ValueError:
+         errors.append(f"FFmpeg CPU affinity ({self.ffmpeg_cpu_affinity}) must be a CPU list such as '0-3,8'.")
+      if not (-20 <= self.ffmpeg_nice <= 19):
+         errors.append(f"FFmpeg nice level ({self.ffmpeg_nice}) must be between -20 and 19.")
+      if self.ffmpeg_memory_limit_mb < 0:
+         errors.append(f"FFmpeg memory limit ({self.ffmpeg_memory_limit_mb} MB) must not be negative.")
+
+      # Ensure split chunks have a usable minimum length
+      if self.split_min_chunk_seconds <= 0:
+         errors.append(f"Split minimum chunk length ({self.split_min_chunk_seconds}s) must be positive.")
+
+      # Ensure streaming reads make progress
+      if self.stream_chunk_size_bytes <= 0:
+         errors.append(f"Stream chunk size ({self.stream_chunk_size_bytes} bytes) must be positive.")
+
+      # Ensure the analysis engine and its detection mode are supported
+      if self.analysis_engine not in ANALYSIS_ENGINES:
+         errors.append(f"Analysis engine ({self.analysis_engine}) must be one of: {', '.join(ANALYSIS_ENGINES)}.")
+      if self.analysis_detection_mode not in ("peak", "rms"):
+         errors.append(f"Detection mode ({self.analysis_detection_mode}) must be 'peak' or 'rms'.")
+      if self.analysis_window_seconds <= 0:
+         errors.append(f"Analysis window ({self.analysis_window_seconds}s) must be positive.")
+
+      # Ensure the pre-flight threshold is not negative (0 disables the scan)
+      if self.preflight_min_removed_seconds < 0:
+         errors.append(f"Pre-flight minimum removed silence ({self.preflight_min_removed_seconds}s) must not be negative.")
+
+      # Ensure the result cache bounds are usable
+      if self.result_cache_max_size_mb <= 0 or self.result_cache_max_entries <= 0:
+         errors.append(
+            f"Result cache limits ({self.result_cache_max_size_mb} MB, {self.result_cache_max_entries} entries) "
+            f"must both be positive."
+         )
+
+      # Ensure the decoded PCM cache bounds are usable
+      if self.pcm_cache_max_size_mb <= 0 or self.pcm_cache_max_age_seconds <= 0:
+         errors.append(
+            f"PCM cache limits ({self.pcm_cache_max_size_mb} MB, {self.pcm_cache_max_age_seconds}s) "
+            f"must both be positive."
+         )
+
+      # Ensure the default processing chain parses and its stages are valid
+      try:
+         ProcessingChain.parse(self.processing_chain)
+      except ValueError as e:
+         errors.append(f"Processing chain ({self.processing_chain}): {e}")
+
+      errors += self._parameter_errors(threshold, min_silence, start_silence)
+
+      # Raise exception if any config validation checks fail
+      if errors:
+         raise ValueError("Configuration validation failed:\n" + "\n".join(f"- {error}" for error in errors))
+
+   def validate_parameters(self, threshold: float = None, min_silence: float = None, start_silence: float = None) -> None:
+      """
+      Validate runtime parameters against the configured bounds, without re-checking the configuration itself.
+
+      Args:
+          threshold: Optional silence threshold in dB to validate
+          min_silence: Optional minimum silence duration in seconds to validate
+          start_silence: Optional start silence keep duration in seconds to validate
+
+      Raises:
+         ValueError: If any parameter is out of range.
+      """
+      errors = self._parameter_errors(threshold, min_silence, start_silence)
+      if errors:
+         raise ValueError("Configuration validation failed:\n" + "\n".join(f"- {error}" for error in errors))
+
+   def _parameter_errors(self, threshold: Optional[float], min_silence: Optional[float], start_silence: Optional[float]) -> List[str]:
+      errors = []
+
       # Validate runtime parameters if provided
       if threshold is not None:
           if not (self.min_silence_threshold_db <= threshold <= self.max_silence_threshold_db):
@@ -153,15 +510,15 @@ class TrimlyConfig:
                   f"Start silence duration ({start_silence}s) must be between "
                   f"{self.min_processing_silence_duration_seconds}s and {self.max_processing_silence_duration_seconds}s."
               )
-
-      # Raise exception if any config validation checks fail
-      if errors:
-         raise ValueError("Configuration validation failed:\n" + "\n".join(f"- {error}" for error in errors))
+      return errors
    
    
-   # Ensure temp_directory is always an absolute path, even if TrimlyConfig is instantiated directly
+   # Ensure temp_directory is always an absolute path, even if TrimlyConfig is instantiated directly, and validate the
+   # instance once here (including `dataclasses.replace` copies) so the per-call path only checks its own parameters
    def __post_init__(self):
       object.__setattr__(self, "temp_directory", os.path.abspath(self.temp_directory))
+      object.__setattr__(self, "output_audio_format", normalize_output_format(self.output_audio_format))
+      self.validate()
 
 
 # Global Configuration Management
@@ -173,7 +530,7 @@ def get_config() -> TrimlyConfig:
    Retrieves the global configuration instance for the application.
 
    If the configuration has not been loaded yet, it attempts to create it
-   from environment variables and then validates it.
+   from environment variables, which validates it.
 
    Returns:
       The singleton TrimlyConfig instance.
@@ -185,7 +542,6 @@ def get_config() -> TrimlyConfig:
    global _config
    if _config is None:
       _config = TrimlyConfig.from_env()
-      _config.validate()
       os.makedirs(_config.temp_directory, exist_ok=True)
    return _config
 
@@ -194,16 +550,12 @@ def set_config(config: TrimlyConfig) -> None:
    """
    Sets the global configuration instance to a new TrimlyConfig object.
 
-   The provided configuration instance is validated before being set.
+   The provided configuration instance was validated when it was constructed.
 
    Args:
       config: The new TrimlyConfig instance to set.
-
-   Raises:
-      ValueError: If the provided configuration fails validation.
    """
    global _config
-   config.validate()
    _config = config
 
 
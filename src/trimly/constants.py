@@ -9,6 +9,33 @@ except PackageNotFoundError:
 DEFAULT_TEMP_DIRECTORY = "storage/tmp"
 PROCESSED_FILE_PREFIX = "trimmed_"
 DEFAULT_OUTPUT_AUDIO_FORMAT = ".wav"
+DEFAULT_OUTPUT_SAMPLE_RATE = None  # None = keep the input sample rate
+DEFAULT_OUTPUT_CHANNELS = None  # None = keep the input channel layout
+DEFAULT_OUTPUT_BITRATE = None  # None = encoder default
+
+# Output Encoders (encoding happens in the same FFmpeg pass as trimming)
+OUTPUT_AUDIO_ENCODERS = {
+    ".wav": "pcm_s16le",
+    ".flac": "flac",
+    ".opus": "libopus",
+    ".ogg": "libvorbis",
+    ".mp3": "libmp3lame",
+    ".m4a": "aac"
+}
+# Codec each output encoder produces, as probing reports it for an existing file
+OUTPUT_AUDIO_CODECS = {
+    ".wav": "pcm_s16le",
+    ".flac": "flac",
+    ".opus": "opus",
+    ".ogg": "vorbis",
+    ".mp3": "mp3",
+    ".m4a": "aac"
+}
+LOSSLESS_OUTPUT_FORMATS = {".wav", ".flac"}
+CACHE_SUBDIRECTORY = ".cache"
+TEMP_STORAGE_QUOTA_MB = 5120.0  # 0 = unlimited
+TEMP_FILE_TTL_SECONDS = 6 * 60 * 60  # 0 = never expire
+TEMP_SWEEP_INTERVAL_SECONDS = 60.0
 
 # Supported Media Formats
 SUPPORTED_AUDIO_FORMATS = {
@@ -24,13 +51,108 @@ DEFAULT_SILENCE_THRESHOLD_DB = -45.0
 DEFAULT_MIN_SILENCE_DURATION_SECONDS = 0.05
 DEFAULT_START_SILENCE_KEEP_DURATION_SECONDS = 0.1
 
+# Automatic Threshold (threshold="auto")
+AUTO_THRESHOLD = "auto"
+AUTO_THRESHOLD_ENABLED = False  # Use the automatic threshold when none is given
+AUTO_THRESHOLD_PERCENTILE = 10.0  # Window-level percentile taken as the noise floor
+AUTO_THRESHOLD_MARGIN_DB = 6.0  # Headroom above the noise floor
+AUTO_THRESHOLD_MIN_DYNAMIC_RANGE_DB = 10.0  # Below this floor-to-speech gap there is no silence to remove
+
 # Processing Limits and Validation Ranges
 MIN_SILENCE_THRESHOLD_DB = -100.0
 MAX_SILENCE_THRESHOLD_DB = 0.0
 MIN_PROCESSING_SILENCE_DURATION_SECONDS = 0.001
 MAX_PROCESSING_SILENCE_DURATION_SECONDS = 10.0
-MAX_INPUT_FILE_SIZE_MB = 200.0
+MAX_INPUT_FILE_SIZE_MB = 200.0  # 0 = unlimited
 PROCESSING_OPERATION_TIMEOUT_SECONDS = 300
+PROGRESS_STALL_TIMEOUT_SECONDS = 30.0  # 0 = only the hard timeout applies
+MAX_INPUT_DURATION_SECONDS = 4 * 60 * 60  # 0 = unlimited
+# Per-job timeouts scale with the probed duration, capped at PROCESSING_OPERATION_TIMEOUT_SECONDS
+PROCESSING_TIMEOUT_BASE_SECONDS = 30.0
+PROCESSING_TIMEOUT_PER_AUDIO_SECOND = 0.25  # 0 = always use the full operation timeout
+
+# Media Probe
+MEDIA_PROBE_ENABLED = True
+MEDIA_PROBE_TIMEOUT_SECONDS = 10.0
+MEDIA_PROBE_CACHE_MAX_ENTRIES = 1024
+
+# Batch Processing
+DEFAULT_BATCH_MAX_WORKERS = 0  # 0 = one worker per CPU core
+DEFAULT_ASYNC_MAX_CONCURRENT_PROCESSES = 0  # 0 = one FFmpeg process per CPU core
+# Packed batches (trim_batch(pack=True)): short clips share one FFmpeg process
+BATCH_PACK_MAX_INPUTS = 16
+BATCH_PACK_MAX_SECONDS = 300.0  # Total audio per packed process
+BATCH_PACK_MAX_CLIP_SECONDS = 30.0  # Longer clips are trimmed on their own
+
+# Job Scheduler
+SCHEDULER_PRIORITY_CLASSES = ("interactive", "normal", "batch")  # Highest priority first
+DEFAULT_SCHEDULER_MAX_WORKERS = 0  # 0 = one FFmpeg process per CPU core
+DEFAULT_SCHEDULER_MAX_QUEUE = 64
+SCHEDULER_WAIT_SAMPLE_SIZE = 1024
+
+# FFmpeg Resource Limits (0 / "" = FFmpeg and OS defaults)
+FFMPEG_THREADS = 0
+FFMPEG_FILTER_THREADS = 0
+FFMPEG_CPU_AFFINITY = ""  # Linux CPU list, e.g. "0-3,8"
+FFMPEG_CORES_PER_JOB = 0  # Pin each job to its own slice of this many cores
+FFMPEG_NICE = 0
+FFMPEG_MEMORY_LIMIT_MB = 0.0  # Address-space limit per FFmpeg process
+
+# Split-and-Parallelize Processing
+SPLIT_MIN_CHUNK_SECONDS = 60.0
+
+# Streaming
+STREAM_CHUNK_SIZE_BYTES = 64 * 1024
+# Leading bytes of in-memory data probed for the sample rate loudnorm must restore
+BUFFER_PROBE_BYTES = 1024 * 1024
+# FFmpeg demuxer for each input format sniffed from in-memory data, and muxer for each output written to a pipe
+INPUT_DEMUXERS = {
+    ".mp3": "mp3",
+    ".wav": "wav",
+    ".m4a": "mov",
+    ".flac": "flac",
+    ".ogg": "ogg"
+}
+PIPE_OUTPUT_MUXERS = {
+    ".wav": "wav",
+    ".flac": "flac",
+    ".opus": "opus",
+    ".ogg": "ogg",
+    ".mp3": "mp3",
+    ".m4a": "mp4"
+}
+
+# Silence Analysis
+ANALYSIS_ENGINES = ("ffmpeg", "numpy")
+DEFAULT_ANALYSIS_ENGINE = "ffmpeg"
+DEFAULT_DETECTION_MODE = "peak"
+ANALYSIS_WINDOW_SECONDS = 0.02
+
+# Pre-flight Scan (inputs with less removable silence are copied instead of trimmed)
+PREFLIGHT_MIN_REMOVED_SECONDS = 0.0  # 0 = always trim
+PREFLIGHT_SAMPLE_RATE = 8000  # the scan decodes to mono at this rate
+
+# Result Cache
+RESULT_CACHE_ENABLED = True
+RESULT_CACHE_MAX_SIZE_MB = 1024.0
+RESULT_CACHE_MAX_ENTRIES = 256
+
+# Decoded PCM Cache
+PCM_CACHE_ENABLED = True
+PCM_CACHE_MAX_SIZE_MB = 2048.0
+PCM_CACHE_MAX_AGE_SECONDS = 24 * 60 * 60
+PCM_CACHE_MAX_ENTRY_FRACTION = 0.5  # a trim's decode is only kept when it fills at most this share of the cache
+
+# Instrumentation
+METRICS_ENABLED = True
+METRICS_LATENCY_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+METRICS_REALTIME_FACTOR_BUCKETS = (1.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0)
+
+# Processing Chain (stages compiled into one filter graph, e.g. "highpass:80,silence,loudnorm,resample:48000")
+PROCESSING_CHAIN = "silence"
+# A fade-out reverses the audio in FFmpeg's memory to stay in one pass when its decode (at 8 bytes per sample) fits this;
+# longer inputs count their samples in a separate pass instead
+FADE_OUT_REVERSE_MAX_BYTES = 512 * 1024 * 1024
 
 # FFmpeg Configuration
 FFMPEG_SILENCE_FILTER_TEMPLATE = (
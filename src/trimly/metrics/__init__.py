@@ -0,0 +1,17 @@
+from .instrumentation import JobReport, track_job, stage, annotate, record_failure
+from .registry import Histogram, MetricsRegistry, get_metrics_registry
+from .exporters import to_prometheus_text, to_json, serve_metrics
+
+__all__ = [
+    "JobReport",
+    "track_job",
+    "stage",
+    "annotate",
+    "record_failure",
+    "Histogram",
+    "MetricsRegistry",
+    "get_metrics_registry",
+    "to_prometheus_text",
+    "to_json",
+    "serve_metrics"
+]
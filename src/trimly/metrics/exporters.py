@@ -0,0 +1,117 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+from .registry import MetricsRegistry
+
+_HELP = {
+    "trimly_jobs_total": ("counter", "Finished operations by outcome."),
+    "trimly_failures_total": ("counter", "Failed operations by reason."),
+    "trimly_input_bytes_total": ("counter", "Bytes of input read."),
+    "trimly_output_bytes_total": ("counter", "Bytes of output written."),
+    "trimly_input_audio_seconds_total": ("counter", "Seconds of input audio processed."),
+    "trimly_child_cpu_seconds_total": ("counter", "CPU seconds used by FFmpeg child processes (process-wide approximation)."),
+    "trimly_child_max_rss_bytes": ("gauge", "Peak resident set size of the largest FFmpeg child process since startup."),
+    "trimly_temp_storage_files": ("gauge", "Outputs and partial files in temp storage."),
+    "trimly_temp_storage_bytes": ("gauge", "Bytes used by outputs and partial files in temp storage."),
+    "trimly_temp_storage_quota_bytes": ("gauge", "Temp storage byte quota (0 = unlimited)."),
+    "trimly_temp_storage_evicted_files": ("gauge", "Files evicted from temp storage since startup."),
+    "trimly_temp_storage_evicted_bytes": ("gauge", "Bytes evicted from temp storage since startup."),
+    "trimly_stage_seconds": ("histogram", "Wall-clock seconds per operation stage."),
+    "trimly_realtime_factor": ("histogram", "Seconds of audio processed per second of FFmpeg wall time.")
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in sorted(labels.items())) + "}"
+
+
+def _header(lines: List[str], name: str) -> None:
+    kind, description = _HELP.get(name, ("untyped", name))
+    lines.append(f"# HELP {name} {description}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def to_prometheus_text(registry: MetricsRegistry) -> str:
+    """
+    Render the registry in the Prometheus text exposition format (version 0.0.4).
+
+    Args:
+        registry (MetricsRegistry): The registry to export.
+
+    Returns:
+        str: Exposition text, ready to serve with content type `text/plain; version=0.0.4`.
+    """
+    snapshot = registry.snapshot()
+    lines: List[str] = []
+
+    for section in ("counters", "gauges"):
+        for name, series in sorted(snapshot[section].items()):
+            _header(lines, name)
+            for sample in series:
+                lines.append(f"{name}{_format_labels(sample['labels'])} {sample['value']}")
+
+    for name, series in sorted(snapshot["histograms"].items()):
+        _header(lines, name)
+        for sample in series:
+            labels = sample["labels"]
+            for bound, count in sample["buckets"]:
+                lines.append(f"{name}_bucket{_format_labels({**labels, 'le': str(bound)})} {count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {sample['sum']}")
+            lines.append(f"{name}_count{_format_labels(labels)} {sample['count']}")
+
+    return "\n".join(lines) + "\n"
+
+
+def to_json(registry: MetricsRegistry, indent: int = 2) -> str:
+    """
+    Render the registry snapshot as JSON.
+    """
+    return json.dumps(registry.snapshot(), indent=indent)
+
+
+def serve_metrics(registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9464) -> ThreadingHTTPServer:
+    """
+    Serve the registry over HTTP from a daemon thread.
+
+    `/metrics` returns Prometheus text and `/metrics.json` returns JSON. The
+    server binds to localhost by default; call `shutdown()` on the returned
+    server to stop it.
+
+    Args:
+        registry (MetricsRegistry): The registry to expose.
+        host (str): Interface to bind.
+        port (int): Port to bind; 0 picks a free port (see `server.server_port`).
+
+    Returns:
+        ThreadingHTTPServer: The running server.
+    """
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                body, content_type = to_prometheus_text(registry), "text/plain; version=0.0.4; charset=utf-8"
+            elif self.path == "/metrics.json":
+                body, content_type = to_json(registry), "application/json"
+            else:
+                self.send_error(404)
+                return
+            payload = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="trimly-metrics", daemon=True).start()
+    return server
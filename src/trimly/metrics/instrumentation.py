@@ -0,0 +1,166 @@
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+@dataclass
+class JobReport:
+    """
+    Timings and resource usage of one Trimly operation.
+
+    Attributes:
+        operation (str): Name of the instrumented entry point, e.g. "trim_audio".
+        stages (Dict[str, float]): Wall-clock seconds spent in each named stage.
+        wall_seconds (float): Wall-clock seconds for the whole operation.
+        input_bytes (int): Size of the input file.
+        output_bytes (int): Size of the output file.
+        input_duration (Optional[float]): Input audio duration in seconds, if known.
+        cache_hit (bool): Whether the result was served from the result cache.
+        failure (Optional[str]): Short failure reason, or None on success.
+        child_cpu_user_seconds (float): User CPU time of child processes reaped during the operation.
+        child_cpu_system_seconds (float): System CPU time of those child processes.
+        child_max_rss_bytes (int): Peak resident set size of the largest child process
+            this Python process has reaped so far, not only during this operation.
+
+    Child resource figures are process-wide approximations taken from
+    `getrusage(RUSAGE_CHILDREN)`. With several operations running concurrently,
+    each report's CPU delta also includes children that other operations reaped
+    meanwhile, so summing reports overcounts; take one `RUSAGE_CHILDREN` delta
+    around the whole workload for an exact total. `child_max_rss_bytes` is a
+    high-water mark for the process lifetime and never goes down. All three are
+    zero on platforms without the `resource` module.
+    """
+    operation: str
+    stages: Dict[str, float] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+    input_bytes: int = 0
+    output_bytes: int = 0
+    input_duration: Optional[float] = None
+    cache_hit: bool = False
+    failure: Optional[str] = None
+    child_cpu_user_seconds: float = 0.0
+    child_cpu_system_seconds: float = 0.0
+    child_max_rss_bytes: int = 0
+
+    @property
+    def realtime_factor(self) -> Optional[float]:
+        """Seconds of audio processed per wall-clock second of FFmpeg work (or of the whole job)."""
+        elapsed = self.stages.get("ffmpeg") or self.wall_seconds
+        if not self.input_duration or not elapsed or self.cache_hit:
+            return None
+        return self.input_duration / elapsed
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "operation": self.operation,
+            "stages": dict(self.stages),
+            "wall_seconds": self.wall_seconds,
+            "input_bytes": self.input_bytes,
+            "output_bytes": self.output_bytes,
+            "input_duration": self.input_duration,
+            "realtime_factor": self.realtime_factor,
+            "cache_hit": self.cache_hit,
+            "failure": self.failure,
+            "child_cpu_user_seconds": self.child_cpu_user_seconds,
+            "child_cpu_system_seconds": self.child_cpu_system_seconds,
+            "child_max_rss_bytes": self.child_max_rss_bytes
+        }
+
+
+_current_report: ContextVar[Optional[JobReport]] = ContextVar("trimly_current_report", default=None)
+
+
+def _child_usage():
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_CHILDREN)
+
+
+@contextmanager
+def track_job(registry: Optional[Any], operation: str) -> Iterator[Optional[JobReport]]:
+    """
+    Instrument an operation and record its JobReport in `registry` when it ends.
+
+    Stages, annotations and failures reported through `stage`, `annotate` and
+    `record_failure` inside the block (including from threads started with
+    `asyncio.to_thread`, which copy the context) are attached to this report.
+    Nested calls record into the outermost report.
+
+    Args:
+        registry (Optional[MetricsRegistry]): Destination, or None to disable instrumentation.
+        operation (str): Name the report is labelled with.
+
+    Yields:
+        Optional[JobReport]: The report being filled in, or None when disabled or nested.
+    """
+    if registry is None or _current_report.get() is not None:
+        yield None
+        return
+
+    report = JobReport(operation)
+    token = _current_report.set(report)
+    usage_before = _child_usage()
+    started = time.perf_counter()
+    try:
+        yield report
+    except BaseException as e:
+        report.failure = report.failure or type(e).__name__
+        raise
+    finally:
+        report.wall_seconds = time.perf_counter() - started
+        usage_after = _child_usage()
+        if usage_before is not None and usage_after is not None:
+            report.child_cpu_user_seconds = usage_after.ru_utime - usage_before.ru_utime
+            report.child_cpu_system_seconds = usage_after.ru_stime - usage_before.ru_stime
+            # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+            scale = 1 if sys.platform == "darwin" else 1024
+            report.child_max_rss_bytes = usage_after.ru_maxrss * scale
+        _current_report.reset(token)
+        registry.record(report)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Time a named stage of the current operation; a no-op outside `track_job`.
+
+    Repeated stages with the same name accumulate.
+    """
+    report = _current_report.get()
+    if report is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        report.stages[name] = report.stages.get(name, 0.0) + time.perf_counter() - started
+
+
+def annotate(**fields: Any) -> None:
+    """
+    Set JobReport fields (input_bytes, output_bytes, input_duration, cache_hit) on the current operation.
+    """
+    report = _current_report.get()
+    if report is None:
+        return
+    for key, value in fields.items():
+        setattr(report, key, value)
+
+
+def record_failure(reason: str) -> None:
+    """
+    Mark the current operation as failed with a short, low-cardinality reason such as "timeout".
+    """
+    report = _current_report.get()
+    if report is not None and report.failure is None:
+        report.failure = reason
@@ -0,0 +1,202 @@
+import threading
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..constants import METRICS_LATENCY_BUCKETS_SECONDS, METRICS_REALTIME_FACTOR_BUCKETS
+from .instrumentation import JobReport
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """
+    Cumulative histogram with fixed upper bounds, in the Prometheus layout.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """
+        Returns:
+            List[Tuple[float, int]]: (upper_bound, observations <= bound) pairs, ending with +inf.
+        """
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class MetricsRegistry:
+    """
+    Process-wide store for job metrics, plus a hook for custom listeners.
+
+    Every finished JobReport updates:
+        - trimly_jobs_total{operation, outcome}
+        - trimly_failures_total{operation, reason}
+        - trimly_stage_seconds{operation, stage} (histogram)
+        - trimly_realtime_factor{operation} (histogram)
+        - trimly_input_bytes_total / trimly_output_bytes_total / trimly_input_audio_seconds_total
+        - trimly_child_cpu_seconds_total{mode}
+        - trimly_child_max_rss_bytes (gauge, high-water mark for the process lifetime)
+
+    Listeners registered with `add_listener` receive each JobReport after it is
+    recorded; exceptions they raise are swallowed so metrics never fail a job.
+    Collectors registered with `add_collector` are sampled on every snapshot and
+    report current state, such as temp storage usage, as gauges.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[JobReport], Any]] = []
+        self._collectors: Dict[Labels, Callable[[], Dict[str, float]]] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters: Dict[str, Dict[Labels, float]] = {}
+            self.gauges: Dict[str, Dict[Labels, float]] = {}
+            self.histograms: Dict[str, Dict[Labels, Histogram]] = {}
+
+    def add_listener(self, listener: Callable[[JobReport], Any]) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[JobReport], Any]) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def add_collector(self, collect: Callable[[], Dict[str, float]], labels: Optional[Dict[str, str]] = None) -> None:
+        """
+        Sample `collect()` on every snapshot, exporting each returned name and value as a gauge with `labels`.
+
+        A later collector with the same labels replaces the earlier one, so
+        registering per shared resource (e.g. per directory) never duplicates series.
+        """
+        with self._lock:
+            self._collectors[tuple(sorted((labels or {}).items()))] = collect
+
+    def record(self, report: JobReport) -> None:
+        """
+        Fold a finished job into the metrics and notify listeners.
+        """
+        operation = report.operation
+        with self._lock:
+            outcome = "failure" if report.failure else ("cached" if report.cache_hit else "success")
+            self._inc("trimly_jobs_total", {"operation": operation, "outcome": outcome})
+            if report.failure:
+                self._inc("trimly_failures_total", {"operation": operation, "reason": report.failure})
+
+            for stage, seconds in report.stages.items():
+                self._observe(
+                    "trimly_stage_seconds", {"operation": operation, "stage": stage}, seconds, METRICS_LATENCY_BUCKETS_SECONDS
+                )
+            self._observe(
+                "trimly_stage_seconds", {"operation": operation, "stage": "total"}, report.wall_seconds, METRICS_LATENCY_BUCKETS_SECONDS
+            )
+
+            if report.realtime_factor is not None:
+                self._observe(
+                    "trimly_realtime_factor", {"operation": operation}, report.realtime_factor, METRICS_REALTIME_FACTOR_BUCKETS
+                )
+
+            self._inc("trimly_input_bytes_total", {"operation": operation}, report.input_bytes)
+            self._inc("trimly_output_bytes_total", {"operation": operation}, report.output_bytes)
+            if report.input_duration:
+                self._inc("trimly_input_audio_seconds_total", {"operation": operation}, report.input_duration)
+
+            self._inc("trimly_child_cpu_seconds_total", {"mode": "user"}, report.child_cpu_user_seconds)
+            self._inc("trimly_child_cpu_seconds_total", {"mode": "system"}, report.child_cpu_system_seconds)
+            if report.child_max_rss_bytes:
+                self.gauges.setdefault("trimly_child_max_rss_bytes", {})[()] = report.child_max_rss_bytes
+
+            listeners = list(self._listeners)
+
+        for listener in listeners:
+            try:
+                listener(report)
+            except Exception:
+                pass
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: JSON-serializable copy of every counter, gauge and histogram.
+        """
+        with self._lock:
+            collectors = list(self._collectors.items())
+        sampled: Dict[str, Dict[Labels, float]] = {}
+        for labels, collect in collectors:
+            try:
+                values = collect()
+            except Exception:
+                continue
+            for name, value in values.items():
+                sampled.setdefault(name, {})[labels] = value
+
+        with self._lock:
+            gauges = {name: dict(values) for name, values in self.gauges.items()}
+            for name, values in sampled.items():
+                gauges.setdefault(name, {}).update(values)
+            return {
+                "counters": {name: _series(values) for name, values in self.counters.items()},
+                "gauges": {name: _series(values) for name, values in gauges.items()},
+                "histograms": {
+                    name: [
+                        {
+                            "labels": dict(labels),
+                            "count": histogram.count,
+                            "sum": histogram.sum,
+                            "buckets": [[_bound(bound), count] for bound, count in histogram.cumulative()]
+                        }
+                        for labels, histogram in values.items()
+                    ]
+                    for name, values in self.histograms.items()
+                }
+            }
+
+    def _inc(self, name: str, labels: Dict[str, str], amount: float = 1) -> None:
+        series = self.counters.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0) + amount
+
+    def _observe(self, name: str, labels: Dict[str, str], value: float, buckets: Tuple[float, ...]) -> None:
+        series = self.histograms.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        if key not in series:
+            series[key] = Histogram(buckets)
+        series[key].observe(value)
+
+
+def _series(values: Dict[Labels, float]) -> List[Dict[str, Any]]:
+    return [{"labels": dict(labels), "value": value} for labels, value in values.items()]
+
+
+def _bound(bound: float) -> Any:
+    return "+Inf" if bound == float("inf") else bound
+
+
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    Return the process-wide MetricsRegistry, creating it on first use.
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = MetricsRegistry()
+        return _registry
@@ -0,0 +1,61 @@
+from .streaming import BytesLike, ChunkSource, build_stream_command, iter_buffer, pipe_output_args, read_head, stream_ffmpeg, write_stream
+from .render import RENDER_MODES, can_stream_copy, render_accurate, render_stream_copy
+from .parallel import plan_split_points, trim_in_chunks
+from .progress import PROGRESS_ARGS, CancelToken, Progress, ProgressCallback, parse_progress_block, run_with_progress
+from .resources import ResourceGovernor, ResourceLimits, get_resource_governor, parse_cpu_list
+from .chain import (
+    CHAIN_STAGES,
+    ChainStage,
+    ChannelMix,
+    FadeIn,
+    FadeOut,
+    Highpass,
+    Loudnorm,
+    ProcessingChain,
+    Resample,
+    SilenceRemoval,
+    count_samples
+)
+from .packing import PackedInput, attribute_errors, build_packed_command, plan_packs
+
+__all__ = [
+    "BytesLike",
+    "ChunkSource",
+    "build_stream_command",
+    "iter_buffer",
+    "pipe_output_args",
+    "read_head",
+    "stream_ffmpeg",
+    "write_stream",
+    "RENDER_MODES",
+    "can_stream_copy",
+    "render_accurate",
+    "render_stream_copy",
+    "plan_split_points",
+    "trim_in_chunks",
+    "PROGRESS_ARGS",
+    "CancelToken",
+    "Progress",
+    "ProgressCallback",
+    "parse_progress_block",
+    "run_with_progress",
+    "ResourceGovernor",
+    "ResourceLimits",
+    "get_resource_governor",
+    "parse_cpu_list",
+    "CHAIN_STAGES",
+    "ChainStage",
+    "ChannelMix",
+    "FadeIn",
+    "FadeOut",
+    "Highpass",
+    "Loudnorm",
+    "ProcessingChain",
+    "Resample",
+    "SilenceRemoval",
+    "count_samples",
+    "PackedInput",
+    "attribute_errors",
+    "build_packed_command",
+    "plan_packs"
+]
@@ -0,0 +1,411 @@
+import re
+from dataclasses import dataclass, fields
+from typing import Callable, ClassVar, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+from ..constants import AUTO_THRESHOLD
+from ..utils.exceptions import TrimlyError
+from ..utils.process_runner import run_process
+
+# Rate restored after `loudnorm` when neither the input rate nor a later Resample stage is known;
+# in single-pass (dynamic) mode loudnorm always outputs 192 kHz
+LOUDNORM_FALLBACK_SAMPLE_RATE = 48000
+
+# Curves accepted by `afade`
+FADE_CURVES = (
+    "tri", "qsin", "esin", "hsin", "log", "ipar", "qua", "cub", "squ", "cbr", "par", "exp", "iqsin", "ihsin", "dese", "desi"
+)
+
+_SAMPLE_COUNT = re.compile(r"Number of samples: (\d+)")
+_OUTPUT_SAMPLE_RATE = re.compile(r"Output #0.*?Audio: [^\n]*?(\d+) Hz", re.DOTALL)
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _format(value: float) -> str:
+    return f"{value:g}"
+
+
+def _validate_fade(label: str, duration: float, curve: str) -> List[str]:
+    errors = []
+    if not (_is_number(duration) and 0 < duration <= 60):
+        errors.append(f"{label} duration ({duration}s) must be between 0 and 60.")
+    if curve not in FADE_CURVES:
+        errors.append(f"{label} curve ({curve}) must be one of: {', '.join(FADE_CURVES)}.")
+    return errors
+
+
+class ChainStage:
+    """
+    One step of a ProcessingChain.
+
+    Subclasses are frozen dataclasses whose fields are the stage's options, in
+    the order they may be given positionally in a chain spec.
+    """
+    name: ClassVar[str]
+    unique: ClassVar[bool] = False
+
+    def validate(self) -> List[str]:
+        return []
+
+    def render(self, sample_rate: Optional[int]) -> str:
+        raise NotImplementedError
+
+    def output_sample_rate(self, sample_rate: Optional[int]) -> Optional[int]:
+        return sample_rate
+
+    def spec(self) -> str:
+        options = [f"{f.name}={getattr(self, f.name)}" for f in fields(self) if getattr(self, f.name) != f.default]
+        return ":".join([self.name, *options])
+
+
+@dataclass(frozen=True)
+class SilenceRemoval(ChainStage):
+    """
+    Remove silence with `silenceremove`; unset options fall back to the call's parameters and the config.
+    """
+    threshold: Optional[Union[float, str]] = None
+    min_silence: Optional[float] = None
+    start_silence: Optional[float] = None
+    name: ClassVar[str] = "silence"
+    unique: ClassVar[bool] = True
+
+    def validate(self) -> List[str]:
+        # Ranges are checked against the config when the filter is rendered
+        errors = []
+        if self.threshold is not None and not _is_number(self.threshold) and self.threshold != AUTO_THRESHOLD:
+            errors.append(f"Silence threshold ({self.threshold}) must be a number of dB or 'auto'.")
+        for label, value in (("minimum silence", self.min_silence), ("start silence", self.start_silence)):
+            if value is not None and not _is_number(value):
+                errors.append(f"Silence stage {label} ({value}) must be a number of seconds.")
+        return errors
+
+    def render(self, sample_rate: Optional[int]) -> str:
+        # Rendered by Trimly from the configured silence filter template
+        raise TrimlyError("The silence stage is rendered from the silence filter template; use ProcessingChain.render")
+
+
+@dataclass(frozen=True)
+class Loudnorm(ChainStage):
+    """
+    EBU R128 loudness normalization in a single dynamic pass.
+    """
+    integrated: float = -16.0
+    true_peak: float = -1.5
+    loudness_range: float = 11.0
+    name: ClassVar[str] = "loudnorm"
+    unique: ClassVar[bool] = True
+
+    def validate(self) -> List[str]:
+        errors = []
+        if not (_is_number(self.integrated) and -70 <= self.integrated <= -5):
+            errors.append(f"Loudnorm integrated loudness ({self.integrated} LUFS) must be between -70 and -5.")
+        if not (_is_number(self.true_peak) and -9 <= self.true_peak <= 0):
+            errors.append(f"Loudnorm true peak ({self.true_peak} dBTP) must be between -9 and 0.")
+        if not (_is_number(self.loudness_range) and 1 <= self.loudness_range <= 50):
+            errors.append(f"Loudnorm loudness range ({self.loudness_range} LU) must be between 1 and 50.")
+        return errors
+
+    def render(self, sample_rate: Optional[int], restore_rate: bool = True) -> str:
+        loudnorm = f"loudnorm=I={_format(self.integrated)}:TP={_format(self.true_peak)}:LRA={_format(self.loudness_range)}"
+        if not restore_rate:
+            return loudnorm
+        return f"{loudnorm},aresample={sample_rate or LOUDNORM_FALLBACK_SAMPLE_RATE}"
+
+    def output_sample_rate(self, sample_rate: Optional[int]) -> Optional[int]:
+        return sample_rate or LOUDNORM_FALLBACK_SAMPLE_RATE
+
+
+@dataclass(frozen=True)
+class Highpass(ChainStage):
+    """
+    Remove rumble below `frequency` Hz.
+    """
+    frequency: float = 80.0
+    poles: int = 2
+    name: ClassVar[str] = "highpass"
+
+    def validate(self) -> List[str]:
+        errors = []
+        if not (_is_number(self.frequency) and 0 < self.frequency <= 20000):
+            errors.append(f"Highpass frequency ({self.frequency} Hz) must be between 0 and 20000.")
+        if self.poles not in (1, 2):
+            errors.append(f"Highpass poles ({self.poles}) must be 1 or 2.")
+        return errors
+
+    def render(self, sample_rate: Optional[int]) -> str:
+        return f"highpass=f={_format(self.frequency)}:p={self.poles}"
+
+
+@dataclass(frozen=True)
+class Resample(ChainStage):
+    """
+    Resample to `sample_rate` Hz.
+    """
+    sample_rate: int = 48000
+    name: ClassVar[str] = "resample"
+
+    def validate(self) -> List[str]:
+        if not (isinstance(self.sample_rate, int) and 8000 <= self.sample_rate <= 384000):
+            return [f"Resample rate ({self.sample_rate} Hz) must be an integer between 8000 and 384000."]
+        return []
+
+    def render(self, sample_rate: Optional[int]) -> str:
+        return f"aresample={self.sample_rate}"
+
+    def output_sample_rate(self, sample_rate: Optional[int]) -> Optional[int]:
+        return self.sample_rate
+
+
+@dataclass(frozen=True)
+class ChannelMix(ChainStage):
+    """
+    Down- or up-mix to `channels` channels.
+    """
+    channels: int = 1
+    name: ClassVar[str] = "mix"
+
+    def validate(self) -> List[str]:
+        if not (isinstance(self.channels, int) and 1 <= self.channels <= 8):
+            return [f"Channel mix ({self.channels}) must be an integer between 1 and 8."]
+        return []
+
+    def render(self, sample_rate: Optional[int]) -> str:
+        layout = {1: "mono", 2: "stereo"}.get(self.channels, f"{self.channels}c")
+        return f"aformat=channel_layouts={layout}"
+
+
+@dataclass(frozen=True)
+class FadeIn(ChainStage):
+    """
+    Fade in over the first `duration` seconds.
+    """
+    duration: float = 0.05
+    curve: str = "tri"
+    name: ClassVar[str] = "fade_in"
+    unique: ClassVar[bool] = True
+
+    def validate(self) -> List[str]:
+        return _validate_fade("Fade-in", self.duration, self.curve)
+
+    def render(self, sample_rate: Optional[int]) -> str:
+        return f"afade=t=in:d={_format(self.duration)}:curve={self.curve}"
+
+
+@dataclass(frozen=True)
+class FadeOut(ChainStage):
+    """
+    Fade out over the last `duration` seconds.
+
+    Where the audio ends is only known once everything before the fade has run.
+    `render` fades the reversed stream in and reverses it back, which stays in
+    one pass but buffers the whole stream in FFmpeg's memory. For audio too long
+    to buffer, Trimly counts the samples first (see `count_samples`) and renders
+    the fade with `render_at`; that count is a decode pass without an encode.
+    """
+    duration: float = 0.05
+    curve: str = "tri"
+    name: ClassVar[str] = "fade_out"
+    unique: ClassVar[bool] = True
+
+    def validate(self) -> List[str]:
+        return _validate_fade("Fade-out", self.duration, self.curve)
+
+    def render(self, sample_rate: Optional[int]) -> str:
+        # afade's fade-out gain is its fade-in gain run backwards, so the curve carries over unchanged
+        return f"areverse,afade=t=in:d={_format(self.duration)}:curve={self.curve},areverse"
+
+    def render_at(self, total_samples: int, sample_rate: int) -> str:
+        length = max(1, min(total_samples, int(round(self.duration * sample_rate))))
+        return f"afade=t=out:ss={total_samples - length}:ns={length}:curve={self.curve}"
+
+
+CHAIN_STAGES: Dict[str, Type[ChainStage]] = {
+    stage.name: stage for stage in (SilenceRemoval, Loudnorm, Highpass, Resample, ChannelMix, FadeIn, FadeOut)
+}
+
+
+def _parse_value(text: str) -> Union[int, float, str]:
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    return text
+
+
+def _parse_stage(spec: str) -> ChainStage:
+    name, *options = spec.strip().split(":")
+    stage_type = CHAIN_STAGES.get(name.strip())
+    if stage_type is None:
+        raise ValueError(f"Unknown processing stage: {name!r}. Known stages: {', '.join(CHAIN_STAGES)}")
+
+    names = [f.name for f in fields(stage_type)]
+    kwargs = {}
+    for position, option in enumerate(options):
+        key, separator, value = option.partition("=")
+        if not separator:
+            # Positional options follow the stage's field order, e.g. "resample:48000"
+            if position >= len(names):
+                raise ValueError(f"Too many options for processing stage {name!r}")
+            key, value = names[position], option
+        key = key.strip()
+        if key not in names:
+            raise ValueError(f"Unknown option {key!r} for processing stage {name!r}. Options: {', '.join(names)}")
+        kwargs[key] = _parse_value(value.strip())
+    return stage_type(**kwargs)
+
+
+@dataclass(frozen=True)
+class ProcessingChain:
+    """
+    An ordered list of processing stages compiled into one FFmpeg filter graph.
+
+    Every stage runs in the same decode/encode pass as silence removal, so
+    normalizing, resampling and fading a recording costs no extra transcodes.
+    Stages run in the order given.
+
+    Attributes:
+        stages (Tuple[ChainStage, ...]): The stages, validated on construction.
+    """
+    stages: Tuple[ChainStage, ...]
+
+    def __post_init__(self):
+        object.__setattr__(self, "stages", tuple(self.stages))
+        errors = self.validate()
+        if errors:
+            raise ValueError(f"Invalid processing chain: {' '.join(errors)}")
+
+    @classmethod
+    def parse(cls, spec: str) -> "ProcessingChain":
+        """
+        Parse a chain spec such as "highpass:80,silence,loudnorm:I=-16,resample:48000,mix:1,fade_out:0.05".
+
+        Stages are comma-separated. Options follow the stage name, separated by
+        colons, either as `key=value` or positionally in the stage's field order.
+
+        Raises:
+            ValueError: If the spec names an unknown stage or option, or the chain is invalid.
+        """
+        aliases = {"I": "integrated", "TP": "true_peak", "LRA": "loudness_range"}
+        for short, long in aliases.items():
+            spec = re.sub(rf"(?<=:){short}=", f"{long}=", spec)
+        return cls(tuple(_parse_stage(part) for part in spec.split(",") if part.strip()))
+
+    def validate(self) -> List[str]:
+        """
+        Return a list of problems with the chain and its stages (empty when valid).
+        """
+        if not self.stages:
+            return ["A processing chain needs at least one stage."]
+        errors = []
+        for stage in self.stages:
+            if not isinstance(stage, ChainStage):
+                errors.append(f"Not a processing stage: {stage!r}")
+                continue
+            errors += stage.validate()
+            if stage.unique and sum(isinstance(other, type(stage)) for other in self.stages) > 1:
+                errors.append(f"The {stage.name} stage may only appear once.")
+        return list(dict.fromkeys(errors))
+
+    @property
+    def spec(self) -> str:
+        """The chain as a spec string; `ProcessingChain.parse(chain.spec) == chain`."""
+        return ",".join(stage.spec() for stage in self.stages)
+
+    @property
+    def silence_removal(self) -> Optional[SilenceRemoval]:
+        return next((stage for stage in self.stages if isinstance(stage, SilenceRemoval)), None)
+
+    @property
+    def fade_out(self) -> Optional[FadeOut]:
+        return next((stage for stage in self.stages if isinstance(stage, FadeOut)), None)
+
+    def output_sample_rate(self, sample_rate: Optional[int]) -> Optional[int]:
+        """Return the sample rate the chain produces from input at `sample_rate`, if it can be known."""
+        for stage in self.stages:
+            sample_rate = stage.output_sample_rate(sample_rate)
+        return sample_rate
+
+    def render(
+        self,
+        silence_filter: Optional[str],
+        sample_rate: Optional[int],
+        fade_out_at: Optional[Tuple[int, int]] = None,
+        until_fade_out: bool = False
+    ) -> str:
+        """
+        Compile the chain into an FFmpeg `-af` filter graph.
+
+        Args:
+            silence_filter (Optional[str]): Rendered `silenceremove` filter for the SilenceRemoval stage.
+            sample_rate (Optional[int]): Input sample rate, if known.
+            fade_out_at (Optional[Tuple[int, int]]): Sample count and rate of the audio reaching the
+                FadeOut stage, from `count_samples`; without it the fade is rendered in reverse.
+            until_fade_out (bool): Stop before the FadeOut stage, to count the samples that reach it.
+
+        Returns:
+            str: Comma-separated filter graph.
+
+        Raises:
+            TrimlyError: If a stage lacks what it needs to render.
+        """
+        filters = []
+        for index, stage in enumerate(self.stages):
+            if isinstance(stage, SilenceRemoval):
+                if silence_filter is None:
+                    raise TrimlyError("The silence stage needs a rendered silence filter")
+                filters.append(silence_filter)
+            elif isinstance(stage, FadeOut):
+                if until_fade_out:
+                    break
+                filters.append(stage.render(sample_rate) if fade_out_at is None else stage.render_at(*fade_out_at))
+            elif isinstance(stage, Loudnorm):
+                # A later Resample stage converts loudnorm's 192 kHz output directly
+                resampled = any(isinstance(later, Resample) for later in self.stages[index + 1:])
+                filters.append(stage.render(sample_rate, restore_rate=not resampled))
+            else:
+                filters.append(stage.render(sample_rate))
+            sample_rate = stage.output_sample_rate(sample_rate)
+        return ",".join(filters) or "anull"
+
+
+def count_samples(
+    input_args: Sequence[str],
+    audio_filter: str,
+    timeout: Optional[float] = None,
+    global_args: Sequence[str] = (),
+    on_spawn: Optional[Callable[[int], None]] = None
+) -> Tuple[int, int]:
+    """
+    Count the samples per channel that `audio_filter` produces, in a decode pass with no encode.
+
+    Args:
+        input_args (Sequence[str]): FFmpeg input arguments, ending with `-i <input>`.
+        audio_filter (str): Filter graph to run, usually a chain rendered up to its FadeOut stage.
+        timeout (Optional[float]): Seconds before the pass is aborted.
+        global_args (Sequence[str]): Arguments placed before the input, such as thread limits.
+        on_spawn (Optional[Callable[[int], None]]): Called with FFmpeg's PID once it starts.
+
+    Returns:
+        Tuple[int, int]: The sample count and the sample rate at the end of `audio_filter`.
+
+    Raises:
+        TrimlyError: If FFmpeg fails.
+        subprocess.TimeoutExpired: If the pass exceeds `timeout`.
+    """
+    cmd = [
+        "ffmpeg", "-hide_banner", "-nostats", *global_args,
+        *input_args,
+        "-af", f"{audio_filter},astats=measure_perchannel=none:measure_overall=Number_of_samples",
+        "-f", "null", "-"
+    ]
+    result = run_process(cmd, timeout=timeout, on_spawn=on_spawn)
+    count = _SAMPLE_COUNT.search(result.stderr)
+    # The null muxer's stream is described after the filter graph, at the rate the fade will see
+    rate = _OUTPUT_SAMPLE_RATE.search(result.stderr)
+    if result.returncode != 0 or count is None or rate is None:
+        error = result.stderr.strip().splitlines()[-1:] or ["Unknown FFmpeg error"]
+        raise TrimlyError(f"Failed to measure the processed length: {error[0]}")
+    return int(count.group(1)), int(rate.group(1))
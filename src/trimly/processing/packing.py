@@ -0,0 +1,124 @@
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar
+
+from .progress import PROGRESS_ARGS
+
+T = TypeVar("T")
+
+# FFmpeg 6.1+ prefixes log lines with the input they concern, e.g. "[in#1 @ 0x...]" or "[aist#1:0/mp3 @ 0x...]"
+_INPUT_TAG = re.compile(r"\[(?:in|ist|aist)#(\d+)[:/ \]]")
+# Every FFmpeg version names the file it failed to open
+_OPEN_ERROR = re.compile(r"Error opening (?:input|output) file (.+)\.$")
+
+
+@dataclass(frozen=True)
+class PackedInput:
+    """
+    One input of a packed FFmpeg invocation and the outputs made from it.
+
+    Attributes:
+        input_args (List[str]): FFmpeg input arguments, ending with `-i <input>`.
+        audio_filter (str): Filter chain applied to the input's audio.
+        output_args (List[str]): Encoder arguments for the filtered output, ending with its path.
+        extra_output_args (List[str]): Further complete outputs taken straight from
+            the input, e.g. `-map 3:a -f f32le <path>`.
+        paths (Tuple[str, ...]): Every file path this input reads or writes, used to
+            attribute errors FFmpeg reports by file name.
+    """
+    input_args: List[str]
+    audio_filter: str
+    output_args: List[str]
+    extra_output_args: List[str] = field(default_factory=list)
+    paths: Tuple[str, ...] = ()
+
+
+def plan_packs(items: Iterable[Tuple[T, Optional[float]]], max_inputs: int, max_seconds: float) -> Iterator[List[T]]:
+    """
+    Group short inputs into packs that each run in a single FFmpeg process.
+
+    Inputs are taken in order and a pack is closed as soon as one more input
+    would exceed `max_inputs` or `max_seconds` of audio. An input longer than
+    `max_seconds` forms a pack of its own. An input without a duration cannot
+    be packed and is yielded alone straight away, leaving the open pack open.
+    `items` is consumed lazily, so packs are yielded while later inputs are
+    still being probed.
+
+    Args:
+        items (Iterable[Tuple[T, Optional[float]]]): Inputs paired with their durations
+            in seconds, or None for inputs that must run on their own.
+        max_inputs (int): Most inputs per pack.
+        max_seconds (float): Most total audio per pack.
+
+    Yields:
+        List[T]: The inputs of each pack; packed inputs keep their original order.
+    """
+    pack: List[T] = []
+    total = 0.0
+    for item, duration in items:
+        if duration is None:
+            yield [item]
+            continue
+        if pack and (len(pack) >= max_inputs or total + duration > max_seconds):
+            yield pack
+            pack, total = [], 0.0
+        pack.append(item)
+        total += duration
+    if pack:
+        yield pack
+
+
+def build_packed_command(inputs: Sequence[PackedInput], global_args: Sequence[str] = ()) -> List[str]:
+    """
+    Build one FFmpeg command that filters every input into its own output.
+
+    Each input gets an independent chain in a single `-filter_complex` graph,
+    `[i:a]<audio_filter>[trimmed_i]`, so process startup, codec registration and
+    probing happen once for the whole pack instead of once per file.
+
+    Args:
+        inputs (Sequence[PackedInput]): The pack, in input order.
+        global_args (Sequence[str]): Arguments to place before the first input.
+
+    Returns:
+        List[str]: The FFmpeg command, reporting progress on pipe:1.
+    """
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", *PROGRESS_ARGS, *global_args, "-y"]
+    for item in inputs:
+        cmd += item.input_args
+
+    graph = ";".join(f"[{index}:a]{item.audio_filter}[trimmed_{index}]" for index, item in enumerate(inputs))
+    cmd += ["-filter_complex", graph]
+    for index, item in enumerate(inputs):
+        cmd += ["-map", f"[trimmed_{index}]", *item.output_args, *item.extra_output_args]
+    return cmd
+
+
+def attribute_errors(stderr: str, inputs: Sequence[PackedInput]) -> Set[int]:
+    """
+    Find which inputs of a failed packed invocation FFmpeg's errors are about.
+
+    Args:
+        stderr (str): FFmpeg's error output.
+        inputs (Sequence[PackedInput]): The pack the command was built from.
+
+    Returns:
+        Set[int]: Indices of the inputs named by an error; empty when the
+        failure cannot be pinned on any input (e.g. a filter graph error).
+    """
+    owners = {path: index for index, item in enumerate(inputs) for path in item.paths}
+    culprits = set()
+    for line in stderr.splitlines():
+        tag = _INPUT_TAG.search(line)
+        if tag is not None and int(tag.group(1)) < len(inputs):
+            culprits.add(int(tag.group(1)))
+            continue
+        opened = _OPEN_ERROR.search(line)
+        if opened is not None and opened.group(1) in owners:
+            culprits.add(owners[opened.group(1)])
+            continue
+        # Before FFmpeg 6.1 errors are prefixed with the file name instead
+        path = line.split(": ", 1)[0]
+        if path in owners:
+            culprits.add(owners[path])
+    return culprits
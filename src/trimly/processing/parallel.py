@@ -0,0 +1,147 @@
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from ..analysis.segments import SegmentMap
+from ..utils.exceptions import TrimlyError
+from ..utils.process_runner import run_process
+
+
+def plan_split_points(segment_map: SegmentMap, chunk_count: int, min_chunk_seconds: float) -> List[float]:
+    """
+    Choose where to split an input so each chunk can be trimmed independently.
+
+    Candidates are the ends of removed silent runs, i.e. the instant speech
+    resumes. Cutting there leaves the whole silent run at the tail of the
+    preceding chunk, where `silenceremove` shortens it exactly as a single pass
+    would, while the following chunk starts on non-silence and is left untouched
+    by the leading-silence rule. The candidate nearest each evenly spaced target
+    is used, subject to every chunk being at least `min_chunk_seconds` long.
+
+    Args:
+        segment_map (SegmentMap): Analysis of the whole input.
+        chunk_count (int): Desired number of chunks.
+        min_chunk_seconds (float): Shortest chunk worth a separate FFmpeg process.
+
+    Returns:
+        List[float]: Ordered split times in seconds (empty when the input should not be split).
+    """
+    duration = segment_map.duration
+    candidates = [end for _, end in segment_map.removed if min_chunk_seconds <= end <= duration - min_chunk_seconds]
+
+    points: List[float] = []
+    for index in range(1, chunk_count):
+        target = duration * index / chunk_count
+        earliest = (points[-1] if points else 0.0) + min_chunk_seconds
+        eligible = [point for point in candidates if point >= earliest]
+        if not eligible:
+            break
+        point = min(eligible, key=lambda candidate: abs(candidate - target))
+        if point not in points:
+            points.append(point)
+    return points
+
+
+def _trim_chunk(
+    input_path: Path,
+    output_path: Path,
+    bounds: Tuple[float, Optional[float]],
+    silence_filter: str,
+    timeout: Optional[float],
+    global_args: Sequence[str],
+    on_spawn: Optional[Callable[[int], None]]
+) -> Path:
+    start, end = bounds
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", *global_args, "-y", "-ss", f"{start:.6f}"]
+    if end is not None:
+        cmd += ["-to", f"{end:.6f}"]
+    # Float intermediates hold 16-bit, 24-bit and float sources without truncation; WAV's default s16 would not
+    cmd += ["-i", str(input_path), "-af", silence_filter, "-c:a", "pcm_f32le", str(output_path)]
+
+    result = run_process(cmd, timeout=timeout, on_spawn=on_spawn)
+    if result.returncode != 0:
+        error = result.stderr.strip() or "Unknown FFmpeg error"
+        raise TrimlyError(f"Failed to process chunk {start:.2f}s-{end if end is not None else 'end'}: {error}")
+    return output_path
+
+
+def trim_in_chunks(
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    split_points: List[float],
+    silence_filter: str,
+    max_workers: int,
+    work_directory: Union[str, Path],
+    output_args: Optional[List[str]] = None,
+    timeout: Optional[float] = None,
+    global_args: Sequence[str] = (),
+    on_spawn: Optional[Callable[[int], None]] = None
+) -> Path:
+    """
+    Trim an input as independent chunks in parallel and concatenate the results.
+
+    Each chunk is cut from the source with sample-accurate input seeking, run
+    through `silence_filter` in its own FFmpeg process into a float32 WAV, and
+    the chunk outputs are joined with the concat demuxer. Encoding to the final
+    format (`output_args`) happens once, during the join. The result is close to
+    a single-pass trim but not bit-identical: level detection restarts at every
+    split point.
+
+    Args:
+        input_path (Union[str, Path]): Source audio file.
+        output_path (Union[str, Path]): Destination of the concatenated output.
+        split_points (List[float]): Ordered split times from `plan_split_points`.
+        silence_filter (str): Rendered silence filter applied to every chunk.
+        max_workers (int): Maximum number of concurrent FFmpeg processes.
+        work_directory (Union[str, Path]): Directory for intermediate chunk files.
+        output_args (Optional[List[str]]): Encoder arguments for the joined output;
+            the float32 chunks are stream-copied when omitted.
+        timeout (Optional[float]): Per-chunk timeout in seconds.
+        global_args (Sequence[str]): Arguments placed before the input of every
+            FFmpeg process, such as thread limits.
+        on_spawn (Optional[Callable[[int], None]]): Called with the PID of every
+            FFmpeg process once it starts.
+
+    Returns:
+        Path: The written output path.
+
+    Raises:
+        TrimlyError: If any chunk or the final concatenation fails.
+        subprocess.TimeoutExpired: If a chunk exceeds `timeout`.
+    """
+    input_path, output_path = Path(input_path), Path(output_path)
+    starts = [0.0, *split_points]
+    ends: List[Optional[float]] = [*split_points, None]
+
+    with tempfile.TemporaryDirectory(prefix=".split-", dir=work_directory) as work_dir:
+        chunk_paths = [Path(work_dir) / f"chunk_{index:05d}.wav" for index in range(len(starts))]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_trim_chunk, input_path, chunk_path, bounds, silence_filter, timeout, global_args, on_spawn)
+                for chunk_path, bounds in zip(chunk_paths, zip(starts, ends))
+            ]
+            for future in futures:
+                future.result()
+
+        concat_list = Path(work_dir) / "chunks.ffconcat"
+        concat_list.write_text(
+            "ffconcat version 1.0\n" + "".join(f"file '{path.name}'\n" for path in chunk_paths)
+        )
+
+        output_path.unlink(missing_ok=True)
+        result = run_process(
+            [
+                "ffmpeg", "-hide_banner", "-loglevel", "error", *global_args, "-y",
+                "-f", "concat", "-safe", "0", "-i", str(concat_list),
+                *(output_args or ["-c", "copy"]), str(output_path)
+            ],
+            timeout=timeout,
+            on_spawn=on_spawn
+        )
+        if result.returncode != 0:
+            error = result.stderr.strip() or "Unknown FFmpeg error"
+            raise TrimlyError(f"Failed to join processed chunks: {error}")
+
+    return output_path
@@ -0,0 +1,219 @@
+import queue
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..utils.exceptions import JobCancelledError
+
+# Arguments that replace FFmpeg's human-readable stats line with a key=value progress stream on stdout
+PROGRESS_ARGS = ["-nostats", "-progress", "pipe:1"]
+
+ProgressCallback = Callable[["Progress"], None]
+
+
+@dataclass(frozen=True)
+class Progress:
+    """
+    One progress update from a running FFmpeg job.
+
+    Attributes:
+        out_time (float): Seconds of trimmed output written so far.
+        speed (Optional[float]): Output seconds produced per wall-clock second.
+        total_size (Optional[int]): Bytes written to the output so far.
+        elapsed (float): Wall-clock seconds since FFmpeg started.
+        input_duration (Optional[float]): Length of the input in seconds, when known.
+        done (bool): True for the final update of a successful run.
+
+    Silence removal makes the output shorter than the input, so `out_time`
+    trails the input position; `fraction` is therefore a lower bound and `eta`
+    an upper bound until the final update.
+    """
+    out_time: float
+    speed: Optional[float]
+    total_size: Optional[int]
+    elapsed: float
+    input_duration: Optional[float] = None
+    done: bool = False
+
+    @property
+    def fraction(self) -> Optional[float]:
+        if self.done:
+            return 1.0
+        if not self.input_duration:
+            return None
+        return min(self.out_time / self.input_duration, 1.0)
+
+    @property
+    def eta(self) -> Optional[float]:
+        if self.done:
+            return 0.0
+        if not self.input_duration or not self.speed:
+            return None
+        return max(self.input_duration - self.out_time, 0.0) / self.speed
+
+
+class CancelToken:
+    """
+    Cooperative cancellation handle for a job, with an optional deadline.
+
+    Pass the same token to a Trimly call and cancel it from any thread; the
+    running FFmpeg process is killed within one progress poll interval.
+
+    Args:
+        timeout (Optional[float]): Seconds from now after which the token counts as cancelled.
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        self._event = threading.Event()
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    @property
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def check(self) -> None:
+        """
+        Raises:
+            JobCancelledError: If the token was cancelled or its deadline has passed.
+        """
+        if self.cancelled:
+            raise JobCancelledError("Processing cancelled")
+        if self.expired:
+            raise JobCancelledError("Processing deadline exceeded")
+
+
+def _parse_number(value: Optional[str], cast) -> Optional[float]:
+    try:
+        return cast(value.rstrip("x").strip()) if value not in (None, "N/A") else None
+    except ValueError:
+        return None
+
+
+def parse_progress_block(fields: Dict[str, str], elapsed: float, input_duration: Optional[float]) -> Progress:
+    """
+    Convert one `-progress` key=value block into a Progress.
+    """
+    out_time_us = _parse_number(fields.get("out_time_us"), int)
+    return Progress(
+        out_time=max(out_time_us or 0, 0) / 1_000_000,
+        speed=_parse_number(fields.get("speed"), float),
+        total_size=_parse_number(fields.get("total_size"), int),
+        elapsed=elapsed,
+        input_duration=input_duration,
+        done=fields.get("progress") == "end"
+    )
+
+
+def run_with_progress(
+    cmd: List[str],
+    timeout: Optional[float],
+    on_progress: Optional[ProgressCallback] = None,
+    cancel_token: Optional[CancelToken] = None,
+    stall_timeout: Optional[float] = None,
+    input_duration: Optional[float] = None,
+    poll_interval: float = 0.25,
+    on_spawn: Optional[Callable[[int], None]] = None
+) -> Tuple[int, str]:
+    """
+    Run an FFmpeg command that includes PROGRESS_ARGS, reporting progress and enforcing limits.
+
+    Progress lines are parsed from stdout as they arrive and stderr is drained
+    on a separate thread, so neither pipe can fill up and block FFmpeg. The
+    process is killed as soon as the hard timeout passes, the cancel token
+    fires, or no progress update has arrived for `stall_timeout` seconds.
+
+    Args:
+        cmd (List[str]): FFmpeg arguments, writing progress to pipe:1.
+        timeout (Optional[float]): Hard limit on the whole run.
+        on_progress (Optional[ProgressCallback]): Called on the calling thread for every update.
+        cancel_token (Optional[CancelToken]): Token that aborts the run when cancelled or expired.
+        stall_timeout (Optional[float]): Kill FFmpeg if it reports no progress for this long.
+        input_duration (Optional[float]): Input length for `fraction`/`eta`, usually
+            from the header probe; both stay None when it is unknown.
+        poll_interval (float): How often limits are checked while waiting for updates.
+        on_spawn (Optional[Callable[[int], None]]): Called with FFmpeg's pid once it has
+            started, e.g. to apply resource limits; if it raises, FFmpeg is killed.
+
+    Returns:
+        Tuple[int, str]: FFmpeg's return code and stderr.
+
+    Raises:
+        subprocess.TimeoutExpired: If the hard timeout or the stall timeout elapsed.
+        JobCancelledError: If the cancel token was cancelled or its deadline passed.
+    """
+    if cancel_token is not None:
+        cancel_token.check()
+
+    started = time.monotonic()
+    process = subprocess.Popen(
+        cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    )
+    stderr_chunks: List[str] = []
+    updates: "queue.Queue[Optional[Dict[str, str]]]" = queue.Queue()
+
+    def drain_stderr():
+        for line in process.stderr:
+            stderr_chunks.append(line)
+
+    def read_progress():
+        fields: Dict[str, str] = {}
+        for line in process.stdout:
+            key, _, value = line.strip().partition("=")
+            fields[key] = value
+            if key == "progress":
+                updates.put(fields)
+                fields = {}
+        updates.put(None)
+
+    readers = [
+        threading.Thread(target=drain_stderr, daemon=True),
+        threading.Thread(target=read_progress, daemon=True)
+    ]
+    for reader in readers:
+        reader.start()
+
+    last_update = started
+    try:
+        if on_spawn is not None:
+            on_spawn(process.pid)
+        while True:
+            try:
+                fields = updates.get(timeout=poll_interval)
+            except queue.Empty:
+                fields = {}
+            now = time.monotonic()
+
+            if fields is None:
+                break
+            if fields:
+                last_update = now
+                if on_progress is not None:
+                    on_progress(parse_progress_block(fields, now - started, input_duration))
+
+            if cancel_token is not None:
+                cancel_token.check()
+            if timeout is not None and now - started > timeout:
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            if stall_timeout and now - last_update > stall_timeout:
+                raise subprocess.TimeoutExpired(cmd, stall_timeout)
+
+        returncode = process.wait()
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        for reader in readers:
+            reader.join()
+        process.stdout.close()
+        process.stderr.close()
+
+    return returncode, "".join(stderr_chunks)
@@ -0,0 +1,211 @@
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Union
+
+from ..analysis.segments import SegmentMap
+from ..utils.exceptions import TrimlyError
+from ..utils.process_runner import run_process
+
+RENDER_MODES = ("accurate", "copy")
+
+# Sample format used between the decoder and encoder of a sample-accurate render
+PCM_FORMAT = "f32le"
+PCM_SAMPLE_BYTES = 4
+DEFAULT_RENDER_SAMPLE_RATE = 48000
+DEFAULT_RENDER_CHANNELS = 2
+READ_CHUNK_BYTES = 256 * 1024
+
+
+def can_stream_copy(codec: Optional[str]) -> bool:
+    """Whether packets of `codec` can be cut without re-encoding."""
+    if not codec:
+        return False
+    return codec.startswith("pcm_") or codec in {"mp3", "mp2", "aac", "flac", "vorbis", "opus", "alac"}
+
+
+def _ffmpeg_error(stderr: bytes) -> str:
+    lines = stderr.decode(errors="replace").strip().splitlines()
+    return lines[-1] if lines else "Unknown FFmpeg error"
+
+
+def render_accurate(
+    segment_map: SegmentMap,
+    output_path: Union[str, Path],
+    output_args: Optional[List[str]] = None,
+    timeout: Optional[float] = None,
+    global_args: Sequence[str] = (),
+    on_spawn: Optional[Callable[[int], None]] = None
+) -> Path:
+    """
+    Render the kept intervals of a SegmentMap with sample accuracy.
+
+    The source is decoded once to raw PCM; only samples inside kept intervals
+    are forwarded to an encoder process, which writes `output_path` with
+    `output_args` (or the format implied by its extension). Memory use is
+    bounded by the pipe chunk size.
+
+    Args:
+        segment_map (SegmentMap): Map describing what to keep.
+        output_path (Union[str, Path]): Destination file.
+        output_args (Optional[List[str]]): Encoder arguments placed before the output path.
+        timeout (Optional[float]): Seconds before the render is aborted.
+        global_args (Sequence[str]): Arguments placed before the input of the decoder
+            and the encoder, such as thread limits.
+        on_spawn (Optional[Callable[[int], None]]): Called with the PID of the decoder
+            and of the encoder once each starts.
+
+    Returns:
+        Path: The written output path.
+
+    Raises:
+        TrimlyError: If decoding or encoding fails.
+        subprocess.TimeoutExpired: If the render exceeds `timeout`.
+    """
+    output_path = Path(output_path)
+    sample_rate = segment_map.sample_rate or DEFAULT_RENDER_SAMPLE_RATE
+    channels = segment_map.channels or DEFAULT_RENDER_CHANNELS
+    frame_bytes = PCM_SAMPLE_BYTES * channels
+    pcm_args = ["-f", PCM_FORMAT, "-ar", str(sample_rate), "-ac", str(channels)]
+
+    ranges = [(round(start * sample_rate), round(end * sample_rate)) for start, end in segment_map.kept]
+    deadline = time.monotonic() + timeout if timeout else None
+
+    # Replace rather than overwrite: the destination may be hard-linked to a cache entry
+    output_path.unlink(missing_ok=True)
+
+    decoder = subprocess.Popen(
+        ["ffmpeg", "-hide_banner", "-loglevel", "error", *global_args, "-i", segment_map.source, *pcm_args, "pipe:1"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+    encoder = subprocess.Popen(
+        [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", *global_args, "-y",
+            *pcm_args, "-i", "pipe:0", *(output_args or []), str(output_path)
+        ],
+        stdin=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+
+    try:
+        if on_spawn is not None:
+            on_spawn(decoder.pid)
+            on_spawn(encoder.pid)
+        position = 0  # in sample frames
+        pending = b""
+        range_index = 0
+        while range_index < len(ranges):
+            if deadline is not None and time.monotonic() > deadline:
+                raise subprocess.TimeoutExpired(decoder.args, timeout)
+
+            data = decoder.stdout.read(READ_CHUNK_BYTES)
+            if not data:
+                break
+            data = pending + data
+            usable = len(data) - len(data) % frame_bytes
+            data, pending = data[:usable], data[usable:]
+            chunk_end = position + usable // frame_bytes
+
+            while range_index < len(ranges):
+                start, end = ranges[range_index]
+                if start >= chunk_end:
+                    break
+                lo, hi = max(start, position), min(end, chunk_end)
+                if hi > lo:
+                    encoder.stdin.write(data[(lo - position) * frame_bytes:(hi - position) * frame_bytes])
+                if end > chunk_end:
+                    break
+                range_index += 1
+            position = chunk_end
+
+        encoder.stdin.close()
+        encoder.wait(timeout=max(deadline - time.monotonic(), 0) if deadline else None)
+    except BrokenPipeError:
+        # The encoder exited early; its return code and log explain why
+        encoder.wait()
+    except BaseException:
+        encoder.kill()
+        encoder.wait()
+        decoder.kill()
+        decoder.wait()
+        raise
+
+    # Once every kept sample is forwarded the rest of the decode is not needed
+    if decoder.poll() is None:
+        decoder.kill()
+    decoder.wait()
+
+    if encoder.returncode != 0:
+        raise TrimlyError(f"Failed to render segments: {_ffmpeg_error(encoder.stderr.read())}")
+    if decoder.returncode > 0:
+        raise TrimlyError(f"Failed to render segments: {_ffmpeg_error(decoder.stderr.read())}")
+    return output_path
+
+
+def _concat_script(source: str, segment_map: SegmentMap) -> str:
+    escaped = str(Path(source).resolve()).replace("'", "'\\''")
+    lines: List[str] = ["ffconcat version 1.0"]
+    for start, end in segment_map.kept:
+        lines += [f"file '{escaped}'", f"inpoint {start:.6f}", f"outpoint {end:.6f}"]
+    return "\n".join(lines) + "\n"
+
+
+def render_stream_copy(
+    segment_map: SegmentMap,
+    output_path: Union[str, Path],
+    timeout: Optional[float] = None,
+    global_args: Sequence[str] = (),
+    on_spawn: Optional[Callable[[int], None]] = None
+) -> Path:
+    """
+    Render the kept intervals of a SegmentMap by stream-copying packets.
+
+    Uses FFmpeg's concat demuxer with per-segment in/out points, so the audio is
+    neither decoded nor re-encoded. Cuts snap to codec packet boundaries, and the
+    output keeps the source container, so `output_path` must share the source's
+    extension.
+
+    Args:
+        segment_map (SegmentMap): Map describing what to keep.
+        output_path (Union[str, Path]): Destination file with the source's extension.
+        timeout (Optional[float]): Seconds before the render is aborted.
+        global_args (Sequence[str]): Arguments placed before the input, such as thread limits.
+        on_spawn (Optional[Callable[[int], None]]): Called with FFmpeg's PID once it starts.
+
+    Returns:
+        Path: The written output path.
+
+    Raises:
+        TrimlyError: If the codec cannot be stream-copied, the extension differs or FFmpeg fails.
+        subprocess.TimeoutExpired: If the render exceeds `timeout`.
+    """
+    output_path = Path(output_path)
+    if not can_stream_copy(segment_map.codec):
+        raise TrimlyError(f"Codec '{segment_map.codec}' cannot be cut without re-encoding")
+    if output_path.suffix.lower() != Path(segment_map.source).suffix.lower():
+        raise TrimlyError(
+            f"Stream-copy output must keep the source format ({Path(segment_map.source).suffix}), got {output_path.suffix}"
+        )
+
+    output_path.unlink(missing_ok=True)
+    with tempfile.NamedTemporaryFile("w", suffix=".ffconcat", dir=output_path.parent, delete=False) as script:
+        script.write(_concat_script(segment_map.source, segment_map))
+    try:
+        result = run_process(
+            [
+                "ffmpeg", "-hide_banner", "-loglevel", "error", *global_args, "-y",
+                "-f", "concat", "-safe", "0", "-i", script.name,
+                "-map", "0:a", "-c", "copy", str(output_path)
+            ],
+            timeout=timeout,
+            on_spawn=on_spawn,
+            text=False
+        )
+    finally:
+        Path(script.name).unlink(missing_ok=True)
+
+    if result.returncode != 0:
+        raise TrimlyError(f"Failed to render segments: {_ffmpeg_error(result.stderr)}")
+    return output_path
@@ -0,0 +1,194 @@
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, fields, replace
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..utils.exceptions import TrimlyError
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def parse_cpu_list(value: str) -> Tuple[int, ...]:
+    """
+    Parse a Linux-style CPU list such as "0-3,8,10-11" into sorted core ids.
+
+    Raises:
+        ValueError: If the list is malformed or contains a negative id.
+    """
+    cores = set()
+    for part in value.replace(" ", "").split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        start, end = int(first), int(last or first)
+        if start < 0 or end < start:
+            raise ValueError(f"Invalid CPU range: {part}")
+        cores.update(range(start, end + 1))
+    return tuple(sorted(cores))
+
+
+@dataclass(frozen=True)
+class ResourceLimits:
+    """
+    CPU and memory limits for the FFmpeg processes of a job. None leaves a setting at FFmpeg's or the OS default.
+
+    Attributes:
+        threads (Optional[int]): Decoder and encoder threads (`-threads`); defaults
+            to `cores_per_job` when jobs are pinned.
+        filter_threads (Optional[int]): Filter graph threads (`-filter_threads`).
+        cpu_affinity (Optional[Tuple[int, ...]]): Cores FFmpeg may run on.
+        cores_per_job (Optional[int]): Pin each job to its own slice of this many cores
+            from `cpu_affinity` (or all cores), so concurrent jobs do not share cores.
+        nice (Optional[int]): Scheduling niceness for FFmpeg, -20 (highest priority) to 19.
+        memory_limit_mb (Optional[float]): Address-space limit (RLIMIT_AS) for FFmpeg.
+            Linux does not enforce RSS limits, so address space is the closest bound;
+            FFmpeg fails its allocations instead of pushing the host into swap.
+    """
+    threads: Optional[int] = None
+    filter_threads: Optional[int] = None
+    cpu_affinity: Optional[Tuple[int, ...]] = None
+    cores_per_job: Optional[int] = None
+    nice: Optional[int] = None
+    memory_limit_mb: Optional[float] = None
+
+    @classmethod
+    def from_config(cls, config) -> "ResourceLimits":
+        # TrimlyConfig uses 0 and "" for "not set"
+        return cls(
+            threads=config.ffmpeg_threads or None,
+            filter_threads=config.ffmpeg_filter_threads or None,
+            cpu_affinity=parse_cpu_list(config.ffmpeg_cpu_affinity) or None,
+            cores_per_job=config.ffmpeg_cores_per_job or None,
+            nice=config.ffmpeg_nice or None,
+            memory_limit_mb=config.ffmpeg_memory_limit_mb or None
+        )
+
+    def merged(self, overrides: Optional["ResourceLimits"]) -> "ResourceLimits":
+        """
+        Return these limits with every setting that `overrides` specifies replaced.
+        """
+        if overrides is None:
+            return self
+        return replace(self, **{
+            f.name: getattr(overrides, f.name) for f in fields(overrides) if getattr(overrides, f.name) is not None
+        })
+
+    @property
+    def effective_threads(self) -> Optional[int]:
+        # FFmpeg sizes its thread pools from the cores it sees at startup, before a pinned affinity is applied
+        return self.threads or self.cores_per_job
+
+    def global_args(self) -> List[str]:
+        """
+        FFmpeg arguments to place before the first input.
+        """
+        args = []
+        if self.filter_threads:
+            args += ["-filter_threads", str(self.filter_threads)]
+        if self.effective_threads:
+            args += ["-threads", str(self.effective_threads)]
+        return args
+
+    def output_args(self) -> List[str]:
+        """
+        FFmpeg arguments to place before each output.
+        """
+        return ["-threads", str(self.effective_threads)] if self.effective_threads else []
+
+
+class ResourceGovernor:
+    """
+    Applies ResourceLimits to spawned FFmpeg processes and hands out core slices.
+
+    Limits are applied to the child by pid right after it starts rather than in
+    a `preexec_fn`, which is unsafe in a threaded process; only FFmpeg's
+    startup runs before they take effect. Settings the platform cannot apply
+    (affinity outside Linux, RLIMIT_AS on Windows) are skipped.
+
+    With `cores_per_job` set, each job leases the least-used slice of that many
+    cores for as long as it runs. With more jobs than slices, slices are shared
+    evenly rather than jobs being made to wait; the scheduler bounds concurrency.
+    """
+
+    def __init__(self, limits: ResourceLimits):
+        self.limits = limits
+        self._lock = threading.Lock()
+        self._slices: List[Tuple[int, ...]] = []
+        self._leases: List[int] = []
+        if limits.cores_per_job:
+            cores = limits.cpu_affinity or tuple(sorted(_available_cores()))
+            size = min(limits.cores_per_job, len(cores))
+            self._slices = [cores[i:i + size] for i in range(0, len(cores) - size + 1, size)]
+            self._leases = [0] * len(self._slices)
+
+    @contextmanager
+    def job(self) -> Iterator[Callable[[int], None]]:
+        """
+        Reserve a core slice for one job and yield the callback that applies the limits to its processes by pid.
+        """
+        index = self._lease()
+        cores = self._slices[index] if index is not None else self.limits.cpu_affinity
+        try:
+            yield lambda pid: self.apply(pid, cores)
+        finally:
+            if index is not None:
+                with self._lock:
+                    self._leases[index] -= 1
+
+    def _lease(self) -> Optional[int]:
+        if not self._slices:
+            return None
+        with self._lock:
+            index = min(range(len(self._slices)), key=self._leases.__getitem__)
+            self._leases[index] += 1
+            return index
+
+    def apply(self, pid: int, cores: Optional[Tuple[int, ...]] = None) -> None:
+        """
+        Apply the affinity, niceness and memory limit to a running process.
+
+        Raises:
+            TrimlyError: If a supported limit could not be applied, e.g. a negative
+                niceness without the privilege to raise priority.
+        """
+        try:
+            if cores and hasattr(os, "sched_setaffinity"):
+                os.sched_setaffinity(pid, cores)
+            if self.limits.nice is not None and hasattr(os, "setpriority"):
+                os.setpriority(os.PRIO_PROCESS, pid, self.limits.nice)
+            if self.limits.memory_limit_mb and resource is not None and hasattr(resource, "prlimit"):
+                limit = int(self.limits.memory_limit_mb * 1024 * 1024)
+                resource.prlimit(pid, resource.RLIMIT_AS, (limit, limit))
+        except ProcessLookupError:
+            # Already exited; its return code tells the caller what happened
+            pass
+        except OSError as e:
+            raise TrimlyError(f"Failed to apply FFmpeg resource limits: {e}")
+
+
+def _available_cores() -> set:
+    if hasattr(os, "sched_getaffinity"):
+        return os.sched_getaffinity(0)
+    return set(range(os.cpu_count() or 1))
+
+
+_governors: Dict[ResourceLimits, ResourceGovernor] = {}
+_governors_lock = threading.Lock()
+
+
+def get_resource_governor(limits: ResourceLimits) -> ResourceGovernor:
+    """
+    Return the process-wide ResourceGovernor for `limits`, creating it on first use.
+
+    Jobs with equal limits share one governor, so core slices are balanced
+    across every Trimly instance in the process.
+    """
+    with _governors_lock:
+        governor = _governors.get(limits)
+        if governor is None:
+            governor = _governors[limits] = ResourceGovernor(limits)
+        return governor
@@ -0,0 +1,316 @@
+import itertools
+import struct
+import subprocess
+import threading
+import time
+from collections import deque
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Optional, Sequence, Union
+
+from ..utils.exceptions import TrimlyError
+
+ChunkSource = Union[Iterable[bytes], BinaryIO]
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Number of trailing FFmpeg stderr lines kept for error reporting
+STDERR_TAIL_LINES = 20
+
+# Leading output bytes retained to rewrite a piped WAV header; FFmpeg's header and metadata fit well within this
+WAV_HEADER_SCAN_BYTES = 4096
+
+
+def build_stream_command(
+    audio_filter: str,
+    input_format: Optional[str] = None,
+    sample_rate: Optional[int] = None,
+    channels: Optional[int] = None,
+    output_format: str = "wav",
+    global_args: Sequence[str] = (),
+    output_args: Sequence[str] = (),
+    input_url: str = "pipe:0",
+    low_latency: bool = True
+) -> List[str]:
+    """
+    Build an FFmpeg command that reads from stdin, applies `audio_filter` and writes to stdout.
+
+    Args:
+        audio_filter (str): Rendered `-af` filter graph.
+        input_format (Optional[str]): FFmpeg demuxer of the input (e.g. "mp3", "s16le").
+            When omitted FFmpeg probes the stream.
+        sample_rate (Optional[int]): Sample rate of raw PCM input.
+        channels (Optional[int]): Channel count of raw PCM input.
+        output_format (str): FFmpeg muxer for the output stream.
+        global_args (Sequence[str]): Arguments placed before the input, such as thread limits.
+        output_args (Sequence[str]): Encoder arguments placed before the output.
+        input_url (str): Input to read instead of stdin, for containers that cannot be demuxed from a pipe.
+        low_latency (bool): Disable input buffering and flush every packet, for live sources.
+            Complete in-memory data should turn this off: unbuffered demuxing cannot skip
+            WAV metadata chunks on a pipe.
+
+    Returns:
+        List[str]: The FFmpeg argument list.
+    """
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", *global_args]
+    if low_latency:
+        cmd += ["-fflags", "+nobuffer"]
+    if input_format:
+        cmd += ["-f", input_format]
+    if sample_rate:
+        cmd += ["-ar", str(sample_rate)]
+    if channels:
+        cmd += ["-ac", str(channels)]
+    cmd += [
+        "-i", input_url,
+        "-af", audio_filter,
+        *output_args,
+        *(["-flush_packets", "1"] if low_latency else []),
+        "-f", output_format,
+        "pipe:1"
+    ]
+    return cmd
+
+
+def pipe_output_args(output_args: Sequence[str]) -> List[str]:
+    """
+    Adapt encoder arguments built for a file output to a non-seekable pipe.
+
+    MP4 cannot move its index to the front (`+faststart`) without seeking, so
+    the output is written fragmented instead, with an empty index up front.
+    """
+    args = list(output_args)
+    if "-movflags" in args:
+        args[args.index("-movflags") + 1] = "+frag_keyframe+empty_moov+default_base_moof"
+    return args
+
+
+def iter_buffer(
+    data: Union[BytesLike, BinaryIO],
+    chunk_size: int,
+    max_bytes: Optional[int] = None,
+    head: bytes = b""
+) -> Iterator[BytesLike]:
+    """
+    Split in-memory data or a readable buffer into chunks of at most `chunk_size` bytes.
+
+    Bytes-like data is sliced through a memoryview, so no chunk is copied.
+
+    Args:
+        data (Union[BytesLike, BinaryIO]): Bytes-like object or readable binary file object.
+        chunk_size (int): Maximum size of each chunk.
+        max_bytes (Optional[int]): Size limit; exceeding it raises once the limit is crossed.
+        head (bytes): Bytes already read from `data`, yielded first.
+
+    Returns:
+        Iterator[BytesLike]: Consecutive chunks of the data. Iterating past
+        `max_bytes` raises TrimlyError, which `stream_ffmpeg` reports as a source error.
+    """
+    if hasattr(data, "read"):
+        chunks = iter(lambda: data.read(chunk_size), b"")
+    else:
+        view = memoryview(data).cast("B")
+        chunks = (view[start:start + chunk_size] for start in range(0, len(view), chunk_size))
+    return _limit_size(itertools.chain([head] if head else [], chunks), max_bytes)
+
+
+def read_head(source: BinaryIO, size: int, head: bytes = b"") -> bytes:
+    """
+    Read from `source` until `head` holds `size` bytes or the source ends; short reads are retried.
+    """
+    while len(head) < size:
+        part = source.read(size - len(head))
+        if not part:
+            break
+        head += part
+    return head
+
+
+def _limit_size(chunks: Iterator[BytesLike], max_bytes: Optional[int]) -> Iterator[BytesLike]:
+    total = 0
+    for chunk in chunks:
+        total += len(chunk)
+        if max_bytes is not None and total > max_bytes:
+            raise TrimlyError(f"Audio data is too large: over the {max_bytes}-byte limit")
+        yield chunk
+
+
+def _iter_source(source: ChunkSource, chunk_size: int) -> Iterator[bytes]:
+    if hasattr(source, "read"):
+        return iter(lambda: source.read(chunk_size), b"")
+    return iter(source)
+
+
+def _patch_wav_sizes(header: bytearray, total_size: int) -> None:
+    # FFmpeg cannot seek back on a pipe, so it leaves the RIFF and data sizes at 0xFFFFFFFF
+    if header[:4] != b"RIFF" or total_size - 8 > 0xFFFFFFFF:
+        return
+    struct.pack_into("<I", header, 4, total_size - 8)
+    offset = 12
+    while offset + 8 <= len(header):
+        chunk_id, size = struct.unpack_from("<4sI", header, offset)
+        if chunk_id == b"data":
+            struct.pack_into("<I", header, offset + 4, total_size - offset - 8)
+            return
+        offset += 8 + size + (size & 1)
+
+
+def write_stream(chunks: Iterable[bytes], sink: BinaryIO, wav: bool = False) -> int:
+    """
+    Write FFmpeg output chunks to `sink` and return the number of bytes written.
+
+    With `wav` set and a seekable sink, the placeholder sizes in the WAV header
+    are rewritten once the length is known, so strict readers accept the file.
+    Unseekable sinks keep the placeholders, which FFmpeg and most players treat
+    as "read to the end".
+
+    Args:
+        chunks (Iterable[bytes]): Output of `stream_ffmpeg`.
+        sink (BinaryIO): Writable binary file object.
+        wav (bool): The output is a WAV stream.
+
+    Returns:
+        int: Bytes written.
+    """
+    seekable = wav and sink.seekable()
+    start = sink.tell() if seekable else 0
+    header = bytearray()
+    written = 0
+    for chunk in chunks:
+        if seekable and len(header) < WAV_HEADER_SCAN_BYTES:
+            header += chunk[:WAV_HEADER_SCAN_BYTES - len(header)]
+        sink.write(chunk)
+        written += len(chunk)
+
+    if seekable and header:
+        _patch_wav_sizes(header, written)
+        sink.seek(start)
+        sink.write(header)
+        sink.seek(start + written)
+    return written
+
+
+def stream_ffmpeg(
+    cmd: List[str],
+    source: ChunkSource,
+    chunk_size: int,
+    timeout: Optional[float] = None,
+    on_spawn: Optional[Callable[[int], None]] = None,
+    stall_timeout: Optional[float] = None
+) -> Iterator[bytes]:
+    """
+    Run FFmpeg as a pipe filter, feeding `source` to stdin and yielding stdout as it is produced.
+
+    Input is written from a background thread so a slow consumer applies
+    backpressure through the OS pipe buffers instead of accumulating data in
+    memory. Output is yielded as soon as FFmpeg flushes it, in chunks of at most
+    `chunk_size` bytes. Closing the generator early kills FFmpeg, as does a
+    stall: no input consumed and no output produced for `stall_timeout` seconds.
+
+    Args:
+        cmd (List[str]): FFmpeg command reading `pipe:0` and writing `pipe:1`.
+        source (ChunkSource): Iterable of byte chunks or a readable binary file object.
+        chunk_size (int): Maximum size of each read from `source` and each yielded chunk.
+        timeout (Optional[float]): Seconds before FFmpeg is killed, counted from the first chunk requested.
+        on_spawn (Optional[Callable[[int], None]]): Called with FFmpeg's PID once it starts.
+        stall_timeout (Optional[float]): Seconds without pipe activity before FFmpeg is killed.
+
+    Yields:
+        bytes: Processed output chunks.
+
+    Raises:
+        TrimlyError: If FFmpeg exits with an error or the source raises.
+        subprocess.TimeoutExpired: If FFmpeg runs longer than `timeout` or stalls for `stall_timeout`.
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=0
+    )
+    stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+    source_errors = []
+    timed_out = threading.Event()
+    finished = threading.Event()
+    # Time of the last chunk written to stdin or read from stdout
+    last_activity = [time.monotonic()]
+    # Set while the consumer holds a chunk: backpressure from a slow reader is not a stall
+    consuming = threading.Event()
+    expired_after = [timeout]
+
+    def expire(after: Optional[float] = timeout) -> None:
+        expired_after[0] = after
+        timed_out.set()
+        process.kill()
+
+    def watch() -> None:
+        while not finished.wait(min(1.0, stall_timeout / 4)):
+            if not consuming.is_set() and time.monotonic() - last_activity[0] > stall_timeout:
+                expire(stall_timeout)
+                return
+
+    def feed() -> None:
+        try:
+            for chunk in _iter_source(source, chunk_size):
+                if chunk:
+                    process.stdin.write(chunk)
+                    last_activity[0] = time.monotonic()
+        except (BrokenPipeError, ValueError):
+            # FFmpeg exited (or the stream was closed) before consuming all input
+            pass
+        except Exception as e:
+            source_errors.append(e)
+        finally:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+
+    def drain_stderr() -> None:
+        for line in process.stderr:
+            stderr_tail.append(line.decode(errors="replace").rstrip())
+
+    feeder = threading.Thread(target=feed, name="trimly-stream-feed", daemon=True)
+    drainer = threading.Thread(target=drain_stderr, name="trimly-stream-stderr", daemon=True)
+    feeder.start()
+    drainer.start()
+    timer = threading.Timer(timeout, expire) if timeout else None
+    watchdog = threading.Thread(target=watch, name="trimly-stream-watchdog", daemon=True) if stall_timeout else None
+
+    try:
+        if timer is not None:
+            timer.daemon = True
+            timer.start()
+        if watchdog is not None:
+            watchdog.start()
+        if on_spawn is not None:
+            on_spawn(process.pid)
+        while True:
+            chunk = process.stdout.read(chunk_size)
+            if not chunk:
+                break
+            consuming.set()
+            yield chunk
+            last_activity[0] = time.monotonic()
+            consuming.clear()
+        process.wait()
+    finally:
+        finished.set()
+        if timer is not None:
+            timer.cancel()
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+        drainer.join()
+
+    if process.returncode == 0:
+        # FFmpeg only exits cleanly after reading EOF, so the feeder has finished;
+        # on failure it may still be blocked on a live source and is left to die with the daemon
+        feeder.join()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, expired_after[0])
+    if source_errors:
+        raise TrimlyError(f"Failed to read audio stream: {source_errors[0]}") from source_errors[0]
+    if process.returncode != 0:
+        error = "\n".join(stderr_tail) or "Unknown FFmpeg error"
+        raise TrimlyError(f"Failed to process audio stream: {error}")
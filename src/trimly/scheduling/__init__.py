@@ -0,0 +1,6 @@
+from .scheduler import JobScheduler, get_scheduler
+
+__all__ = [
+    "JobScheduler",
+    "get_scheduler"
+]
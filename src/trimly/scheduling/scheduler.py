@@ -0,0 +1,229 @@
+import heapq
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from ..constants import SCHEDULER_PRIORITY_CLASSES, SCHEDULER_WAIT_SAMPLE_SIZE
+from ..utils.exceptions import SchedulerFullError, TrimlyError
+
+
+class JobScheduler:
+    """
+    Bounded, prioritized executor for FFmpeg jobs.
+
+    At most `max_workers` jobs run at once and at most `max_queue` of each
+    priority class wait behind them; further submissions of that class are
+    rejected with SchedulerFullError, or block until space frees up when the
+    caller asks to. Because every class has its own bound, a batch filling its
+    share of the queue never rejects interactive work. Queued jobs run by priority
+    class (in the order of SCHEDULER_PRIORITY_CLASSES) and FIFO within a class,
+    so interactive clips overtake queued batch work without preempting it.
+
+    Jobs are returned as concurrent.futures.Future objects; cancelling a queued
+    future removes it from the queue before it starts.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self._queue: List[Tuple[int, int, float, Future, Callable, tuple, dict]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._running = 0
+        self._shutdown = False
+        self._counters = {"submitted": 0, "completed": 0, "failed": 0, "cancelled": 0, "rejected": 0}
+        self._waits: Dict[str, Deque[float]] = {
+            priority: deque(maxlen=SCHEDULER_WAIT_SAMPLE_SIZE) for priority in SCHEDULER_PRIORITY_CLASSES
+        }
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        priority: str = "normal",
+        block: bool = False,
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> Future:
+        """
+        Queue `fn(*args, **kwargs)` for execution.
+
+        Args:
+            fn (Callable): The job to run on a worker thread.
+            priority (str): One of SCHEDULER_PRIORITY_CLASSES.
+            block (bool): Wait for queue space instead of rejecting when full.
+            timeout (Optional[float]): Upper bound on that wait, in seconds.
+
+        Returns:
+            Future: Resolves to the job's return value.
+
+        Raises:
+            SchedulerFullError: If the priority's queue is full (and stays full for `timeout` when blocking).
+            TrimlyError: If the priority is unknown or the scheduler has been shut down.
+        """
+        if priority not in SCHEDULER_PRIORITY_CLASSES:
+            raise TrimlyError(
+                f"Unknown priority '{priority}'. Expected one of: {', '.join(SCHEDULER_PRIORITY_CLASSES)}"
+            )
+        rank = SCHEDULER_PRIORITY_CLASSES.index(priority)
+
+        future = Future()
+        with self._condition:
+            if block:
+                has_space = self._condition.wait_for(
+                    lambda: self._shutdown or self._queued_count(rank) < self.max_queue, timeout
+                )
+            else:
+                has_space = self._queued_count(rank) < self.max_queue
+            if self._shutdown:
+                raise TrimlyError("Scheduler has been shut down")
+            if not has_space:
+                self._counters["rejected"] += 1
+                raise SchedulerFullError(
+                    f"Server busy: {self._queued_count(rank)} {priority} jobs already queued. Please try again shortly."
+                )
+
+            heapq.heappush(
+                self._queue, (rank, next(self._sequence), time.monotonic(), future, fn, args, kwargs)
+            )
+            self._counters["submitted"] += 1
+            self._start_worker()
+            self._condition.notify_all()
+        return future
+
+    def cancel(self, future: Future) -> bool:
+        """
+        Cancel a job that has not started yet.
+
+        Returns:
+            bool: True if the job was cancelled, False if it is already running or done.
+        """
+        cancelled = future.cancel()
+        if cancelled:
+            with self._condition:
+                # Drop the entry now so it stops counting against the queue bound
+                self._queue = [entry for entry in self._queue if entry[3] is not future]
+                heapq.heapify(self._queue)
+                self._counters["cancelled"] += 1
+                self._condition.notify_all()
+        return cancelled
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of queue depth, throughput counters and recent queue wait times.
+
+        Returns:
+            Dict[str, Any]: Overall counters (`max_queue` is the bound per priority)
+            plus per-priority `queued` depth and `wait_mean_seconds` /
+            `wait_p95_seconds` / `wait_max_seconds` over the most recent
+            SCHEDULER_WAIT_SAMPLE_SIZE jobs that started.
+        """
+        with self._condition:
+            queued = {priority: 0 for priority in SCHEDULER_PRIORITY_CLASSES}
+            for entry in self._queue:
+                if not entry[3].cancelled():
+                    queued[SCHEDULER_PRIORITY_CLASSES[entry[0]]] += 1
+
+            priorities = {}
+            for priority, waits in self._waits.items():
+                ordered = sorted(waits)
+                priorities[priority] = {
+                    "queued": queued[priority],
+                    "wait_mean_seconds": sum(ordered) / len(ordered) if ordered else 0.0,
+                    "wait_p95_seconds": ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))] if ordered else 0.0,
+                    "wait_max_seconds": ordered[-1] if ordered else 0.0
+                }
+
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": sum(queued.values()),
+                **self._counters,
+                "priorities": priorities
+            }
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """
+        Stop accepting jobs and let the workers exit once the queue is drained.
+
+        Args:
+            wait (bool): Block until every worker has exited.
+            cancel_pending (bool): Cancel queued jobs instead of running them.
+        """
+        with self._condition:
+            self._shutdown = True
+            if cancel_pending:
+                for entry in self._queue:
+                    if entry[3].cancel():
+                        self._counters["cancelled"] += 1
+                self._queue.clear()
+            self._condition.notify_all()
+            workers = list(self._workers)
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    def _queued_count(self, rank: int) -> int:
+        return sum(1 for entry in self._queue if entry[0] == rank and not entry[3].cancelled())
+
+    def _start_worker(self) -> None:
+        # Workers are started lazily, so an idle scheduler holds no threads
+        if len(self._workers) < self.max_workers and len(self._workers) < self._running + len(self._queue):
+            worker = threading.Thread(target=self._work, name=f"trimly-scheduler-{len(self._workers)}", daemon=True)
+            self._workers.append(worker)
+            worker.start()
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or self._shutdown)
+                if not self._queue:
+                    self._workers.remove(threading.current_thread())
+                    return
+                rank, _, queued_at, future, fn, args, kwargs = heapq.heappop(self._queue)
+                if not future.set_running_or_notify_cancel():
+                    # Cancelled directly through the future while still queued
+                    self._counters["cancelled"] += 1
+                    self._condition.notify_all()
+                    continue
+                self._waits[SCHEDULER_PRIORITY_CLASSES[rank]].append(time.monotonic() - queued_at)
+                self._running += 1
+                # A queue slot has been freed for blocked submitters
+                self._condition.notify_all()
+
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+                outcome = "failed"
+            else:
+                future.set_result(result)
+                outcome = "completed"
+
+            with self._condition:
+                self._running -= 1
+                self._counters[outcome] += 1
+
+
+_scheduler: Optional[JobScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler(max_workers: int, max_queue: int) -> JobScheduler:
+    """
+    Return the process-wide JobScheduler, creating it on first use.
+
+    A single scheduler is shared by every Trimly instance so the worker bound
+    applies to the whole process; the limits passed on later calls are ignored.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = JobScheduler(max_workers, max_queue)
+        return _scheduler
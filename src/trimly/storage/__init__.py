@@ -0,0 +1,6 @@
+from .temp_storage import TempStorage, get_temp_storage
+
+__all__ = [
+    "TempStorage",
+    "get_temp_storage"
+]
@@ -0,0 +1,197 @@
+import os
+import re
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+# Marker inserted into in-progress file names; such files are never handed out or evicted while fresh
+PARTIAL_MARKER = ".partial"
+
+
+class TempStorage:
+    """
+    Manager for job outputs written to the temp directory.
+
+    Every job receives its own collision-free output path. Outputs are written
+    to a hidden partial file first and atomically renamed into place, so readers
+    never observe half-written audio. A background sweeper enforces a time to
+    live and a byte quota, evicting the least recently used outputs first. Use
+    is tracked by mtime: writing an output counts, and so does `touch`, which
+    Trimly calls when it reuses an output (e.g. restored from the result cache)
+    and which callers holding on to an output should call when they read it.
+
+    Only regular files directly inside `directory` whose names `allocate` or
+    `partial_path` could have produced are managed, so anything else sharing the
+    directory is never evicted; subdirectories such as the caches and per-job
+    work directories maintain their own limits.
+    All methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        quota_bytes: int,
+        ttl_seconds: float,
+        sweep_interval_seconds: float,
+        file_prefix: str = ""
+    ):
+        self.directory = Path(directory)
+        self.quota_bytes = quota_bytes
+        self.ttl_seconds = ttl_seconds
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self.file_prefix = file_prefix
+        self.evicted_files = 0
+        self.evicted_bytes = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sweeper: Optional[threading.Thread] = None
+        # `{prefix}{stem}-{12 hex digits}{suffix}` from allocate, `.{stem}.partial{suffix}` from partial_path
+        self._managed_names = re.compile(
+            rf"{re.escape(file_prefix)}.*-[0-9a-f]{{12}}(\.[^.]*)?|\..*{re.escape(PARTIAL_MARKER)}(\.[^.]*)?",
+            re.DOTALL
+        )
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def allocate(self, stem: str, suffix: str) -> Path:
+        """
+        Reserve a unique output path for a job.
+
+        Args:
+            stem (str): Human-readable base name, usually the input's stem.
+            suffix (str): File extension including the dot.
+
+        Returns:
+            Path: A path in the managed directory that no other job will receive.
+        """
+        return self.directory / f"{self.file_prefix}{stem}-{uuid.uuid4().hex[:12]}{suffix}"
+
+    def partial_path(self, path: Union[str, Path]) -> Path:
+        """
+        Return the hidden in-progress path for `path`, keeping its extension so FFmpeg can infer the format.
+        """
+        path = Path(path)
+        return path.with_name(f".{path.stem}{PARTIAL_MARKER}{path.suffix}")
+
+    def commit(self, partial: Union[str, Path], path: Union[str, Path]) -> Path:
+        """Atomically publish a finished partial file at its final path."""
+        os.replace(partial, path)
+        return Path(path)
+
+    def discard(self, partial: Union[str, Path]) -> None:
+        """Remove an abandoned partial file."""
+        Path(partial).unlink(missing_ok=True)
+
+    def touch(self, path: Union[str, Path]) -> None:
+        """Mark an output as recently used so it is evicted last; reading a file does not count by itself."""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def evict(self) -> int:
+        """
+        Delete expired outputs, then least recently used outputs until usage is within the quota.
+
+        Partial files are only removed once they exceed the time to live, which
+        covers jobs that crashed without cleaning up.
+
+        Returns:
+            int: Number of files removed.
+        """
+        with self._lock:
+            now = time.time()
+            entries = sorted(self._scan(), key=lambda entry: entry[0])
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+
+            for mtime, size, path in entries:
+                expired = self.ttl_seconds > 0 and now - mtime > self.ttl_seconds
+                over_quota = self.quota_bytes > 0 and total > self.quota_bytes
+                if not expired and (not over_quota or PARTIAL_MARKER in path.name):
+                    continue
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+                self.evicted_files += 1
+                self.evicted_bytes += size
+            return removed
+
+    def usage(self) -> Dict[str, Union[int, float]]:
+        """Report the number and total size of managed files alongside the configured limits."""
+        with self._lock:
+            entries = list(self._scan())
+            return {
+                "files": len(entries),
+                "bytes": sum(size for _, size, _ in entries),
+                "quota_bytes": self.quota_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "evicted_files": self.evicted_files,
+                "evicted_bytes": self.evicted_bytes,
+            }
+
+    def start(self) -> None:
+        """Start the background sweeper thread if it is not already running."""
+        with self._lock:
+            if self._sweeper is not None and self._sweeper.is_alive():
+                return
+            self._stop.clear()
+            self._sweeper = threading.Thread(target=self._sweep_forever, name="trimly-temp-sweeper", daemon=True)
+            self._sweeper.start()
+
+    def stop(self) -> None:
+        """Stop the background sweeper thread."""
+        self._stop.set()
+        if self._sweeper is not None:
+            self._sweeper.join()
+
+    def _sweep_forever(self) -> None:
+        while not self._stop.wait(self.sweep_interval_seconds):
+            self.evict()
+
+    def _scan(self):
+        try:
+            children = list(os.scandir(self.directory))
+        except OSError:
+            return
+        for entry in children:
+            if self._managed_names.fullmatch(entry.name) is None:
+                continue
+            try:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            yield stat.st_mtime, stat.st_size, Path(entry.path)
+
+
+_storages: Dict[Path, TempStorage] = {}
+_storages_lock = threading.Lock()
+
+
+def get_temp_storage(
+    directory: Union[str, Path],
+    quota_bytes: int,
+    ttl_seconds: float,
+    sweep_interval_seconds: float,
+    file_prefix: str = ""
+) -> TempStorage:
+    """
+    Return the process-wide TempStorage for `directory`, creating it and starting its sweeper on first use.
+    """
+    directory = Path(directory)
+    with _storages_lock:
+        storage = _storages.get(directory)
+        if storage is None:
+            storage = _storages[directory] = TempStorage(
+                directory, quota_bytes, ttl_seconds, sweep_interval_seconds, file_prefix
+            )
+            storage.evict()
+            storage.start()
+        return storage
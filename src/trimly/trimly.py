@@ -1,89 +1,1543 @@
+import asyncio
+import functools
+import io
+import json
+import os
+import pickle
+import shutil
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
 import subprocess
-from typing import Union, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from typing import Union, Optional, Tuple, Iterable, Iterator, Mapping, Any, List, Dict, BinaryIO, Callable
 
 from .utils.exceptions import TrimlyError, UnsupportedFormatError, FFmpegNotFoundError
 from .utils.file_validation import validate_audio_file
-from .utils.ffmpeg_availability import check_ffmpeg_availability
-from .configs import get_config
+from .utils.format_sniffing import SNIFF_HEADER_BYTES, mp4_needs_seek, require_audio_format
+from .utils.ffmpeg_availability import (
+   FFmpegCapabilities,
+   check_ffmpeg_availability,
+   get_ffmpeg_version,
+   probe_ffmpeg_capabilities
+)
+from .utils.hashing import hash_file
+from .utils.media_probe import MediaInfo, MediaProbeCache, get_media_probe_cache, probe_audio_header, probe_media
+from .utils.output_encoding import build_output_args, normalize_output_format
+from .cache import ResultCache, PCMCache, get_result_cache, get_pcm_cache, link_or_copy
+from .processing import (
+   BytesLike,
+   ChunkSource,
+   RENDER_MODES,
+   build_stream_command,
+   iter_buffer,
+   pipe_output_args,
+   read_head,
+   stream_ffmpeg,
+   write_stream,
+   render_accurate,
+   render_stream_copy,
+   plan_split_points,
+   trim_in_chunks,
+   PROGRESS_ARGS,
+   CancelToken,
+   ProgressCallback,
+   run_with_progress,
+   ResourceLimits,
+   get_resource_governor,
+   ProcessingChain,
+   Loudnorm,
+   count_samples,
+   PackedInput,
+   attribute_errors,
+   build_packed_command,
+   plan_packs
+)
+from .analysis import (
+   SegmentMap,
+   SweepTable,
+   DecodedAudio,
+   LevelEnvelope,
+   NoiseFloorEstimate,
+   decode_pcm,
+   derive_threshold,
+   detect_segments,
+   detect_segments_numpy,
+   has_numpy,
+   measure_levels,
+   peak_levels,
+   sweep_parameters
+)
+from .configs import get_config, TrimlyConfig
+from .constants import (
+   AUTO_THRESHOLD,
+   AUTO_THRESHOLD_MIN_DYNAMIC_RANGE_DB,
+   BUFFER_PROBE_BYTES,
+   CACHE_SUBDIRECTORY,
+   FADE_OUT_REVERSE_MAX_BYTES,
+   INPUT_DEMUXERS,
+   MEDIA_PROBE_TIMEOUT_SECONDS,
+   OUTPUT_AUDIO_CODECS,
+   PCM_CACHE_MAX_ENTRY_FRACTION,
+   PIPE_OUTPUT_MUXERS,
+   PREFLIGHT_SAMPLE_RATE,
+   PROCESSING_TIMEOUT_BASE_SECONDS
+)
+from .storage import TempStorage, get_temp_storage
+from .scheduling import JobScheduler, get_scheduler
+from .metrics import MetricsRegistry, get_metrics_registry, track_job, stage, annotate, record_failure
+
+
+def _trim_in_worker(config: TrimlyConfig, file_path: Union[str, Path], parameters: Mapping[str, Any]) -> Tuple[str, Optional[str]]:
+   # Entry point for process-pool workers, which cannot share the parent's Trimly instance
+   return Trimly(config).trim_audio(file_path, **parameters)
+
+
+def _trim_packed_in_worker(
+   config: TrimlyConfig,
+   items: List[Tuple[Union[str, Path], Mapping[str, Any]]]
+) -> List[Tuple[str, Tuple[str, Optional[str]]]]:
+   return Trimly(config)._trim_packed(items)
+
+
+# trim_audio parameters a packed batch can honour per input; progress, cancellation and resource limits apply to a whole process
+_PACKED_PARAMETERS = {
+   "threshold", "min_silence", "start_silence", "output_format", "sample_rate", "channels", "bitrate", "output_path", "chain"
+}
+
+
+@dataclass
+class _TrimJob:
+   input_path: Path
+   output_path: Path
+   partial_output: Path
+   command: List[str]
+   cache_key: Optional[str] = None
+   content_hash: Optional[str] = None
+   pcm_partial: Optional[Path] = None
+   input_duration: Optional[float] = None
+   media: Optional[MediaInfo] = None
+   timeout: Optional[float] = None
+   limits: ResourceLimits = ResourceLimits()
+   auto_threshold: Optional[float] = None
+   input_args: List[str] = field(default_factory=list)
+   audio_filter: Optional[str] = None
+   output_args: List[str] = field(default_factory=list)
+   preflight: Optional[Tuple[float, float, float]] = None
+   # Set while `audio_filter` still stops before a fade-out whose position has to be measured
+   render_fade_out: Optional[Callable[..., str]] = None
+
 
 class Trimly:
    def __init__(self, config=None):
       self.config = config or get_config()
-      self.tmp_dir = self._ensure_tmp_dir()
+      self.storage = self._ensure_tmp_dir()
+      self.tmp_dir = self.storage.directory
       self._check_ffmpeg_availability()
+      self._async_semaphores = weakref.WeakKeyDictionary()
+      self.result_cache = self._open_result_cache()
+      self.pcm_cache = self._open_pcm_cache()
+      self.scheduler = self._open_scheduler()
+      self.metrics = self._open_metrics()
+      if self.metrics is not None:
+         # Bound to the shared storage rather than this instance, so the process-wide registry does not keep it alive
+         self.metrics.add_collector(functools.partial(self._storage_gauges, self.storage), {"directory": str(self.tmp_dir)})
+      self.media_probe = self._open_media_probe()
+      self.resource_limits = ResourceLimits.from_config(self.config)
+      # The config was validated on construction, so its chain parses; keep it rather than re-parsing on every call
+      self.default_chain = ProcessingChain.parse(self.config.processing_chain)
 
-   def _ensure_tmp_dir(self) -> Path:
-      tmp_path = Path(self.config.temp_directory)
+   def _ensure_tmp_dir(self) -> TempStorage:
+      # Shared per directory, so repeated Trimly construction neither re-creates it nor starts another sweeper
       try:
-         tmp_path.mkdir(parents=True, exist_ok=True)
-         return tmp_path
+         return get_temp_storage(
+            self.config.temp_directory,
+            quota_bytes=int(self.config.temp_storage_quota_mb * 1024 * 1024),
+            ttl_seconds=self.config.temp_file_ttl_seconds,
+            sweep_interval_seconds=self.config.temp_sweep_interval_seconds,
+            file_prefix=self.config.processed_file_prefix
+         )
       except OSError as e:
          raise TrimlyError(f"Failed to create temporary directory: {e}")
 
-   def _check_ffmpeg_availability(self) -> None:
-      return check_ffmpeg_availability()
+   @staticmethod
+   def _storage_gauges(storage: TempStorage) -> Dict[str, float]:
+      usage = storage.usage()
+      return {
+         "trimly_temp_storage_files": usage["files"],
+         "trimly_temp_storage_bytes": usage["bytes"],
+         "trimly_temp_storage_quota_bytes": usage["quota_bytes"],
+         "trimly_temp_storage_evicted_files": usage["evicted_files"],
+         "trimly_temp_storage_evicted_bytes": usage["evicted_bytes"]
+      }
+
+   def _open_result_cache(self) -> Optional[ResultCache]:
+      if not self.config.result_cache_enabled:
+         return None
+      return get_result_cache(
+         self.tmp_dir / CACHE_SUBDIRECTORY / "results",
+         max_bytes=int(self.config.result_cache_max_size_mb * 1024 * 1024),
+         max_entries=self.config.result_cache_max_entries
+      )
+
+   def _open_pcm_cache(self) -> Optional[PCMCache]:
+      if not self.config.pcm_cache_enabled:
+         return None
+      return get_pcm_cache(
+         self.tmp_dir / CACHE_SUBDIRECTORY / "pcm",
+         max_bytes=int(self.config.pcm_cache_max_size_mb * 1024 * 1024),
+         max_age_seconds=self.config.pcm_cache_max_age_seconds
+      )
+
+   def _open_scheduler(self) -> JobScheduler:
+      return get_scheduler(self.config.scheduler_max_workers, self.config.scheduler_max_queue)
+
+   def _open_metrics(self) -> Optional[MetricsRegistry]:
+      if not self.config.metrics_enabled:
+         return None
+      return get_metrics_registry()
+
+   def _open_media_probe(self) -> Optional[MediaProbeCache]:
+      if not self.config.media_probe_enabled:
+         return None
+      return get_media_probe_cache(self.config.media_probe_cache_max_entries)
+
+   def _check_ffmpeg_availability(self, refresh: bool = False) -> bool:
+      return check_ffmpeg_availability(refresh=refresh)
+
+   @property
+   def ffmpeg_capabilities(self) -> FFmpegCapabilities:
+      return probe_ffmpeg_capabilities()
+
+   def refresh_ffmpeg_capabilities(self) -> FFmpegCapabilities:
+      self._check_ffmpeg_availability(refresh=True)
+      return self.ffmpeg_capabilities
 
    def validate_file(self, file_path: Union[str, Path]) -> Path:
-      return validate_audio_file(file_path)
+      path = validate_audio_file(file_path, max_size_mb=self.config.max_input_file_size_mb)
+
+      # Reject undecodable and overlong inputs from their headers, before anything is decoded
+      media = self.probe(path)
+      max_duration = self.config.max_input_duration_seconds
+      if media is not None and media.duration and max_duration and media.duration > max_duration:
+         raise TrimlyError(f"Audio is too long: {media.duration:.0f}s (limit {max_duration:g}s)")
+      return path
+
+   def probe(self, file_path: Union[str, Path]) -> Optional[MediaInfo]:
+      if self.media_probe is None:
+         return None
+      return self.media_probe.probe(file_path, timeout=MEDIA_PROBE_TIMEOUT_SECONDS)
+
+   def plan_output(
+      self,
+      threshold: Optional[Union[float, str]] = None,
+      min_silence: Optional[float] = None,
+      start_silence: Optional[float] = None,
+      output_format: Optional[str] = None,
+      sample_rate: Optional[int] = None,
+      channels: Optional[int] = None,
+      bitrate: Optional[str] = None,
+      chain: Optional[Union[ProcessingChain, str]] = None
+   ) -> Tuple[str, str]:
+      # Returns the output suffix and a key that changes whenever these parameters would change the output bytes.
+      # Raises TrimlyError for parameters trim_audio would reject, without touching any input.
+      chain = self._resolve_chain(chain)
+      threshold, min_silence, start_silence = self._chain_parameters(chain, threshold, min_silence, start_silence)
+      auto = chain.silence_removal is not None and self._is_auto_threshold(threshold)
+      silence_filter = self._render_chain_silence_filter(chain, None if auto else threshold, min_silence, start_silence)
+      output_suffix, output_args = self._resolve_output(output_format, sample_rate, channels, bitrate)
+      key = [silence_filter, output_args]
+      if chain.stages != (chain.silence_removal,):
+         key.append(chain.spec)
+      if auto:
+         # The threshold itself is measured per file, so key on how it is derived
+         key.append([AUTO_THRESHOLD, self.config.auto_threshold_percentile, self.config.auto_threshold_margin_db])
+      return output_suffix, json.dumps(key)
+
+   def _timeout_for(self, input_path: Path) -> float:
+      # Short inputs get proportionally short timeouts, so hung jobs are killed sooner
+      timeout = self.config.processing_operation_timeout_seconds
+      media = self.probe(input_path)
+      if media is None or not media.duration or not self.config.processing_timeout_per_audio_second:
+         return timeout
+      return min(timeout, PROCESSING_TIMEOUT_BASE_SECONDS + media.duration * self.config.processing_timeout_per_audio_second)
 
    def validate_parameters(self, threshold: float, min_silence: float, start_silence: float) -> None:
-      self.config.validate(threshold, min_silence, start_silence)
+      self.config.validate_parameters(threshold, min_silence, start_silence)
+
+   def level_envelope(
+      self,
+      file_path: Union[str, Path, DecodedAudio],
+      resource_limits: Optional[ResourceLimits] = None
+   ) -> LevelEnvelope:
+      window_seconds = self.config.analysis_window_seconds
+      audio = file_path if isinstance(file_path, DecodedAudio) else None
+      if audio is None:
+         input_path = self.validate_file(file_path)
+         if self.pcm_cache is not None and has_numpy():
+            # Decoding into the PCM cache costs about the same as a metering pass, and the trim that follows reuses it
+            audio = self.decode_audio(input_path, resource_limits=resource_limits)
+
+      if audio is not None:
+         return LevelEnvelope(
+            audio.source,
+            audio.duration,
+            window_seconds,
+            peak_levels(audio, window_seconds),
+            audio.sample_rate,
+            audio.channels,
+            audio.codec
+         )
+
+      # Analysis windows are sized in samples, so the native rate is needed up front
+      media = self.probe(input_path) or probe_media(input_path, timeout=MEDIA_PROBE_TIMEOUT_SECONDS)
+      if not media.sample_rate:
+         raise TrimlyError(f"Failed to measure levels: unknown sample rate for {input_path.name}")
+      limits = self.resource_limits.merged(resource_limits)
+      with get_resource_governor(limits).job() as apply_limits:
+         levels = measure_levels(
+            input_path,
+            window_seconds,
+            media.sample_rate,
+            timeout=self._timeout_for(input_path),
+            global_args=limits.global_args(),
+            on_spawn=apply_limits
+         )
+      return LevelEnvelope(
+         str(input_path),
+         media.duration or len(levels) * window_seconds,
+         window_seconds,
+         levels,
+         media.sample_rate,
+         media.channels,
+         media.codec
+      )
+
+   def estimate_noise_floor(
+      self,
+      file_path: Union[str, Path, DecodedAudio, LevelEnvelope],
+      resource_limits: Optional[ResourceLimits] = None
+   ) -> NoiseFloorEstimate:
+      envelope = file_path if isinstance(file_path, LevelEnvelope) else self.level_envelope(file_path, resource_limits)
+      return derive_threshold(
+         envelope.levels,
+         self.config.auto_threshold_percentile,
+         self.config.auto_threshold_margin_db,
+         AUTO_THRESHOLD_MIN_DYNAMIC_RANGE_DB,
+         self.config.min_silence_threshold_db,
+         self.config.max_silence_threshold_db
+      )
+
+   def preview(
+      self,
+      envelope: LevelEnvelope,
+      threshold: Union[float, str, None] = None,
+      min_silence: Optional[float] = None,
+      start_silence: Optional[float] = None
+   ) -> SegmentMap:
+      # Re-thresholds the measured envelope in-process; no FFmpeg runs
+      if self._is_auto_threshold(threshold):
+         threshold = self.estimate_noise_floor(envelope).threshold_db
+      threshold, min_silence, start_silence = self._resolve_parameters(threshold, min_silence, start_silence)
+      return envelope.segment_map(threshold, min_silence, start_silence)
+
+   def _is_auto_threshold(self, threshold: Union[float, str, None]) -> bool:
+      return threshold == AUTO_THRESHOLD or (threshold is None and self.config.auto_threshold_enabled)
+
+   def _resolve_threshold(
+      self,
+      threshold: Union[float, str, None],
+      source: Union[Path, DecodedAudio],
+      resource_limits: Optional[ResourceLimits] = None
+   ) -> Optional[float]:
+      if not self._is_auto_threshold(threshold):
+         return threshold
+      with stage("noise_floor"):
+         return self.estimate_noise_floor(source, resource_limits).threshold_db
 
    def trim_audio(
       self,
       file_path: Union[str, Path],
       threshold: Optional[float] = None,
       min_silence: Optional[float] = None,
-      start_silence: Optional[float] = None
+      start_silence: Optional[float] = None,
+      output_format: Optional[str] = None,
+      sample_rate: Optional[int] = None,
+      channels: Optional[int] = None,
+      bitrate: Optional[str] = None,
+      on_progress: Optional[ProgressCallback] = None,
+      cancel_token: Optional[CancelToken] = None,
+      output_path: Optional[Union[str, Path]] = None,
+      resource_limits: Optional[ResourceLimits] = None,
+      chain: Optional[Union[ProcessingChain, str]] = None
    ) -> Tuple[str, Optional[str]]:
       if not file_path:
          return "No file provided", None
 
-      try:
+      job = None
+      with track_job(self.metrics, "trim_audio"):
+         try:
+            job = self._prepare_job(
+               file_path, threshold, min_silence, start_silence, output_format, sample_rate, channels, bitrate, output_path,
+               resource_limits, chain
+            )
+
+            cached = self._restore_cached(job) or self._pass_through(job)
+            if cached:
+               return cached
+
+            self._measure_fade_out(job)
+            with stage("ffmpeg"), get_resource_governor(job.limits).job() as apply_limits:
+               returncode, stderr = run_with_progress(
+                  job.command,
+                  timeout=job.timeout,
+                  on_progress=on_progress,
+                  cancel_token=cancel_token,
+                  stall_timeout=self.config.progress_stall_timeout_seconds or None,
+                  input_duration=job.input_duration,
+                  on_spawn=apply_limits
+               )
+
+            return self._collect_result(returncode, stderr, job)
+
+         except subprocess.TimeoutExpired:
+            record_failure("timeout")
+            return "Processing timed out", None
+
+         except (TrimlyError, UnsupportedFormatError, FFmpegNotFoundError) as e:
+            record_failure(type(e).__name__)
+            return str(e), None
+
+         except Exception as e:
+            record_failure("unexpected")
+            return f"Unexpected error: {str(e)}", None
+
+         finally:
+            self._discard_job(job)
+
+   def trim_audio_parallel(
+      self,
+      file_path: Union[str, Path],
+      threshold: Optional[float] = None,
+      min_silence: Optional[float] = None,
+      start_silence: Optional[float] = None,
+      output_format: Optional[str] = None,
+      sample_rate: Optional[int] = None,
+      channels: Optional[int] = None,
+      bitrate: Optional[str] = None,
+      max_workers: Optional[int] = None,
+      chain: Optional[Union[ProcessingChain, str]] = None,
+      resource_limits: Optional[ResourceLimits] = None
+   ) -> Tuple[str, Optional[str]]:
+      if not file_path:
+         return "No file provided", None
+
+      partial_output = None
+      with track_job(self.metrics, "trim_audio_parallel"):
+         try:
+            with stage("validate"):
+               input_path = self.validate_file(file_path)
+            chain = self._resolve_chain(chain)
+            if chain.stages != (chain.silence_removal,):
+               # Loudness, filters and fades need the whole recording, so other chains run in one pass
+               return self.trim_audio(
+                  input_path, threshold, min_silence, start_silence, output_format, sample_rate, channels, bitrate,
+                  resource_limits=resource_limits, chain=chain
+               )
+            threshold, min_silence, start_silence = self._chain_parameters(chain, threshold, min_silence, start_silence)
+            threshold = self._resolve_threshold(threshold, input_path, resource_limits)
+            threshold, min_silence, start_silence = self._resolve_parameters(threshold, min_silence, start_silence)
+            timeout = self.config.processing_operation_timeout_seconds
+            workers = max_workers or self.config.batch_max_workers or os.cpu_count() or 1
+            limits = self.resource_limits.merged(resource_limits)
+
+            annotate(input_bytes=input_path.stat().st_size)
+            with stage("analysis"), get_resource_governor(limits).job() as apply_limits:
+               segment_map = detect_segments(
+                  input_path,
+                  threshold,
+                  min_silence,
+                  start_silence,
+                  timeout=timeout,
+                  global_args=limits.global_args(),
+                  on_spawn=apply_limits
+               )
+            annotate(input_duration=segment_map.duration)
+            split_points = plan_split_points(segment_map, workers, self.config.split_min_chunk_seconds)
+            if not split_points:
+               # Too short (or too few pauses) to be worth splitting
+               return self.trim_audio(
+                  input_path, threshold, min_silence, start_silence, output_format, sample_rate, channels, bitrate,
+                  resource_limits=resource_limits, chain=chain
+               )
+
+            output_suffix, output_args = self._resolve_output(output_format, sample_rate, channels, bitrate)
+            output_path = self.storage.allocate(input_path.stem, output_suffix)
+            partial_output = self.storage.partial_path(output_path)
+            with stage("ffmpeg"), get_resource_governor(limits).job() as apply_limits:
+               trim_in_chunks(
+                  input_path,
+                  partial_output,
+                  split_points,
+                  self._render_silence_filter(threshold, min_silence, start_silence),
+                  output_args=[*output_args, *limits.output_args()],
+                  max_workers=workers,
+                  work_directory=self.tmp_dir,
+                  timeout=timeout,
+                  global_args=limits.global_args(),
+                  on_spawn=apply_limits
+               )
+
+            if not partial_output.exists() or partial_output.stat().st_size == 0:
+               record_failure("empty_output")
+               return "Failed to process audio: Output file missing or empty", None
+
+            annotate(output_bytes=partial_output.stat().st_size)
+            self.storage.commit(partial_output, output_path)
+            return f"Successfully trimmed: {output_path.name} ({len(split_points) + 1} parallel chunks)", str(output_path)
+
+         except subprocess.TimeoutExpired:
+            record_failure("timeout")
+            return "Processing timed out", None
+
+         except (TrimlyError, UnsupportedFormatError, FFmpegNotFoundError) as e:
+            record_failure(type(e).__name__)
+            return str(e), None
+
+         except Exception as e:
+            record_failure("unexpected")
+            return f"Unexpected error: {str(e)}", None
+
+         finally:
+            if partial_output is not None:
+               self.storage.discard(partial_output)
+
+   async def trim_audio_async(
+      self,
+      file_path: Union[str, Path],
+      threshold: Optional[float] = None,
+      min_silence: Optional[float] = None,
+      start_silence: Optional[float] = None,
+      output_format: Optional[str] = None,
+      sample_rate: Optional[int] = None,
+      channels: Optional[int] = None,
+      bitrate: Optional[str] = None,
+      semaphore: Optional[asyncio.Semaphore] = None,
+      output_path: Optional[Union[str, Path]] = None,
+      resource_limits: Optional[ResourceLimits] = None,
+      chain: Optional[Union[ProcessingChain, str]] = None
+   ) -> Tuple[str, Optional[str]]:
+      if not file_path:
+         return "No file provided", None
+
+      job = None
+      with track_job(self.metrics, "trim_audio_async"):
+         try:
+            # Hashing the input for the result cache reads the whole file, so keep it off the event loop
+            job = await asyncio.to_thread(
+               self._prepare_job,
+               file_path, threshold, min_silence, start_silence, output_format, sample_rate, channels, bitrate, output_path,
+               resource_limits, chain
+            )
+
+            cached = self._restore_cached(job)
+            if cached:
+               return cached
+
+            async with semaphore or self._get_async_semaphore():
+               passed = await asyncio.to_thread(self._pass_through, job)
+               if passed:
+                  return passed
+               await asyncio.to_thread(self._measure_fade_out, job)
+
+               with stage("ffmpeg"), get_resource_governor(job.limits).job() as apply_limits:
+                  process = await asyncio.create_subprocess_exec(
+                     *job.command,
+                     stdout=asyncio.subprocess.DEVNULL,
+                     stderr=asyncio.subprocess.PIPE
+                  )
+                  try:
+                     apply_limits(process.pid)
+                     _, stderr = await asyncio.wait_for(
+                        process.communicate(),
+                        timeout=job.timeout
+                     )
+                  except BaseException:
+                     # Timed out, limits failed or the awaiting task was cancelled: never leave ffmpeg running behind us
+                     if process.returncode is None:
+                        process.kill()
+                        await asyncio.shield(process.wait())
+                     raise
+
+            return self._collect_result(process.returncode, stderr.decode(errors="replace"), job)
+
+         except asyncio.TimeoutError:
+            record_failure("timeout")
+            return "Processing timed out", None
+
+         except (TrimlyError, UnsupportedFormatError, FFmpegNotFoundError) as e:
+            record_failure(type(e).__name__)
+            return str(e), None
+
+         except Exception as e:
+            record_failure("unexpected")
+            return f"Unexpected error: {str(e)}", None
+
+         finally:
+            self._discard_job(job)
+
+   def submit(
+      self,
+      file_path: Union[str, Path],
+      threshold: Optional[float] = None,
+      min_silence: Optional[float] = None,
+      start_silence: Optional[float] = None,
+      output_format: Optional[str] = None,
+      sample_rate: Optional[int] = None,
+      channels: Optional[int] = None,
+      bitrate: Optional[str] = None,
+      priority: str = "normal",
+      block: bool = False,
+      on_progress: Optional[ProgressCallback] = None,
+      cancel_token: Optional[CancelToken] = None,
+      output_path: Optional[Union[str, Path]] = None,
+      resource_limits: Optional[ResourceLimits] = None,
+      chain: Optional[Union[ProcessingChain, str]] = None
+   ) -> Future:
+      # Raises SchedulerFullError when the queue is full and block is False
+      return self.scheduler.submit(
+         self.trim_audio,
+         file_path,
+         threshold,
+         min_silence,
+         start_silence,
+         output_format,
+         sample_rate,
+         channels,
+         bitrate,
+         on_progress,
+         cancel_token,
+         output_path,
+         resource_limits,
+         chain,
+         priority=priority,
+         block=block
+      )
+
+   def _get_async_semaphore(self) -> asyncio.Semaphore:
+      # asyncio primitives are bound to the loop that first uses them, so keep one per running loop
+      loop = asyncio.get_running_loop()
+      semaphore = self._async_semaphores.get(loop)
+      if semaphore is None:
+         limit = self.config.async_max_concurrent_processes or os.cpu_count() or 1
+         semaphore = self._async_semaphores.setdefault(loop, asyncio.Semaphore(limit))
+      return semaphore
+
+   def _prepare_job(
+      self,
+      file_path: Union[str, Path],
+      threshold: Optional[float] = None,
+      min_silence: Optional[float] = None,
+      start_silence: Optional[float] = None,
+      output_format: Optional[str] = None,
+      sample_rate: Optional[int] = None,
+      channels: Optional[int] = None,
+      bitrate: Optional[str] = None,
+      output_path: Optional[Union[str, Path]] = None,
+      resource_limits: Optional[ResourceLimits] = None,
+      chain: Optional[Union[ProcessingChain, str]] = None
+   ) -> _TrimJob:
+      with stage("validate"):
          input_path = self.validate_file(file_path)
+      annotate(input_bytes=input_path.stat().st_size)
+      chain = self._resolve_chain(chain)
+      threshold, min_silence, start_silence = self._chain_parameters(chain, threshold, min_silence, start_silence)
+      auto_threshold = None
+      if chain.silence_removal is not None and self._is_auto_threshold(threshold):
+         threshold = auto_threshold = self._resolve_threshold(threshold, input_path, resource_limits)
+
+      # An explicit output path also selects the output format, unless one is given
+      if output_path is not None and output_format is None and Path(output_path).suffix:
+         output_format = Path(output_path).suffix
+
+      media = self.probe(input_path)
+      with stage("parameters"):
+         silence_filter = self._render_chain_silence_filter(chain, threshold, min_silence, start_silence)
+         output_suffix, output_args = self._resolve_output(output_format, sample_rate, channels, bitrate)
+
+      if output_path is not None:
+         output_path = Path(output_path).with_suffix(output_suffix)
+         output_path.parent.mkdir(parents=True, exist_ok=True)
+      else:
+         output_path = self.storage.allocate(input_path.stem, output_suffix)
+      partial_output = self.storage.partial_path(output_path)
+
+      # An input already in the output's format can be copied unchanged when there is next to nothing to trim
+      preflight = None
+      if self._can_pass_through(chain, input_path, media, output_suffix, sample_rate, channels, bitrate):
+         preflight = self._resolve_parameters(threshold, min_silence, start_silence)
+
+      content_hash = None
+      if self.result_cache is not None or self.pcm_cache is not None:
+         with stage("hash"):
+            content_hash = hash_file(input_path)
+
+      input_args = ["-i", str(input_path)]
+      input_duration = media.duration if media is not None else None
+      input_sample_rate = media.sample_rate if media is not None else None
+      pcm_entry = self.pcm_cache.find(content_hash) if self.pcm_cache is not None else None
+      pcm_size = None
+      if pcm_entry is not None:
+         try:
+            pcm_size = pcm_entry[0].stat().st_size
+         except OSError:
+            # Evicted since the lookup; decode the input as usual
+            pcm_entry = None
+      if pcm_entry is not None:
+         # Read the previously decoded PCM instead of decoding the compressed input again
+         pcm_path, layout = pcm_entry
+         input_args = ["-f", "f32le", "-ar", str(layout["sample_rate"]), "-ac", str(layout["channels"]), "-i", str(pcm_path)]
+         # Raw PCM has no container duration for FFmpeg to report, but its length follows from the layout
+         input_duration = pcm_size / (4 * layout["sample_rate"] * layout["channels"])
+         input_sample_rate = layout["sample_rate"]
 
-         threshold = threshold or self.config.default_silence_threshold_db
-         min_silence = min_silence or self.config.default_min_silence_duration_seconds
-         start_silence = start_silence or self.config.default_start_silence_keep_duration_seconds
+      # A fade-out's rendering depends on how it is placed, so the cache key uses its spec instead
+      audio_filter = chain.render(silence_filter, input_sample_rate, until_fade_out=chain.fade_out is not None)
+      cache_key = None
+      if self.result_cache is not None:
+         filter_key = audio_filter if chain.fade_out is None else f"{audio_filter},{chain.fade_out.spec()}"
+         cache_key = ResultCache.make_key(content_hash, filter_key, " ".join(output_args), get_ffmpeg_version())
 
-         self.validate_parameters(threshold, min_silence, start_silence)
+      timeout = self._timeout_for(input_path)
+      render_fade_out = None
+      if chain.fade_out is not None:
+         channel_count = pcm_entry[1]["channels"] if pcm_entry is not None else media.channels if media is not None else None
+         fade_rate = max(input_sample_rate or 0, chain.output_sample_rate(input_sample_rate) or 0)
+         buffered_bytes = (input_duration or 0) * fade_rate * (channel_count or 0) * 8
+         if 0 < buffered_bytes <= FADE_OUT_REVERSE_MAX_BYTES:
+            # Short enough to buffer: fade the reversed stream in, in the same pass
+            audio_filter = chain.render(silence_filter, input_sample_rate)
+         else:
+            # Measured by _measure_fade_out only once the job turns out to need FFmpeg
+            render_fade_out = functools.partial(chain.render, silence_filter, input_sample_rate)
 
-         output_path = self.tmp_dir / f"{input_path.stem}.wav"
+      # The decode is only persisted when its float32 size (duration × rate × channels × 4) is known to fit the cache
+      pcm_partial = None
+      if (
+         self.pcm_cache is not None
+         and pcm_entry is None
+         and input_path.suffix.lower() != ".wav"
+         and media is not None and media.duration and media.sample_rate and media.channels
+         and media.duration * media.sample_rate * media.channels * 4 <= self.pcm_cache.max_bytes * PCM_CACHE_MAX_ENTRY_FRACTION
+      ):
+         pcm_partial = self.pcm_cache.partial_path(content_hash)
 
-         silence_filter = self.config.ffmpeg_silence_filter_template.format(
-                start_silence=start_silence,
-                threshold=threshold,
-                min_silence=min_silence
+      limits = self.resource_limits.merged(resource_limits)
+      cmd = [
+            "ffmpeg", "-hide_banner", "-loglevel", "error",
+            *PROGRESS_ARGS,
+            *limits.global_args(),
+            "-y", *input_args,
+            "-af", audio_filter,
+            *output_args,
+            *limits.output_args(),
+            str(partial_output)
+      ]
+
+      if pcm_partial is not None:
+         # Persist this decode as a second output of the same pass so later retries skip it
+         cmd += ["-map", "0:a", "-f", "f32le", *limits.output_args(), str(pcm_partial)]
+
+      return _TrimJob(
+         input_path,
+         output_path,
+         partial_output,
+         cmd,
+         cache_key,
+         content_hash,
+         pcm_partial,
+         input_duration,
+         media,
+         timeout,
+         limits,
+         auto_threshold,
+         input_args,
+         audio_filter,
+         output_args,
+         preflight,
+         render_fade_out
+      )
+
+   def _resolve_output(
+      self,
+      output_format: Optional[str],
+      sample_rate: Optional[int],
+      channels: Optional[int],
+      bitrate: Optional[str]
+   ) -> Tuple[str, List[str]]:
+      output_suffix = normalize_output_format(output_format or self.config.output_audio_format)
+      output_args = build_output_args(
+         output_suffix,
+         sample_rate or self.config.output_sample_rate,
+         channels or self.config.output_channels,
+         bitrate or self.config.output_bitrate
+      )
+
+      encoder = output_args[output_args.index("-c:a") + 1]
+      if not self.ffmpeg_capabilities.has_encoder(encoder):
+         raise UnsupportedFormatError(
+            f"Output format {output_suffix} needs the {encoder} encoder, which this FFmpeg build does not provide"
+         )
+      return output_suffix, output_args
+
+   def _resolve_parameters(
+      self,
+      threshold: Optional[float],
+      min_silence: Optional[float],
+      start_silence: Optional[float]
+   ) -> Tuple[float, float, float]:
+      if threshold == AUTO_THRESHOLD:
+         raise TrimlyError("The automatic threshold needs a file to measure; pass a threshold in dB instead")
+      threshold = threshold or self.config.default_silence_threshold_db
+      min_silence = min_silence or self.config.default_min_silence_duration_seconds
+      start_silence = start_silence or self.config.default_start_silence_keep_duration_seconds
+
+      self.validate_parameters(threshold, min_silence, start_silence)
+      return threshold, min_silence, start_silence
+
+   def _resolve_chain(self, chain: Optional[Union[ProcessingChain, str]]) -> ProcessingChain:
+      if isinstance(chain, ProcessingChain):
+         return chain
+      if not chain:
+         return self.default_chain
+      try:
+         return ProcessingChain.parse(chain)
+      except ValueError as e:
+         raise TrimlyError(str(e))
+
+   @staticmethod
+   def _chain_parameters(
+      chain: ProcessingChain,
+      threshold: Optional[float],
+      min_silence: Optional[float],
+      start_silence: Optional[float]
+   ) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+      # Options set on the chain's silence stage take precedence over the call's parameters
+      removal = chain.silence_removal
+      if removal is None:
+         return threshold, min_silence, start_silence
+      return (
+         threshold if removal.threshold is None else removal.threshold,
+         min_silence if removal.min_silence is None else removal.min_silence,
+         start_silence if removal.start_silence is None else removal.start_silence
+      )
+
+   def _render_chain_silence_filter(
+      self,
+      chain: ProcessingChain,
+      threshold: Optional[float],
+      min_silence: Optional[float],
+      start_silence: Optional[float]
+   ) -> Optional[str]:
+      if chain.silence_removal is None:
+         return None
+      return self._render_silence_filter(threshold, min_silence, start_silence)
+
+   def _measure_fade_out(self, job: _TrimJob) -> None:
+      if job.render_fade_out is None:
+         return
+      # Silence removal makes the output length unknowable up front, so run the stages
+      # before the fade once without encoding and count the samples that reach it
+      with stage("measure"), get_resource_governor(job.limits).job() as apply_limits:
+         fade_out_at = count_samples(
+            job.input_args,
+            job.audio_filter,
+            timeout=job.timeout,
+            global_args=job.limits.global_args(),
+            on_spawn=apply_limits
+         )
+      job.audio_filter = job.render_fade_out(fade_out_at=fade_out_at)
+      job.command[job.command.index("-af") + 1] = job.audio_filter
+      job.render_fade_out = None
+
+   def _render_silence_filter(
+      self,
+      threshold: Optional[float],
+      min_silence: Optional[float],
+      start_silence: Optional[float]
+   ) -> str:
+      threshold, min_silence, start_silence = self._resolve_parameters(threshold, min_silence, start_silence)
+
+      return self.config.ffmpeg_silence_filter_template.format(
+            start_silence=start_silence,
+            threshold=threshold,
+            min_silence=min_silence
+         )
+
+   def _can_pass_through(
+      self,
+      chain: ProcessingChain,
+      input_path: Path,
+      media: Optional[MediaInfo],
+      output_suffix: str,
+      sample_rate: Optional[int],
+      channels: Optional[int],
+      bitrate: Optional[str]
+   ) -> bool:
+      if not self.config.preflight_min_removed_seconds or chain.stages != (chain.silence_removal,):
+         return False
+      if input_path.suffix.lower() != output_suffix:
+         return False
+      config = self.config
+      if sample_rate or channels or bitrate or config.output_sample_rate or config.output_channels or config.output_bitrate:
+         return False
+      # The input must already hold what the encoder would write, e.g. 16-bit PCM in WAV or Vorbis rather than Opus in OGG
+      return media is not None and media.codec == OUTPUT_AUDIO_CODECS[output_suffix]
+
+   def _pass_through(self, job: _TrimJob) -> Optional[Tuple[str, Optional[str]]]:
+      if job.preflight is None:
+         return None
+
+      try:
+         with stage("preflight"):
+            segment_map = self._preflight_scan(job)
+      except TrimlyError:
+         # The scan is only a shortcut; the trim itself reports what is wrong with the input
+         return None
+      if segment_map.removed_duration >= self.config.preflight_min_removed_seconds:
+         return None
+
+      # Copied rather than hard-linked, so nothing done to the output can reach the caller's input
+      shutil.copyfile(job.input_path, job.partial_output)
+      self.storage.commit(job.partial_output, job.output_path)
+      annotate(output_bytes=job.output_path.stat().st_size, input_duration=segment_map.duration)
+      return (
+         f"Skipped trimming: {job.output_path.name} (copied unchanged, "
+         f"{segment_map.removed_duration:.2f}s of silence to remove{self._describe_threshold(job, ', ')})",
+         str(job.output_path)
+      )
+
+   def _preflight_scan(self, job: _TrimJob) -> SegmentMap:
+      with get_resource_governor(job.limits).job() as apply_limits:
+         if not has_numpy():
+            return detect_segments(
+               job.input_path, *job.preflight, timeout=job.timeout, global_args=job.limits.global_args(), on_spawn=apply_limits
             )
 
-         cmd = [
-               "ffmpeg", "-y", "-i", str(input_path),
-               "-af", silence_filter,
-               str(output_path)
-         ]
-
-         result = subprocess.run(
-               cmd,
-               capture_output=True,
-               text=True,
-               timeout=self.config.processing_operation_timeout_seconds
+         # Whether there is silence worth removing shows just as well in a low-rate mono decode. A short resampling filter
+         # keeps it cheap: aliased highs still register as level, and mixing channels only lowers it, so the scan errs
+         # towards trimming
+         audio = decode_pcm(
+            job.input_path,
+            PREFLIGHT_SAMPLE_RATE,
+            1,
+            timeout=job.timeout,
+            global_args=job.limits.global_args(),
+            on_spawn=apply_limits,
+            audio_filter=f"aresample={PREFLIGHT_SAMPLE_RATE}:filter_size=2:phase_shift=0",
+            work_directory=self.tmp_dir
          )
+      window_seconds = self.config.analysis_window_seconds
+      envelope = LevelEnvelope(str(job.input_path), audio.duration, window_seconds, peak_levels(audio, window_seconds))
+      return envelope.segment_map(*job.preflight)
 
-         if result.returncode != 0:
-               error = result.stderr.strip() or "Unknown FFmpeg error"
-               return f"Failed to process audio: {error}", None
+   def _restore_cached(self, job: _TrimJob) -> Optional[Tuple[str, Optional[str]]]:
+      if job.cache_key is None:
+         return None
 
-         if not output_path.exists() or output_path.stat().st_size == 0:
-               return "Failed to process audio: Output file missing or empty", None
+      with stage("cache_lookup"):
+         cached_path = self.result_cache.get(job.cache_key)
+         if cached_path is None:
+            return None
+
+         try:
+            link_or_copy(cached_path, job.output_path)
+         except OSError:
+            # Evicted between lookup and restore; fall back to processing
+            return None
+         # A hard link keeps the cache entry's old mtime, which would put a fresh output first in line for eviction
+         self.storage.touch(job.output_path)
+      annotate(cache_hit=True, output_bytes=job.output_path.stat().st_size)
+      return f"Successfully trimmed: {job.output_path.name} (cached{self._describe_threshold(job, ', ')})", str(job.output_path)
+
+   def _collect_result(self, returncode: int, stderr: str, job: _TrimJob) -> Tuple[str, Optional[str]]:
+      output_path = job.output_path
+
+      if returncode != 0:
+            record_failure("ffmpeg_error")
+            error = stderr.strip() or "Unknown FFmpeg error"
+            return f"Failed to process audio: {error}", None
+
+      if not job.partial_output.exists() or job.partial_output.stat().st_size == 0:
+            record_failure("empty_output")
+            return "Failed to process audio: Output file missing or empty", None
+
+      with stage("collect"):
+         annotate(
+            output_bytes=job.partial_output.stat().st_size,
+            input_duration=job.input_duration
+         )
+         self.storage.commit(job.partial_output, output_path)
+
+         if job.cache_key is not None:
+            self.result_cache.put(job.cache_key, output_path)
+
+      if job.pcm_partial is not None and job.pcm_partial.exists():
+         media = job.media
+         self.pcm_cache.publish(
+            job.content_hash,
+            job.pcm_partial,
+            {"sample_rate": media.sample_rate, "channels": media.channels, "codec": media.codec}
+         )
+
+      return f"Successfully trimmed: {output_path.name}{self._describe_threshold(job, ' (', ')')}", str(output_path)
+
+   @staticmethod
+   def _describe_threshold(job: _TrimJob, prefix: str = "", suffix: str = "") -> str:
+      if job.auto_threshold is None:
+         return ""
+      return f"{prefix}auto threshold {job.auto_threshold:g} dB{suffix}"
+
+   def _discard_job(self, job: Optional[_TrimJob]) -> None:
+      if job is None:
+         return
+      self.storage.discard(job.partial_output)
+      if job.pcm_partial is not None:
+         job.pcm_partial.unlink(missing_ok=True)
+
+   def trim_stream(
+      self,
+      source: ChunkSource,
+      threshold: Optional[float] = None,
+      min_silence: Optional[float] = None,
+      start_silence: Optional[float] = None,
+      input_format: Optional[str] = None,
+      sample_rate: Optional[int] = None,
+      channels: Optional[int] = None,
+      output_format: str = "wav",
+      chunk_size: Optional[int] = None,
+      resource_limits: Optional[ResourceLimits] = None,
+      timeout: Optional[float] = None
+   ) -> Iterator[bytes]:
+      silence_filter = self._render_silence_filter(threshold, min_silence, start_silence)
+      limits = self.resource_limits.merged(resource_limits)
+      cmd = build_stream_command(
+         silence_filter,
+         input_format,
+         sample_rate,
+         channels,
+         output_format,
+         global_args=limits.global_args(),
+         output_args=limits.output_args()
+      )
+      return self._stream_with_limits(cmd, source, chunk_size or self.config.stream_chunk_size_bytes, limits, timeout)
+
+   def _stream_with_limits(
+      self,
+      cmd: List[str],
+      source: ChunkSource,
+      chunk_size: int,
+      limits: ResourceLimits,
+      timeout: Optional[float]
+   ) -> Iterator[bytes]:
+      # A live source has no length to derive a hard timeout from, so a stalled pipe is what gets caught
+      with get_resource_governor(limits).job() as apply_limits:
+         yield from stream_ffmpeg(
+            cmd,
+            source,
+            chunk_size,
+            timeout=timeout,
+            on_spawn=apply_limits,
+            stall_timeout=self.config.progress_stall_timeout_seconds or None
+         )
+
+   def trim_bytes(
+      self,
+      data: Union[BytesLike, BinaryIO],
+      threshold: Optional[float] = None,
+      min_silence: Optional[float] = None,
+      start_silence: Optional[float] = None,
+      output_format: Optional[str] = None,
+      sample_rate: Optional[int] = None,
+      channels: Optional[int] = None,
+      bitrate: Optional[str] = None,
+      output: Optional[BinaryIO] = None,
+      resource_limits: Optional[ResourceLimits] = None,
+      chain: Optional[Union[ProcessingChain, str]] = None
+   ) -> Tuple[str, Optional[Union[bytes, BinaryIO]]]:
+      if data is None:
+         return "No audio data provided", None
+
+      spill_path = None
+      with track_job(self.metrics, "trim_bytes"):
+         try:
+            chunk_size = self.config.stream_chunk_size_bytes
+            max_bytes = int(self.config.max_input_file_size_mb * 1024 * 1024) or None
+            with stage("validate"):
+               # The container is identified from its magic bytes; there is no file name to go by
+               buffered = None
+               if hasattr(data, "read"):
+                  head = header = read_head(data, SNIFF_HEADER_BYTES)
+               else:
+                  data = memoryview(data).cast("B")
+                  if max_bytes is not None and data.nbytes > max_bytes:
+                     raise TrimlyError(
+                        f"Audio data is too large: {data.nbytes / (1024 * 1024):.1f} MB "
+                        f"(limit {self.config.max_input_file_size_mb:g} MB)"
+                     )
+                  annotate(input_bytes=data.nbytes)
+                  head, header, buffered = b"", data[:SNIFF_HEADER_BYTES], data
+               input_suffix = require_audio_format(header, self.config.supported_audio_formats)
+
+               source = iter_buffer(data, chunk_size, max_bytes, head=head)
+               input_url = "pipe:0"
+               if input_suffix == ".m4a":
+                  # MP4 with its index after the media data can only be demuxed from a seekable file
+                  contents = buffered = b"".join(source)
+                  if mp4_needs_seek(contents):
+                     spill_path = self.storage.partial_path(self.storage.allocate("buffer", input_suffix))
+                     spill_path.write_bytes(contents)
+                     source, input_url = [], str(spill_path)
+                  else:
+                     source = iter_buffer(contents, chunk_size)
+
+            with stage("parameters"):
+               chain = self._resolve_chain(chain)
+               if chain.fade_out is not None:
+                  raise TrimlyError("A fade-out needs the length of the audio and is not supported for in-memory audio")
+               threshold, min_silence, start_silence = self._chain_parameters(chain, threshold, min_silence, start_silence)
+               silence_filter = self._render_chain_silence_filter(chain, threshold, min_silence, start_silence)
+               output_suffix, output_args = self._resolve_output(output_format, sample_rate, channels, bitrate)
+
+               input_sample_rate = None
+               if any(isinstance(item, Loudnorm) for item in chain.stages):
+                  # loudnorm outputs 192 kHz, so read the rate to restore from the headers rather than assume one
+                  if spill_path is not None:
+                     input_sample_rate = probe_media(spill_path, MEDIA_PROBE_TIMEOUT_SECONDS).sample_rate
+                  else:
+                     if buffered is None:
+                        head = read_head(data, BUFFER_PROBE_BYTES, head)
+                        source = iter_buffer(data, chunk_size, max_bytes, head=head)
+                        buffered = head
+                     _, input_sample_rate, _ = probe_audio_header(bytes(buffered[:BUFFER_PROBE_BYTES]), MEDIA_PROBE_TIMEOUT_SECONDS)
+            limits = self.resource_limits.merged(resource_limits)
+            cmd = build_stream_command(
+               chain.render(silence_filter, input_sample_rate),
+               INPUT_DEMUXERS[input_suffix],
+               output_format=PIPE_OUTPUT_MUXERS[output_suffix],
+               global_args=limits.global_args(),
+               output_args=[*pipe_output_args(output_args), *limits.output_args()],
+               input_url=input_url,
+               low_latency=False
+            )
+
+            sink = io.BytesIO() if output is None else output
+            with stage("ffmpeg"), get_resource_governor(limits).job() as apply_limits:
+               chunks = stream_ffmpeg(
+                  cmd,
+                  source,
+                  chunk_size,
+                  timeout=self.config.processing_operation_timeout_seconds,
+                  on_spawn=apply_limits,
+                  stall_timeout=self.config.progress_stall_timeout_seconds or None
+               )
+               written = write_stream(chunks, sink, wav=output_suffix == ".wav")
+
+            if written == 0:
+               record_failure("empty_output")
+               return "Failed to process audio: Output is empty", None
+            annotate(output_bytes=written)
+            message = f"Successfully trimmed: {written} bytes of {output_suffix[1:]} audio"
+            return message, sink.getvalue() if output is None else output
+
+         except subprocess.TimeoutExpired:
+            record_failure("timeout")
+            return "Processing timed out", None
+
+         except (TrimlyError, UnsupportedFormatError, FFmpegNotFoundError) as e:
+            record_failure(type(e).__name__)
+            return str(e), None
 
-         return f"Successfully trimmed: {output_path.name}", str(output_path)
+         except Exception as e:
+            record_failure("unexpected")
+            return f"Unexpected error: {str(e)}", None
+
+         finally:
+            if spill_path is not None:
+               self.storage.discard(spill_path)
+
+   def decode_audio(
+      self,
+      file_path: Union[str, Path],
+      sample_rate: Optional[int] = None,
+      channels: Optional[int] = None,
+      resource_limits: Optional[ResourceLimits] = None
+   ) -> DecodedAudio:
+      input_path = self.validate_file(file_path)
+      timeout = self._timeout_for(input_path)
+      limits = self.resource_limits.merged(resource_limits)
+      with get_resource_governor(limits).job() as apply_limits:
+         if self.pcm_cache is not None:
+            return self.pcm_cache.load(
+               input_path, sample_rate, channels, timeout=timeout, global_args=limits.global_args(), on_spawn=apply_limits
+            )
+         return decode_pcm(
+            input_path,
+            sample_rate,
+            channels,
+            timeout=timeout,
+            global_args=limits.global_args(),
+            on_spawn=apply_limits,
+            work_directory=self.tmp_dir
+         )
+
+   def analyze(
+      self,
+      file_path: Union[str, Path, DecodedAudio],
+      threshold: Optional[float] = None,
+      min_silence: Optional[float] = None,
+      start_silence: Optional[float] = None,
+      engine: Optional[str] = None,
+      detection: Optional[str] = None,
+      resource_limits: Optional[ResourceLimits] = None
+   ) -> SegmentMap:
+      with track_job(self.metrics, "analyze"):
+         engine = engine or self.config.analysis_engine
+         detection = detection or self.config.analysis_detection_mode
+
+         # Already-decoded audio is always evaluated in-process
+         if isinstance(file_path, DecodedAudio) or engine == "numpy":
+            with stage("decode"):
+               audio = file_path if isinstance(file_path, DecodedAudio) else self.decode_audio(
+                  file_path, resource_limits=resource_limits
+               )
+            threshold = self._resolve_threshold(threshold, audio)
+            threshold, min_silence, start_silence = self._resolve_parameters(threshold, min_silence, start_silence)
+            with stage("analysis"):
+               segment_map = detect_segments_numpy(
+                  audio,
+                  threshold,
+                  min_silence,
+                  start_silence,
+                  mode=detection,
+                  window_seconds=self.config.analysis_window_seconds
+               )
+            annotate(input_duration=segment_map.duration)
+            return segment_map
+
+         if engine != "ffmpeg":
+            raise TrimlyError(f"Unknown analysis engine: {engine}")
+         if detection != "peak":
+            raise TrimlyError(f"The ffmpeg analysis engine only supports peak detection, got: {detection}")
+         if not self.ffmpeg_capabilities.has_silencedetect:
+            raise TrimlyError(f"FFmpeg ({self.ffmpeg_capabilities.version}) does not provide the silencedetect filter")
+
+         with stage("validate"):
+            input_path = self.validate_file(file_path)
+         annotate(input_bytes=input_path.stat().st_size)
+         threshold = self._resolve_threshold(threshold, input_path, resource_limits)
+         threshold, min_silence, start_silence = self._resolve_parameters(threshold, min_silence, start_silence)
+         limits = self.resource_limits.merged(resource_limits)
+         with stage("analysis"), get_resource_governor(limits).job() as apply_limits:
+            segment_map = detect_segments(
+               input_path,
+               threshold,
+               min_silence,
+               start_silence,
+               timeout=self._timeout_for(input_path),
+               global_args=limits.global_args(),
+               on_spawn=apply_limits
+            )
+         annotate(input_duration=segment_map.duration)
+         return segment_map
+
+   def sweep(
+      self,
+      file_path: Union[str, Path, DecodedAudio],
+      thresholds: Iterable[float],
+      min_silences: Iterable[float],
+      start_silence: Optional[float] = None,
+      detection: Optional[str] = None,
+      resource_limits: Optional[ResourceLimits] = None
+   ) -> SweepTable:
+      thresholds, min_silences = list(thresholds), list(min_silences)
+      start_silence = start_silence or self.config.default_start_silence_keep_duration_seconds
+      for threshold in thresholds:
+         self.validate_parameters(threshold, None, start_silence)
+      for min_silence in min_silences:
+         self.validate_parameters(None, min_silence, None)
+
+      audio = file_path if isinstance(file_path, DecodedAudio) else self.decode_audio(file_path, resource_limits=resource_limits)
+      return sweep_parameters(
+         audio,
+         thresholds,
+         min_silences,
+         start_silence,
+         mode=detection or self.config.analysis_detection_mode,
+         window_seconds=self.config.analysis_window_seconds
+      )
+
+   def render_segments(
+      self,
+      segment_map: SegmentMap,
+      mode: str = "accurate",
+      output_path: Optional[Union[str, Path]] = None,
+      output_format: Optional[str] = None,
+      sample_rate: Optional[int] = None,
+      channels: Optional[int] = None,
+      bitrate: Optional[str] = None,
+      resource_limits: Optional[ResourceLimits] = None
+   ) -> Tuple[str, Optional[str]]:
+      if mode not in RENDER_MODES:
+         return f"Unknown render mode: {mode}. Supported modes: {', '.join(RENDER_MODES)}", None
+
+      partial_output = None
+      try:
+         source = Path(segment_map.source)
+         timeout = self.config.processing_operation_timeout_seconds
+         limits = self.resource_limits.merged(resource_limits)
+
+         if mode == "copy":
+            output_path = Path(output_path or self.storage.allocate(source.stem, source.suffix))
+            partial_output = self.storage.partial_path(output_path)
+            with get_resource_governor(limits).job() as apply_limits:
+               render_stream_copy(
+                  segment_map, partial_output, timeout=timeout, global_args=limits.global_args(), on_spawn=apply_limits
+               )
+         else:
+            output_suffix, output_args = self._resolve_output(output_format, sample_rate, channels, bitrate)
+            output_path = Path(output_path or self.storage.allocate(source.stem, output_suffix))
+            partial_output = self.storage.partial_path(output_path)
+            with get_resource_governor(limits).job() as apply_limits:
+               render_accurate(
+                  segment_map,
+                  partial_output,
+                  output_args=[*output_args, *limits.output_args()],
+                  timeout=timeout,
+                  global_args=limits.global_args(),
+                  on_spawn=apply_limits
+               )
+
+         if not partial_output.exists() or partial_output.stat().st_size == 0:
+            return "Failed to render segments: Output file missing or empty", None
+
+         self.storage.commit(partial_output, output_path)
+         return f"Successfully rendered: {output_path.name}", str(output_path)
 
       except subprocess.TimeoutExpired:
          return "Processing timed out", None
 
-      except (TrimlyError, UnsupportedFormatError, FFmpegNotFoundError) as e:
+      except TrimlyError as e:
          return str(e), None
 
       except Exception as e:
          return f"Unexpected error: {str(e)}", None
+
+      finally:
+         if partial_output is not None:
+            self.storage.discard(partial_output)
+
+   def trim_batch(
+      self,
+      file_paths: Iterable[Union[str, Path]],
+      threshold: Optional[float] = None,
+      min_silence: Optional[float] = None,
+      start_silence: Optional[float] = None,
+      file_parameters: Optional[Mapping[Union[str, Path], Mapping[str, Any]]] = None,
+      max_workers: Optional[int] = None,
+      use_processes: bool = False,
+      pack: bool = False
+   ) -> Iterator[Tuple[str, Tuple[str, Optional[str]]]]:
+      shared_parameters = {
+         "threshold": threshold,
+         "min_silence": min_silence,
+         "start_silence": start_silence
+      }
+      overrides = {str(path): dict(parameters) for path, parameters in (file_parameters or {}).items()}
+      workers = max_workers or self.config.batch_max_workers or os.cpu_count() or 1
+
+      # Thread mode shares the process-wide scheduler at batch priority, so interactive jobs keep running ahead of it
+      executor = None
+      if use_processes:
+         # Worker processes receive their parameters pickled; fail before starting any job rather than one job per file
+         for path, parameters in overrides.items():
+            try:
+               pickle.dumps(parameters)
+            except Exception as e:
+               raise TrimlyError(f"Parameters for {path} cannot be sent to a worker process: {e}")
+         executor = ProcessPoolExecutor(max_workers=workers)
+
+      # At most `workers` jobs are in flight at once; finished results are yielded while the rest of the batch is still being submitted
+      pending = {}
+      try:
+         for packed, items in self._plan_batch(file_paths, shared_parameters, overrides, pack, workers):
+            if len(pending) >= workers:
+               done, _ = wait(pending, return_when=FIRST_COMPLETED)
+               for future in done:
+                  yield from self._batch_results(future, *pending.pop(future))
+
+            if packed:
+               if executor is not None:
+                  future = executor.submit(_trim_packed_in_worker, self.config, items)
+               else:
+                  future = self.scheduler.submit(self._trim_packed, items, priority="batch", block=True)
+            else:
+               (file_path, parameters), = items
+               if executor is not None:
+                  future = executor.submit(_trim_in_worker, self.config, file_path, parameters)
+               else:
+                  future = self.scheduler.submit(self.trim_audio, file_path, priority="batch", block=True, **parameters)
+            pending[future] = (packed, [str(file_path) for file_path, _ in items])
+
+         for future in as_completed(list(pending)):
+            yield from self._batch_results(future, *pending.pop(future))
+      finally:
+         if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+         else:
+            for future in pending:
+               self.scheduler.cancel(future)
+
+   @staticmethod
+   def _batch_results(future: Future, packed: bool, paths: List[str]) -> List[Tuple[str, Tuple[str, Optional[str]]]]:
+      try:
+         return future.result() if packed else [(paths[0], future.result())]
+      except Exception as e:
+         return [(path, (f"Unexpected error: {str(e)}", None)) for path in paths]
+
+   def _plan_batch(
+      self,
+      file_paths: Iterable[Union[str, Path]],
+      shared_parameters: Mapping[str, Any],
+      overrides: Mapping[str, Mapping[str, Any]],
+      pack: bool,
+      workers: int
+   ) -> Iterator[Tuple[bool, List[Tuple[Union[str, Path], Dict[str, Any]]]]]:
+      items = ((file_path, {**shared_parameters, **overrides.get(str(file_path), {})}) for file_path in file_paths)
+      if not pack:
+         for item in items:
+            yield False, [item]
+         return
+
+      # Packs are sized by duration; headers are read a few inputs ahead, concurrently, and each pack is yielded as
+      # soon as it closes, so the first jobs start while the rest of the batch is still being probed
+      probed = self._probe_ahead(items, workers)
+      for pack_items in plan_packs(probed, self.config.batch_pack_max_inputs, self.config.batch_pack_max_seconds):
+         yield len(pack_items) > 1, pack_items
+
+   def _probe_ahead(
+      self,
+      items: Iterable[Tuple[Union[str, Path], Dict[str, Any]]],
+      workers: int
+   ) -> Iterator[Tuple[Tuple[Union[str, Path], Dict[str, Any]], Optional[float]]]:
+      # At most two probes per worker are outstanding, so a huge batch is never read ahead of the jobs consuming it
+      window = deque()
+      with ThreadPoolExecutor(max_workers=workers) as probes:
+         for item in items:
+            window.append((item, probes.submit(self._packable_duration, item)))
+            if len(window) > 2 * workers:
+               item, probe = window.popleft()
+               yield item, probe.result()
+         while window:
+            item, probe = window.popleft()
+            yield item, probe.result()
+
+   def _packable_duration(self, item: Tuple[Union[str, Path], Mapping[str, Any]]) -> Optional[float]:
+      file_path, parameters = item
+      if not set(parameters) <= _PACKED_PARAMETERS:
+         return None
+      try:
+         media = self.probe(file_path)
+      except Exception:
+         # Unreadable inputs are trimmed on their own, which reports why
+         return None
+      if media is None or not media.duration or media.duration > self.config.batch_pack_max_clip_seconds:
+         return None
+      return media.duration
+
+   def _trim_packed(
+      self,
+      items: List[Tuple[Union[str, Path], Mapping[str, Any]]]
+   ) -> List[Tuple[str, Tuple[str, Optional[str]]]]:
+      # Inputs the pack cannot finish are retried on their own, so each failure is reported exactly as trim_audio reports it
+      results: List[Optional[Tuple[str, Optional[str]]]] = [None] * len(items)
+      jobs: Dict[int, _TrimJob] = {}
+      alone = []
+      with track_job(self.metrics, "trim_packed"):
+         try:
+            for index, (file_path, parameters) in enumerate(items):
+               try:
+                  jobs[index] = self._prepare_job(file_path, **parameters)
+               except Exception:
+                  alone.append(index)
+                  continue
+               results[index] = self._restore_cached(jobs[index]) or self._pass_through(jobs[index])
+               if results[index] is None:
+                  try:
+                     self._measure_fade_out(jobs[index])
+                  except Exception:
+                     alone.append(index)
+                     del jobs[index]
+
+            pending = [index for index in jobs if results[index] is None]
+            annotate(cache_hit=bool(jobs) and not pending and not alone)
+            while pending:
+               inputs = [self._packed_input(position, jobs[index]) for position, index in enumerate(pending)]
+               limits = jobs[pending[0]].limits
+               try:
+                  with stage("ffmpeg"), get_resource_governor(limits).job() as apply_limits:
+                     returncode, stderr = run_with_progress(
+                        build_packed_command(inputs, limits.global_args()),
+                        # Per-input timeouts add up, but never past the single-operation cap
+                        timeout=min(
+                           sum(jobs[index].timeout for index in pending),
+                           self.config.processing_operation_timeout_seconds
+                        ),
+                        stall_timeout=self.config.progress_stall_timeout_seconds or None,
+                        on_spawn=apply_limits
+                     )
+               except subprocess.TimeoutExpired:
+                  alone += pending
+                  break
+
+               # A pack of one fails exactly as trim_audio would
+               if returncode == 0 or len(pending) == 1:
+                  for index in pending:
+                     results[index] = self._collect_result(returncode, stderr, jobs[index])
+                  break
+
+               # Drop the inputs FFmpeg named and run the rest of the pack again; with no culprit, every input goes alone
+               culprits = attribute_errors(stderr, inputs)
+               if not culprits:
+                  alone += pending
+                  break
+               alone += [pending[position] for position in sorted(culprits)]
+               pending = [index for position, index in enumerate(pending) if position not in culprits]
+
+            annotate(
+               input_bytes=sum(job.input_path.stat().st_size for job in jobs.values()),
+               output_bytes=sum(job.output_path.stat().st_size for job in jobs.values() if job.output_path.exists()),
+               input_duration=sum(job.input_duration or 0.0 for job in jobs.values())
+            )
+         finally:
+            for job in jobs.values():
+               self._discard_job(job)
+
+      for index in sorted(alone):
+         file_path, parameters = items[index]
+         results[index] = self.trim_audio(file_path, **parameters)
+      return [(str(file_path), result) for (file_path, _), result in zip(items, results)]
+
+   @staticmethod
+   def _packed_input(position: int, job: _TrimJob) -> PackedInput:
+      extra_output_args = []
+      if job.pcm_partial is not None:
+         extra_output_args = ["-map", f"{position}:a", "-f", "f32le", *job.limits.output_args(), str(job.pcm_partial)]
+      return PackedInput(
+         job.input_args,
+         job.audio_filter,
+         [*job.output_args, *job.limits.output_args(), str(job.partial_output)],
+         extra_output_args,
+         (job.input_args[-1], str(job.partial_output))
+      )
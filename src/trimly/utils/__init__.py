@@ -1,14 +1,40 @@
-from .exceptions import TrimlyError, UnsupportedFormatError, FFmpegNotFoundError
+from .exceptions import TrimlyError, UnsupportedFormatError, FFmpegNotFoundError, SchedulerFullError, JobCancelledError
 from .file_validation import validate_audio_file
+from .format_sniffing import SNIFF_HEADER_BYTES, mp4_needs_seek, require_audio_format, sniff_audio_format
 from .file_metadata import get_file_info, format_file_size
-from .ffmpeg_availability import check_ffmpeg_availability
+from .ffmpeg_availability import (
+    FFmpegCapabilities,
+    check_ffmpeg_availability,
+    get_ffmpeg_version,
+    probe_ffmpeg_capabilities
+)
+from .hashing import hash_file
+from .media_probe import MediaInfo, MediaProbeCache, probe_audio_header, probe_media, get_media_probe_cache
+from .process_runner import run_process, run_process_lines
 
 __all__ = [
     "TrimlyError",
     "UnsupportedFormatError",
     "FFmpegNotFoundError",
+    "SchedulerFullError",
+    "JobCancelledError",
     "validate_audio_file",
+    "SNIFF_HEADER_BYTES",
+    "mp4_needs_seek",
+    "require_audio_format",
+    "sniff_audio_format",
     "get_file_info",
     "format_file_size",
-    "check_ffmpeg_availability"
+    "check_ffmpeg_availability",
+    "get_ffmpeg_version",
+    "probe_ffmpeg_capabilities",
+    "FFmpegCapabilities",
+    "hash_file",
+    "MediaInfo",
+    "MediaProbeCache",
+    "probe_audio_header",
+    "probe_media",
+    "get_media_probe_cache",
+    "run_process",
+    "run_process_lines"
 ]
\ No newline at end of file
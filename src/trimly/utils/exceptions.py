@@ -28,4 +28,24 @@ class UnsupportedFormatError(TrimlyError):
     with an extension or internal format that is not recognized or handled
     by the application's supported audio formats list.
     """
-    pass
\ No newline at end of file
+    pass
+
+class SchedulerFullError(TrimlyError):
+    """
+    Raised when a job is submitted while the scheduler's queue is full.
+
+    This is backpressure rather than a failure of the job itself; callers
+    should retry later or surface a "busy" message to the user.
+    """
+    pass
+
+
+class JobCancelledError(TrimlyError):
+    """
+    Raised when a running job is aborted through its cancel token.
+
+    This covers both explicit cancellation and a token whose deadline passed
+    before FFmpeg finished; the FFmpeg process has been killed by the time
+    the exception propagates.
+    """
+    pass
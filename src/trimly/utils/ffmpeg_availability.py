@@ -1,15 +1,134 @@
 import subprocess
+import threading
+from dataclasses import dataclass
+from typing import FrozenSet, List, Optional, Tuple
 
-from .exceptions import FFmpegNotFoundError
+from .exceptions import TrimlyError, FFmpegNotFoundError
 
 
-def check_ffmpeg_availability() -> bool:
+REQUIRED_FILTERS = ("silenceremove",)
+REQUIRED_ENCODERS = ("pcm_s16le",)
+
+
+@dataclass(frozen=True)
+class FFmpegCapabilities:
+    """
+    Snapshot of what the FFmpeg executable on PATH can do.
+
+    Attributes:
+        version: The version banner line, e.g. "ffmpeg version 6.1.1".
+        build_configuration: Flags FFmpeg was configured with (e.g. "--enable-libmp3lame").
+        filters: Names of all available filters.
+        encoders: Names of all available encoders.
+    """
+    version: str
+    build_configuration: Tuple[str, ...]
+    filters: FrozenSet[str]
+    encoders: FrozenSet[str]
+
+    @property
+    def has_silenceremove(self) -> bool:
+        return "silenceremove" in self.filters
+
+    @property
+    def has_silencedetect(self) -> bool:
+        return "silencedetect" in self.filters
+
+    def has_filter(self, name: str) -> bool:
+        return name in self.filters
+
+    def has_encoder(self, name: str) -> bool:
+        return name in self.encoders
+
+
+_capabilities: Optional[FFmpegCapabilities] = None
+_capabilities_lock = threading.Lock()
+
+
+def _run_ffmpeg_query(*args: str) -> str:
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", *args],
+            capture_output=True,
+            text=True,
+            timeout=10,                # Set a timeout to prevent hanging
+            check=True                 # Raise CalledProcessError if command returns non-zero exit code
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
+        raise FFmpegNotFoundError(
+            f"FFmpeg is not installed or not found in system PATH. Details: {e}"
+        ) from e
+    return result.stdout
+
+
+def _parse_filters(output: str) -> List[str]:
+    # Filter rows look like " TSC silenceremove      A->A       Remove silence."
+    names = []
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) >= 3 and "->" in parts[2]:
+            names.append(parts[1])
+    return names
+
+
+def _parse_encoders(output: str) -> List[str]:
+    # Encoder rows follow a " ------" separator and look like " A....D flac   FLAC (Free Lossless Audio Codec)"
+    names = []
+    in_table = False
+    for line in output.splitlines():
+        if line.strip().startswith("---"):
+            in_table = True
+            continue
+        parts = line.split()
+        if in_table and len(parts) >= 2:
+            names.append(parts[1])
+    return names
+
+
+def probe_ffmpeg_capabilities(refresh: bool = False) -> FFmpegCapabilities:
+    """
+    Probes the FFmpeg executable once per process and caches what it supports.
+
+    The version, build configuration, filter list and encoder list are queried
+    on the first call only; later calls return the cached snapshot without
+    spawning a process. Pass `refresh=True` after installing or upgrading
+    FFmpeg to probe again. Safe to call from multiple threads.
+
+    Args:
+        refresh (bool): Discard the cached snapshot and probe again.
+
+    Returns:
+        FFmpegCapabilities: The (possibly cached) capability snapshot.
+
+    Raises:
+        FFmpegNotFoundError: If the FFmpeg executable cannot be run.
+    """
+    global _capabilities
+    with _capabilities_lock:
+        if _capabilities is None or refresh:
+            version_output = _run_ffmpeg_query("-version")
+            lines = version_output.splitlines()
+            configuration = next((line for line in lines if line.startswith("configuration:")), "")
+
+            _capabilities = FFmpegCapabilities(
+                version=lines[0].strip() if lines else "unknown",
+                build_configuration=tuple(configuration.split()[1:]),
+                filters=frozenset(_parse_filters(_run_ffmpeg_query("-filters"))),
+                encoders=frozenset(_parse_encoders(_run_ffmpeg_query("-encoders"))),
+            )
+        return _capabilities
+
+
+def check_ffmpeg_availability(refresh: bool = False) -> bool:
     """
     Verifies the availability of the FFmpeg executable in the system's PATH.
 
-    This function attempts to run the `ffmpeg -version` command silently
-    to determine if FFmpeg is installed and accessible. It's a crucial
-    pre-check for any operation relying on FFmpeg.
+    The check is backed by `probe_ffmpeg_capabilities`, so FFmpeg is only
+    executed on the first call in a process (or when `refresh=True`). It also
+    verifies that the filters and encoders Trimly depends on are compiled in.
+
+    Args:
+        refresh (bool): Re-run the probe instead of using the cached result.
 
     Returns:
         bool: True if FFmpeg is successfully found and executable.
@@ -19,17 +138,30 @@ def check_ffmpeg_availability() -> bool:
                              the command fails, or the check times out,
                              indicating FFmpeg is either not installed
                              or not properly configured in the system's PATH.
+        TrimlyError: If FFmpeg was found but lacks a required filter or encoder.
     """
-    try:
-        subprocess.run(
-            ["ffmpeg", "-version"],
-            stdout=subprocess.DEVNULL, # Suppress standard output
-            stderr=subprocess.DEVNULL, # Suppress standard error
-            timeout=10,                # Set a timeout to prevent hanging
-            check=True                 # Raise CalledProcessError if command returns non-zero exit code
+    capabilities = probe_ffmpeg_capabilities(refresh=refresh)
+    missing = [name for name in REQUIRED_FILTERS if not capabilities.has_filter(name)]
+    missing += [name for name in REQUIRED_ENCODERS if not capabilities.has_encoder(name)]
+    if missing:
+        raise TrimlyError(
+            f"FFmpeg ({capabilities.version}) is missing required components: {', '.join(missing)}"
         )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-        raise FFmpegNotFoundError(
-            f"FFmpeg is not installed or not found in system PATH. Details: {e}"
-        ) from e
\ No newline at end of file
+    return True
+
+
+def get_ffmpeg_version() -> str:
+    """
+    Returns the version string reported by the FFmpeg executable.
+
+    The first line of `ffmpeg -version` (e.g. "ffmpeg version 6.1.1") is
+    taken from the cached capability probe, so it can be used cheaply as
+    part of cache keys.
+
+    Returns:
+        str: The FFmpeg version banner line.
+
+    Raises:
+        FFmpegNotFoundError: If FFmpeg cannot be executed.
+    """
+    return probe_ffmpeg_capabilities().version
@@ -1,7 +1,9 @@
 from pathlib import Path
 from typing import Union, Dict
 
+from .exceptions import FFmpegNotFoundError, TrimlyError
 from ..configs import get_config
+from .media_probe import get_media_probe_cache
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -21,15 +23,20 @@ def format_file_size(size_bytes: int) -> str:
     return f"{size_bytes:.1f} TB"
 
 
-def get_file_info(file_path: Union[str, Path]) -> Dict[str, Union[str, int, bool]]:
+def get_file_info(file_path: Union[str, Path], probe: bool = False) -> Dict[str, Union[str, int, bool]]:
     """
     Retrieve metadata and validation info about a given audio file.
 
     Args:
         file_path (Union[str, Path]): Path to the file.
+        probe (bool): Also read the audio headers (codec, duration, sample rate, channels, bitrate).
 
     Returns:
         Dict[str, Union[str, int, bool]]: Metadata including name, size, extension, and support status.
+        With `probe`, also `decodable` and, for decodable files, the probed fields.
+
+    Raises:
+        FFmpegNotFoundError: If `probe` is set and neither ffprobe nor ffmpeg is installed.
     """
     path = Path(file_path)
 
@@ -37,9 +44,10 @@ def get_file_info(file_path: Union[str, Path]) -> Dict[str, Union[str, int, bool
         return {"exists": False}
 
     stat = path.stat()
-    supported_formats = get_config().supported_audio_formats
+    config = get_config()
+    supported_formats = config.supported_audio_formats
 
-    return {
+    info = {
         "exists": True,
         "name": path.name,
         "size": stat.st_size,
@@ -47,3 +55,23 @@ def get_file_info(file_path: Union[str, Path]) -> Dict[str, Union[str, int, bool
         "extension": path.suffix,
         "is_supported": path.suffix.lower() in supported_formats,
     }
+
+    if probe:
+        try:
+            media = get_media_probe_cache(config.media_probe_cache_max_entries).probe(path)
+        except FFmpegNotFoundError:
+            # A missing FFmpeg says nothing about the file, so it must not read as "not decodable"
+            raise
+        except TrimlyError:
+            info["decodable"] = False
+        else:
+            info.update(
+                decodable=True,
+                format_name=media.format_name,
+                codec=media.codec,
+                duration=media.duration,
+                sample_rate=media.sample_rate,
+                channels=media.channels,
+                bit_rate=media.bit_rate
+            )
+    return info
@@ -1,22 +1,23 @@
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from .exceptions import TrimlyError, UnsupportedFormatError
 from ..configs import get_config
 
 
-def validate_audio_file(file_path: Union[str, Path]) -> Path:
+def validate_audio_file(file_path: Union[str, Path], max_size_mb: Optional[float] = None) -> Path:
     """
-    Validates that the given audio file exists, is a file, and has a supported format.
+    Validates that the given audio file exists, is a file, has a supported format and is within the size limit.
 
     Args:
         file_path (Union[str, Path]): Path to the audio file.
+        max_size_mb (Optional[float]): Size limit, 0 for none; defaults to the configured `max_input_file_size_mb`.
 
     Returns:
         Path: The validated Path object.
 
     Raises:
-        TrimlyError: If the file does not exist or is not a file.
+        TrimlyError: If the file does not exist, is not a file, or is too large.
         UnsupportedFormatError: If the file format is not supported.
     """
     path = Path(file_path)
@@ -27,10 +28,16 @@ def validate_audio_file(file_path: Union[str, Path]) -> Path:
     if not path.is_file():
         raise TrimlyError(f"Path is not a file: {path}")
 
-    supported_formats = get_config().supported_audio_formats
+    config = get_config()
+    supported_formats = config.supported_audio_formats
     if path.suffix.lower() not in supported_formats:
         raise UnsupportedFormatError(
             f"Unsupported file format: {path.suffix}. Supported formats: {', '.join(supported_formats)}"
         )
 
+    max_size_mb = config.max_input_file_size_mb if max_size_mb is None else max_size_mb
+    size_mb = path.stat().st_size / (1024 * 1024)
+    if max_size_mb and size_mb > max_size_mb:
+        raise TrimlyError(f"File is too large: {size_mb:.1f} MB (limit {max_size_mb:g} MB)")
+
     return path
@@ -0,0 +1,94 @@
+import struct
+from typing import Optional
+
+from .exceptions import UnsupportedFormatError
+
+# Bytes of header `sniff_audio_format` needs to recognise every supported container
+SNIFF_HEADER_BYTES = 12
+
+# ISO BMFF boxes that may precede `moov` without forcing FFmpeg to seek back over `mdat`
+_MP4_HEADER_BOXES = {b"ftyp", b"free", b"skip", b"wide", b"uuid", b"pdin"}
+
+
+def _is_mpeg_audio_frame(header: bytes) -> bool:
+    # 11-bit frame sync, a valid MPEG version and a non-reserved layer; ADTS AAC uses layer 0 and is excluded
+    return (
+        len(header) >= 2
+        and header[0] == 0xFF
+        and header[1] & 0xE0 == 0xE0
+        and header[1] & 0x18 != 0x08
+        and header[1] & 0x06 != 0
+    )
+
+
+def sniff_audio_format(header: bytes) -> Optional[str]:
+    """
+    Identify an audio container from its leading magic bytes.
+
+    Args:
+        header (bytes): At least the first `SNIFF_HEADER_BYTES` bytes of the data.
+
+    Returns:
+        Optional[str]: The matching extension (".wav", ".flac", ".ogg", ".m4a" or ".mp3"), or None if unrecognised.
+    """
+    header = bytes(header[:SNIFF_HEADER_BYTES])
+    if header[:4] in (b"RIFF", b"RF64") and header[8:12] == b"WAVE":
+        return ".wav"
+    if header[:4] == b"fLaC":
+        return ".flac"
+    if header[:4] == b"OggS":
+        return ".ogg"
+    if header[4:8] == b"ftyp":
+        return ".m4a"
+    if header[:3] == b"ID3" or _is_mpeg_audio_frame(header):
+        return ".mp3"
+    return None
+
+
+def require_audio_format(header: bytes, supported_formats) -> str:
+    """
+    Sniff `header` like `sniff_audio_format` and check the result against the supported input formats.
+
+    Raises:
+        UnsupportedFormatError: If the container is unrecognised or not supported.
+    """
+    suffix = sniff_audio_format(header)
+    if suffix is None:
+        raise UnsupportedFormatError(
+            f"Unrecognised audio data. Supported formats: {', '.join(sorted(supported_formats))}"
+        )
+    if suffix not in supported_formats:
+        raise UnsupportedFormatError(
+            f"Unsupported audio format: {suffix}. Supported formats: {', '.join(sorted(supported_formats))}"
+        )
+    return suffix
+
+
+def mp4_needs_seek(data: bytes) -> bool:
+    """
+    Report whether an MP4/M4A file stores its `moov` index after the media data.
+
+    Such files cannot be demuxed from a pipe: FFmpeg has to read the index
+    first, which means seeking back over `mdat` once it has been consumed.
+    Files written with `-movflags +faststart` keep `moov` up front.
+
+    Args:
+        data (bytes): The complete file.
+
+    Returns:
+        bool: True if `mdat` (or an unknown box) comes before `moov`.
+    """
+    view = memoryview(data)
+    offset = 0
+    while offset + 8 <= len(view):
+        size, box = struct.unpack(">I4s", view[offset:offset + 8])
+        if box == b"moov":
+            return False
+        if box not in _MP4_HEADER_BOXES:
+            return True
+        if size == 1 and offset + 16 <= len(view):
+            size = struct.unpack(">Q", view[offset + 8:offset + 16])[0]
+        if size < 8:
+            return True
+        offset += size
+    return True
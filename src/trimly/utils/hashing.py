@@ -0,0 +1,25 @@
+import hashlib
+from pathlib import Path
+from typing import Union
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(file_path: Union[str, Path]) -> str:
+    """
+    Compute the SHA-256 digest of a file's contents.
+
+    The file is read in fixed-size chunks so arbitrarily large inputs can be
+    hashed with constant memory.
+
+    Args:
+        file_path (Union[str, Path]): Path to the file to hash.
+
+    Returns:
+        str: Hex-encoded SHA-256 digest of the file's bytes.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,238 @@
+import json
+import re
+import subprocess
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from .exceptions import FFmpegNotFoundError, TrimlyError
+from ..analysis.silencedetect import parse_audio_stream, parse_duration
+
+_INPUT_FORMAT = re.compile(r"Input #0, ([^,]+(?:,[^,\s]+)*), from")
+_BITRATE = re.compile(r"Duration:.*?bitrate:\s*(\d+) kb/s")
+
+
+@dataclass(frozen=True)
+class MediaInfo:
+    """
+    Header-level description of an audio file.
+
+    Attributes:
+        path (Path): The probed file.
+        size (int): File size in bytes.
+        format_name (Optional[str]): Demuxer name(s) reported by FFmpeg, e.g. "mp3" or "mov,mp4,m4a,3gp,3g2,mj2".
+        codec (Optional[str]): Codec of the first audio stream.
+        duration (Optional[float]): Duration in seconds, when the container declares it.
+        sample_rate (Optional[int]): Sample rate of the first audio stream.
+        channels (Optional[int]): Channel count of the first audio stream.
+        bit_rate (Optional[int]): Overall bitrate in bits per second.
+    """
+    path: Path
+    size: int
+    format_name: Optional[str]
+    codec: Optional[str]
+    duration: Optional[float]
+    sample_rate: Optional[int]
+    channels: Optional[int]
+    bit_rate: Optional[int]
+
+
+def _optional(value, cast):
+    try:
+        return cast(value) if value not in (None, "", "N/A") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _probe_with_ffprobe(path: Path, size: int, timeout: float) -> MediaInfo:
+    result = subprocess.run(
+        [
+            "ffprobe", "-v", "error",
+            "-show_entries", "format=format_name,duration,bit_rate:stream=codec_type,codec_name,sample_rate,channels",
+            "-of", "json",
+            str(path)
+        ],
+        capture_output=True,
+        text=True,
+        timeout=timeout
+    )
+    if result.returncode != 0:
+        raise TrimlyError(f"Unreadable audio file {path.name}: {result.stderr.strip() or 'ffprobe failed'}")
+
+    data = json.loads(result.stdout or "{}")
+    audio = next((s for s in data.get("streams", []) if s.get("codec_type") == "audio"), None)
+    if audio is None:
+        raise TrimlyError(f"Unreadable audio file {path.name}: no audio stream found")
+    container = data.get("format", {})
+    return MediaInfo(
+        path=path,
+        size=size,
+        format_name=container.get("format_name"),
+        codec=audio.get("codec_name"),
+        duration=_optional(container.get("duration"), float),
+        sample_rate=_optional(audio.get("sample_rate"), int),
+        channels=_optional(audio.get("channels"), int),
+        bit_rate=_optional(container.get("bit_rate"), int)
+    )
+
+
+def _probe_with_ffmpeg(path: Path, size: int, timeout: float) -> MediaInfo:
+    # Without an output FFmpeg prints the input header and exits, so nothing is decoded
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-i", str(path)],
+        capture_output=True,
+        text=True,
+        timeout=timeout
+    )
+    codec, sample_rate, channels = parse_audio_stream(result.stderr)
+    if codec is None:
+        error = result.stderr.strip().splitlines()
+        raise TrimlyError(f"Unreadable audio file {path.name}: {error[-1] if error else 'no audio stream found'}")
+
+    format_match = _INPUT_FORMAT.search(result.stderr)
+    bitrate_match = _BITRATE.search(result.stderr)
+    return MediaInfo(
+        path=path,
+        size=size,
+        format_name=format_match.group(1) if format_match else None,
+        codec=codec,
+        duration=parse_duration(result.stderr),
+        sample_rate=sample_rate,
+        channels=channels,
+        bit_rate=int(bitrate_match.group(1)) * 1000 if bitrate_match else None
+    )
+
+
+def probe_media(file_path: Union[str, Path], timeout: float = 10.0) -> MediaInfo:
+    """
+    Read an audio file's container and stream headers without decoding it.
+
+    Uses `ffprobe` and falls back to parsing `ffmpeg -i` output on systems
+    where only the ffmpeg binary is installed.
+
+    Args:
+        file_path (Union[str, Path]): Path to the audio file.
+        timeout (float): Seconds to wait for the probe.
+
+    Returns:
+        MediaInfo: The probed metadata.
+
+    Raises:
+        FFmpegNotFoundError: If neither ffprobe nor ffmpeg is installed.
+        TrimlyError: If the file has no decodable audio stream or the probe times out.
+    """
+    path = Path(file_path)
+    size = path.stat().st_size
+    try:
+        try:
+            return _probe_with_ffprobe(path, size, timeout)
+        except FileNotFoundError:
+            return _probe_with_ffmpeg(path, size, timeout)
+    except FileNotFoundError as e:
+        raise FFmpegNotFoundError(f"FFmpeg is not installed or not found in system PATH. Details: {e}") from e
+    except subprocess.TimeoutExpired:
+        raise TrimlyError(f"Timed out reading the header of {path.name}")
+
+
+def probe_audio_header(data: bytes, timeout: float = 10.0) -> Tuple[Optional[str], Optional[int], Optional[int]]:
+    """
+    Read the first audio stream's codec, sample rate and channel count from the start of an in-memory recording.
+
+    Args:
+        data (bytes): Leading bytes of the recording, enough to hold its headers.
+        timeout (float): Seconds to wait for the probe.
+
+    Returns:
+        Tuple[Optional[str], Optional[int], Optional[int]]: Codec, sample rate and
+        channel count; None where the headers do not say.
+
+    Raises:
+        FFmpegNotFoundError: If ffmpeg is not installed.
+    """
+    try:
+        result = subprocess.run(["ffmpeg", "-hide_banner", "-i", "pipe:0"], input=data, capture_output=True, timeout=timeout)
+    except FileNotFoundError as e:
+        raise FFmpegNotFoundError(f"FFmpeg is not installed or not found in system PATH. Details: {e}") from e
+    return parse_audio_stream(result.stderr.decode(errors="replace"))
+
+
+class MediaProbeCache:
+    """
+    Bounded LRU cache of MediaInfo keyed by (path, size, mtime).
+
+    A file that is replaced or modified in place gets a new key, so stale
+    metadata is never returned; old keys simply age out. Thread-safe.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, int, int], MediaInfo]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def probe(self, file_path: Union[str, Path], timeout: float = 10.0) -> MediaInfo:
+        """
+        Return cached metadata for `file_path`, probing it on a miss.
+
+        Raises:
+            TrimlyError: As for `probe_media`. Failures are not cached.
+        """
+        path = Path(file_path)
+        stat = path.stat()
+        key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            info = self._entries.get(key)
+            if info is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return info
+            self.misses += 1
+
+        info = probe_media(path, timeout=timeout)
+        with self._lock:
+            self._entries[key] = info
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return info
+
+    def resize(self, max_entries: int) -> None:
+        """
+        Change the entry limit, dropping the least recently used entries beyond it.
+        """
+        with self._lock:
+            self.max_entries = max_entries
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "max_entries": self.max_entries, "hits": self.hits, "misses": self.misses}
+
+
+_probe_cache: Optional[MediaProbeCache] = None
+_probe_cache_lock = threading.Lock()
+
+
+def get_media_probe_cache(max_entries: int) -> MediaProbeCache:
+    """
+    Return the process-wide MediaProbeCache, creating it on first use.
+
+    A call with a different `max_entries` resizes the shared cache, so the
+    most recently configured limit applies.
+    """
+    global _probe_cache
+    with _probe_cache_lock:
+        if _probe_cache is None:
+            _probe_cache = MediaProbeCache(max_entries)
+        elif _probe_cache.max_entries != max_entries:
+            _probe_cache.resize(max_entries)
+        return _probe_cache
@@ -0,0 +1,52 @@
+from typing import List, Optional
+
+from .exceptions import UnsupportedFormatError
+from ..constants import OUTPUT_AUDIO_ENCODERS, LOSSLESS_OUTPUT_FORMATS
+
+
+def normalize_output_format(output_format: str) -> str:
+    """
+    Normalize an output format to a lowercase extension with a leading dot (e.g. "FLAC" -> ".flac").
+    """
+    output_format = output_format.strip().lower()
+    return output_format if output_format.startswith(".") else f".{output_format}"
+
+
+def build_output_args(
+    output_format: str,
+    sample_rate: Optional[int] = None,
+    channels: Optional[int] = None,
+    bitrate: Optional[str] = None
+) -> List[str]:
+    """
+    Build the FFmpeg encoder arguments for an output format.
+
+    Args:
+        output_format (str): Output extension, e.g. ".wav", ".flac", ".opus", ".mp3", ".m4a".
+        sample_rate (Optional[int]): Resample the output to this rate.
+        channels (Optional[int]): Down/up-mix the output to this channel count.
+        bitrate (Optional[str]): Target bitrate for lossy formats (e.g. "96k"); ignored for lossless ones.
+
+    Returns:
+        List[str]: Arguments to place before the output path.
+
+    Raises:
+        UnsupportedFormatError: If the output format has no configured encoder.
+    """
+    output_format = normalize_output_format(output_format)
+    encoder = OUTPUT_AUDIO_ENCODERS.get(output_format)
+    if encoder is None:
+        raise UnsupportedFormatError(
+            f"Unsupported output format: {output_format}. Supported formats: {', '.join(OUTPUT_AUDIO_ENCODERS)}"
+        )
+
+    args = ["-c:a", encoder]
+    if sample_rate:
+        args += ["-ar", str(sample_rate)]
+    if channels:
+        args += ["-ac", str(channels)]
+    if bitrate and output_format not in LOSSLESS_OUTPUT_FORMATS:
+        args += ["-b:a", str(bitrate)]
+    if output_format == ".m4a":
+        args += ["-movflags", "+faststart"]
+    return args
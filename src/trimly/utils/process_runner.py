@@ -0,0 +1,102 @@
+import subprocess
+import threading
+from collections import deque
+from typing import Callable, List, Optional, Tuple
+
+
+def run_process(
+    cmd: List[str],
+    timeout: Optional[float] = None,
+    on_spawn: Optional[Callable[[int], None]] = None,
+    text: bool = True
+) -> subprocess.CompletedProcess:
+    """
+    Run a command to completion and capture its output, like `subprocess.run(cmd, capture_output=True)`.
+
+    Unlike `subprocess.run`, the child's PID is handed to `on_spawn` as soon as
+    it starts, so resource limits (affinity, niceness, memory) can be applied
+    to every FFmpeg process, not only the ones that report progress.
+
+    Args:
+        cmd (List[str]): The command to run.
+        timeout (Optional[float]): Seconds before the process is killed.
+        on_spawn (Optional[Callable[[int], None]]): Called with the PID once the
+            process has started; if it raises, the process is killed.
+        text (bool): Decode stdout and stderr as text.
+
+    Returns:
+        subprocess.CompletedProcess: Return code and captured output.
+
+    Raises:
+        subprocess.TimeoutExpired: If the process runs longer than `timeout`.
+    """
+    if on_spawn is None:
+        return subprocess.run(cmd, capture_output=True, text=text, timeout=timeout)
+
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=text) as process:
+        try:
+            on_spawn(process.pid)
+            stdout, stderr = process.communicate(timeout=timeout)
+        except BaseException:
+            process.kill()
+            raise
+    return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
+
+def run_process_lines(
+    cmd: List[str],
+    on_line: Callable[[str], None],
+    timeout: Optional[float] = None,
+    on_spawn: Optional[Callable[[int], None]] = None,
+    tail_lines: int = 20
+) -> Tuple[int, str]:
+    """
+    Run a command and hand each line of its stderr to `on_line` as it is written.
+
+    For commands that log a line per analysis window, this keeps memory flat
+    however long the input is, where `run_process` would hold the whole log.
+
+    Args:
+        cmd (List[str]): The command to run; its stdout is discarded.
+        on_line (Callable[[str], None]): Called with every stderr line, newline included.
+        timeout (Optional[float]): Seconds before the process is killed.
+        on_spawn (Optional[Callable[[int], None]]): Called with the PID once the
+            process has started; if it raises, the process is killed.
+        tail_lines (int): Number of trailing stderr lines kept for error reporting.
+
+    Returns:
+        Tuple[int, str]: Return code and the last `tail_lines` lines of stderr.
+
+    Raises:
+        subprocess.TimeoutExpired: If the process runs longer than `timeout`.
+    """
+    tail = deque(maxlen=tail_lines)
+    timed_out = threading.Event()
+    with subprocess.Popen(
+        cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, errors="replace"
+    ) as process:
+        def expire() -> None:
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(timeout, expire) if timeout else None
+        try:
+            if timer is not None:
+                timer.daemon = True
+                timer.start()
+            if on_spawn is not None:
+                on_spawn(process.pid)
+            for line in process.stderr:
+                on_line(line)
+                tail.append(line)
+            returncode = process.wait()
+        except BaseException:
+            process.kill()
+            raise
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return returncode, "".join(tail)
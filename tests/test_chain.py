@@ -0,0 +1,70 @@
+import pytest
+
+from trimly.processing import ProcessingChain
+from trimly.processing.chain import ChannelMix, FadeOut, Highpass, Loudnorm, Resample, SilenceRemoval
+
+
+def test_parse_accepts_positional_named_and_aliased_options():
+    chain = ProcessingChain.parse("highpass:100:1,silence:threshold=-45,loudnorm:I=-14:TP=-2,resample:48000,mix:1")
+
+    assert chain.stages == (
+        Highpass(100, 1),
+        SilenceRemoval(threshold=-45),
+        Loudnorm(integrated=-14, true_peak=-2),
+        Resample(48000),
+        ChannelMix(1)
+    )
+
+
+def test_spec_round_trips():
+    chain = ProcessingChain.parse("highpass:80,silence,loudnorm:I=-16,fade_out:0.1:qsin")
+
+    assert ProcessingChain.parse(chain.spec) == chain
+
+
+@pytest.mark.parametrize("spec, problem", [
+    ("", "at least one stage"),
+    ("silence,silence", "may only appear once"),
+    ("loudnorm:I=0", "integrated loudness"),
+    ("highpass:80:3", "poles"),
+    ("resample:4000", "Resample rate"),
+    ("mix:9", "Channel mix"),
+    ("fade_out:0.1:bogus", "curve")
+])
+def test_invalid_chains_are_rejected(spec, problem):
+    with pytest.raises(ValueError, match=problem):
+        ProcessingChain.parse(spec)
+
+
+@pytest.mark.parametrize("spec", ["reverb", "highpass:frequency=80:slope=2", "mix:1:2"])
+def test_unknown_stages_and_options_are_rejected(spec):
+    with pytest.raises(ValueError):
+        ProcessingChain.parse(spec)
+
+
+def test_validate_collects_every_problem():
+    chain = ProcessingChain.parse("highpass")
+    object.__setattr__(chain, "stages", (Highpass(0, 3), "not a stage"))
+
+    assert len(chain.validate()) == 3
+
+
+def test_render_places_the_silence_filter_and_tracks_the_sample_rate():
+    chain = ProcessingChain.parse("highpass:80,silence,resample:16000,fade_out:0.5")
+
+    assert chain.render("silenceremove=x", 44100) == (
+        "highpass=f=80:p=2,silenceremove=x,aresample=16000,areverse,afade=t=in:d=0.5:curve=tri,areverse"
+    )
+    assert chain.output_sample_rate(44100) == 16000
+
+
+def test_loudnorm_restores_the_input_rate_unless_resampled_later():
+    assert ProcessingChain.parse("loudnorm").render(None, 44100).endswith(",aresample=44100")
+    assert ProcessingChain.parse("loudnorm,resample:22050").render(None, 44100) == (
+        "loudnorm=I=-16:TP=-1.5:LRA=11,aresample=22050"
+    )
+
+
+def test_fade_out_at_a_known_length_uses_sample_offsets():
+    assert FadeOut(0.5).render_at(44100, 44100) == "afade=t=out:ss=22050:ns=22050:curve=tri"
+    assert FadeOut(2.0).render_at(100, 44100) == "afade=t=out:ss=0:ns=100:curve=tri"
@@ -0,0 +1,31 @@
+from trimly.cli import plan_outputs
+
+
+def test_outputs_replace_the_extension():
+    assert plan_outputs(["a.mp3", "dir/b.m4a"], ".wav") == {"a.mp3": "a.wav", "dir/b.m4a": "dir/b.wav"}
+
+
+def test_colliding_outputs_keep_their_source_extension():
+    outputs = plan_outputs(["a.mp3", "a.flac", "b.mp3"], ".wav")
+
+    assert outputs == {"a.mp3": "a.mp3.wav", "a.flac": "a.flac.wav", "b.mp3": "b.wav"}
+
+
+def test_collisions_are_case_insensitive():
+    outputs = plan_outputs(["Take.mp3", "take.ogg"], ".wav")
+
+    assert outputs == {"Take.mp3": "Take.mp3.wav", "take.ogg": "take.ogg.wav"}
+
+
+def test_an_input_with_the_output_extension_collides_with_its_sibling():
+    outputs = plan_outputs(["a.mp3", "a.wav"], ".wav")
+
+    assert outputs == {"a.mp3": "a.mp3.wav", "a.wav": "a.wav.wav"}
+
+
+def test_outputs_that_still_collide_are_skipped():
+    outputs = plan_outputs(["a.mp3", "a.mp3.mp3", "a.ogg"], ".mp3")
+
+    assert outputs["a.ogg"] == "a.ogg.mp3"
+    assert outputs["a.mp3"] is None
+    assert outputs["a.mp3.mp3"] is None
@@ -0,0 +1,47 @@
+import pytest
+
+from trimly.analysis import derive_threshold
+from trimly.utils.exceptions import TrimlyError
+
+
+def _derive(levels, percentile=10.0, margin_db=6.0, min_dynamic_range_db=10.0):
+    return derive_threshold(levels, percentile, margin_db, min_dynamic_range_db, min_threshold=-100.0, max_threshold=0.0)
+
+
+def test_threshold_sits_margin_above_the_noise_floor():
+    estimate = _derive([-60.0] * 50 + [-20.0] * 50)
+
+    assert estimate.noise_floor_db == -60.0
+    assert estimate.speech_level_db == -20.0
+    assert estimate.threshold_db == -54.0
+    assert estimate.windows == 100
+
+
+def test_threshold_never_passes_the_midpoint_between_floor_and_speech():
+    estimate = _derive([-40.0] * 50 + [-28.0] * 50, margin_db=10.0)
+
+    assert estimate.threshold_db == -34.0
+
+
+def test_without_dynamic_range_the_threshold_drops_below_the_floor():
+    estimate = _derive([-30.0] * 100)
+
+    assert estimate.threshold_db == -36.0
+
+
+def test_digital_silence_is_clamped_to_the_minimum_threshold():
+    estimate = _derive([float("-inf")] * 50 + [-20.0] * 50)
+
+    assert estimate.noise_floor_db == -100.0
+    assert estimate.threshold_db == -94.0
+
+
+def test_threshold_is_clamped_to_the_configured_range():
+    estimate = derive_threshold([-10.0] * 50 + [5.0] * 50, 10.0, 6.0, 10.0, min_threshold=-100.0, max_threshold=-12.0)
+
+    assert estimate.threshold_db == -12.0
+
+
+def test_no_levels_is_an_error():
+    with pytest.raises(TrimlyError):
+        _derive([])
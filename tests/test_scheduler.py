@@ -0,0 +1,78 @@
+import threading
+
+import pytest
+
+from trimly.scheduling import JobScheduler
+from trimly.utils.exceptions import SchedulerFullError, TrimlyError
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = JobScheduler(max_workers=1, max_queue=1)
+    yield scheduler
+    scheduler.shutdown(wait=True, cancel_pending=True)
+
+
+def _occupy(scheduler):
+    # Holds the only worker until the returned event is set
+    started, release = threading.Event(), threading.Event()
+    future = scheduler.submit(lambda: (started.set(), release.wait(5)))
+    assert started.wait(5)
+    return future, release
+
+
+def test_queued_jobs_run_by_priority_then_fifo(scheduler):
+    _, release = _occupy(scheduler)
+    order = []
+    futures = [
+        scheduler.submit(order.append, "batch", priority="batch"),
+        scheduler.submit(order.append, "normal", priority="normal"),
+        scheduler.submit(order.append, "interactive", priority="interactive")
+    ]
+    release.set()
+    for future in futures:
+        future.result(timeout=5)
+
+    assert order == ["interactive", "normal", "batch"]
+
+
+def test_a_full_class_rejects_without_blocking_other_classes(scheduler):
+    _, release = _occupy(scheduler)
+    scheduler.submit(lambda: None, priority="batch")
+
+    with pytest.raises(SchedulerFullError):
+        scheduler.submit(lambda: None, priority="batch")
+    interactive = scheduler.submit(lambda: "ran", priority="interactive")
+
+    assert scheduler.stats()["rejected"] == 1
+    release.set()
+    assert interactive.result(timeout=5) == "ran"
+
+
+def test_blocking_submit_waits_for_queue_space(scheduler):
+    _, release = _occupy(scheduler)
+    scheduler.submit(lambda: None, priority="batch")
+
+    with pytest.raises(SchedulerFullError):
+        scheduler.submit(lambda: None, priority="batch", block=True, timeout=0.05)
+    threading.Timer(0.05, release.set).start()
+    future = scheduler.submit(lambda: "ran", priority="batch", block=True, timeout=5)
+
+    assert future.result(timeout=5) == "ran"
+
+
+def test_cancelled_jobs_free_their_queue_slot(scheduler):
+    _, release = _occupy(scheduler)
+    queued = scheduler.submit(lambda: None, priority="batch")
+
+    assert scheduler.cancel(queued)
+    replacement = scheduler.submit(lambda: "ran", priority="batch")
+    release.set()
+
+    assert replacement.result(timeout=5) == "ran"
+    assert queued.cancelled()
+
+
+def test_unknown_priority_is_rejected(scheduler):
+    with pytest.raises(TrimlyError):
+        scheduler.submit(lambda: None, priority="urgent")
@@ -0,0 +1,50 @@
+import pytest
+
+from trimly.analysis import SegmentMap
+from trimly.analysis.segments import build_segment_map, removed_intervals
+
+
+def test_leading_silence_is_shortened_to_start_silence():
+    assert removed_intervals([(0.0, 2.0)], min_silence=0.5, start_silence=0.2) == [(0.2, 2.0)]
+
+
+def test_inner_and_trailing_silence_are_shortened_to_min_silence():
+    silences = [(3.0, 5.0), (9.0, 10.0)]
+    assert removed_intervals(silences, min_silence=0.5, start_silence=0.2) == [(3.5, 5.0), (9.5, 10.0)]
+
+
+def test_runs_no_longer_than_the_kept_silence_are_left_alone():
+    silences = [(0.0, 0.1), (4.0, 4.5), (6.0, 6.4)]
+    assert removed_intervals(silences, min_silence=0.5, start_silence=0.2) == []
+
+
+def test_segment_map_kept_and_removed_cover_the_input():
+    segments = build_segment_map("in.wav", 10.0, [(0.0, 1.0), (4.0, 6.0), (9.0, 10.0)], 0.5, 0.2)
+
+    assert segments.removed == [(0.2, 1.0), (4.5, 6.0), (9.5, 10.0)]
+    assert segments.kept == [(0.0, 0.2), (1.0, 4.5), (6.0, 9.5)]
+    assert segments.output_duration + segments.removed_duration == pytest.approx(segments.duration)
+    assert segments.cut_count == 3
+    assert segments.removed_fraction == pytest.approx(0.28)
+
+
+def test_segment_map_without_silence_keeps_everything():
+    segments = build_segment_map("in.wav", 4.0, [], 0.5, 0.2)
+
+    assert segments.kept == [(0.0, 4.0)]
+    assert segments.removed == []
+    assert segments.removed_fraction == 0.0
+
+
+def test_segment_map_round_trips_through_json():
+    segments = build_segment_map("in.wav", 10.0, [(4.0, 6.0)], 0.5, 0.2, sample_rate=44100, channels=1, codec="mp3")
+
+    assert SegmentMap.from_json(segments.to_json()) == segments
+
+
+def test_edl_lays_kept_regions_end_to_end():
+    segments = build_segment_map("in.wav", 10.0, [(4.0, 6.0)], 0.4, 0.2)
+    events = segments.to_edl(frame_rate=25).splitlines()[3:]
+
+    assert events[0].split()[-4:] == ["00:00:00:00", "00:00:04:10", "00:00:00:00", "00:00:04:10"]
+    assert events[1].split()[-4:] == ["00:00:06:00", "00:00:10:00", "00:00:04:10", "00:00:08:10"]